@@ -15,7 +15,9 @@ import warnings
 from collections.abc import Callable
 from contextlib import suppress
 from functools import cache
+from importlib import import_module
 from queue import Queue
+from time import monotonic
 from time import sleep as time_sleep
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
@@ -32,7 +34,6 @@ from pywikibot._wbtypes import (
     WbTime,
     WbUnknown,
 )
-from pywikibot.backports import RLock
 from pywikibot.bot import (
     Bot,
     CurrentPageBot,
@@ -45,7 +46,6 @@ from pywikibot.bot import (
     show_help,
     ui,
 )
-from pywikibot.diff import PatchManager
 from pywikibot.family import AutoFamily, Family
 from pywikibot.i18n import translate
 from pywikibot.logging import (
@@ -81,15 +81,16 @@ else:
 
 __all__ = (
     '__copyright__', '__url__', '__version__',
-    'async_manager', 'async_request', 'Bot', 'calledModuleName', 'Category',
-    'Claim', 'Coordinate', 'critical', 'CurrentPageBot', 'debug', 'error',
-    'exception', 'FilePage', 'handle_args', 'html2unicode', 'info', 'input',
-    'input_choice', 'input_yn', 'ItemPage', 'LexemeForm', 'LexemePage',
-    'LexemeSense', 'Link', 'log', 'MediaInfo', 'output', 'Page',
-    'page_put_queue', 'PropertyPage', 'showDiff', 'show_help', 'Site',
-    'SiteLink', 'sleep', 'stdout', 'stopme', 'Timestamp', 'translate', 'ui',
-    'User', 'warning', 'WbGeoShape', 'WbMonolingualText', 'WbQuantity',
-    'WbTabularData', 'WbTime', 'WbUnknown', 'WikidataBot',
+    'async_manager', 'async_request', 'async_stats', 'Bot',
+    'calledModuleName', 'Category', 'Claim', 'Coordinate', 'critical',
+    'CurrentPageBot', 'debug', 'error', 'exception', 'FilePage',
+    'handle_args', 'html2unicode', 'info', 'input', 'input_choice',
+    'input_yn', 'ItemPage', 'LexemeForm', 'LexemePage', 'LexemeSense', 'Link',
+    'log', 'MediaInfo', 'output', 'Page', 'page_put_queue', 'PropertyPage',
+    'showDiff', 'show_help', 'Site', 'SiteLink', 'sleep', 'stdout', 'stopme',
+    'Timestamp', 'translate', 'ui', 'User', 'warning', 'WbGeoShape',
+    'WbMonolingualText', 'WbQuantity', 'WbTabularData', 'WbTime', 'WbUnknown',
+    'WikidataBot',
 )
 
 # argvu is set by pywikibot.bot when it's imported
@@ -283,6 +284,7 @@ def Site(code: str | None = None,  # noqa: N802
 
 # These imports depend on Wb* classes above.
 from pywikibot.page import (  # noqa: E402
+    BasePage as _BasePage,
     Category,
     Claim,
     FilePage,
@@ -307,10 +309,52 @@ def showDiff(oldtext: str,  # noqa: N802
 
     The differences are highlighted (only on compatible systems) to show
     which changes were made.
+
+    .. version-changed:: 11.8
+       :mod:`diff` module is imported when the function is called.
     """
+    from pywikibot.diff import PatchManager
     PatchManager(oldtext, newtext, context=context).print_hunks()
 
 
+#: Submodules which are imported when they are accessed first
+_lazy_modules = frozenset({
+    'date',
+    'diff',
+    'editor',
+    'logentries',
+    'pagegenerators',
+    'proofreadpage',
+    'site_detect',
+    'specialbots',
+    'titletranslate',
+    'xmlreader',
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and ``PatchManager`` when they are used first.
+
+    Submodules which are not needed by ``import pywikibot`` are not
+    imported; they are available as attribute without an explicit
+    import:
+
+    >>> import pywikibot
+    >>> pywikibot.pagegenerators.__name__
+    'pywikibot.pagegenerators'
+
+    .. version-added:: 11.8
+    """
+    if name == 'PatchManager':
+        from pywikibot.diff import PatchManager
+        return PatchManager
+
+    if name in _lazy_modules:
+        return import_module(f'{__name__}.{name}')
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 # Throttle and thread handling
 
 
@@ -347,6 +391,10 @@ def _flush(stop: bool = True) -> None:
     Wait for the page-putter to flush its queue. Also drop this process
     from the throttle log. Called automatically at Python exit.
 
+    .. version-changed:: 11.8
+       wait for all put workers; the remaining time is estimated for
+       the longest site queue.
+
     :param stop: Also clear :func:`async_manager`s put queue. This is
         only done at exit time.
     """
@@ -354,13 +402,19 @@ def _flush(stop: bool = True) -> None:
 
     def remaining() -> tuple[int, datetime.timedelta]:
         """Calculate remaining pages and seconds."""
-        remaining_pages = page_put_queue.qsize()
+        remaining_pages = page_put_queue.unfinished_tasks
         if stop and PYTHON_VERSION < (3, 13):
             # -1 because we added a None element to stop the queue
-            remaining_pages -= 1
+            remaining_pages = max(remaining_pages - 1, 0)
 
+        # sites are handled in parallel; wait for the longest queue
+        with _put_lock:
+            longest = max((stats[0] for stats in _put_stats.values()),
+                          default=0)
+        longest += page_put_queue.qsize()
         remaining_seconds = datetime.timedelta(
-            seconds=round(remaining_pages * max(_config.put_throttle, 1)))
+            seconds=round(min(longest, remaining_pages)
+                          * max(_config.put_throttle, 1)))
         return (remaining_pages, remaining_seconds)
 
     if stop:
@@ -376,11 +430,13 @@ def _flush(stop: bool = True) -> None:
                f'Estimated time remaining: {sec}')
 
     exit_queue = None
-    if _putthread is not threading.current_thread():
-        while _putthread.is_alive() and (not page_put_queue.empty()
-                                         or _page_put_queue_busy.locked()):
+    threads = [_putthread] + [worker.thread for worker in _put_workers]
+    if threading.current_thread() not in threads:
+        while page_put_queue.unfinished_tasks and any(
+                thread.is_alive() for thread in threads):
             try:
-                _putthread.join(1)
+                with page_put_queue.all_tasks_done:
+                    page_put_queue.all_tasks_done.wait(1)
             except KeyboardInterrupt:
                 exit_queue = input_yn(
                     'There are {} pages remaining in the queue. Estimated '
@@ -394,11 +450,19 @@ def _flush(stop: bool = True) -> None:
             async_manager(block=False)
 
     if not stop:
-        # delete the put queue
-        with page_put_queue.mutex:
-            page_put_queue.all_tasks_done.notify_all()
-            page_put_queue.queue.clear()
-            page_put_queue.not_full.notify_all()
+        # delete the put queues
+        for queue in (page_put_queue,
+                      *(worker.queue for worker in _put_workers)):
+            with queue.mutex:
+                queue.all_tasks_done.notify_all()
+                queue.queue.clear()
+                queue.not_full.notify_all()
+
+    with _put_lock:
+        for site, (pending, done, latency) in _put_stats.items():
+            if done:
+                log(f'Put queue {site or "other"}: {done} requests, '
+                    f'{latency / done:.1f} s average latency')
 
     # only need one drop() call because all throttles use the same global pid
     with suppress(KeyError):
@@ -406,17 +470,87 @@ def _flush(stop: bool = True) -> None:
         log('Dropped throttle(s).')
 
 
+class _PutWorker:
+
+    """Thread handling asynchronous requests of some sites in order."""
+
+    def __init__(self, num: int) -> None:
+        """Initializer."""
+        self.queue: Queue = Queue()
+        self.thread = threading.Thread(target=self.run,
+                                       name=f'Put-Thread-{num}',
+                                       daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        """Execute requests until a None request is received."""
+        while True:
+            key, request, args, kwargs, queued = self.queue.get()
+            if request is None:
+                break
+
+            try:
+                request(*args, **kwargs)
+            except Exception:
+                exception()
+            finally:
+                with _put_done:
+                    stats = _put_stats[key]
+                    stats[0] -= 1
+                    stats[1] += 1
+                    stats[2] += monotonic() - queued
+                    page_put_queue.task_done()
+                    _put_done.notify_all()
+
+
+def _request_site(request: Callable, args, kwargs) -> _BaseSite | None:
+    """Return the site of an asynchronous request if any."""
+    for obj in (getattr(request, '__self__', None), *args, *kwargs.values()):
+        if isinstance(obj, _BaseSite):
+            return obj
+        if isinstance(obj, _BasePage):
+            return obj.site
+    return None
+
+
+def _dispatch(request: Callable, args, kwargs) -> None:
+    """Pass a request to the put worker of its site."""
+    site = _request_site(request, args, kwargs)
+    key = site and site.sitename
+    worker = _put_sites.get(key)
+    if worker is None:
+        if len(_put_workers) < max(_config.max_put_workers, 1):
+            worker = _PutWorker(len(_put_workers) + 1)
+            _put_workers.append(worker)
+        else:
+            worker = min(_put_workers, key=lambda w: w.queue.qsize())
+        _put_sites[key] = worker
+
+    with _put_lock:
+        _put_stats.setdefault(key, [0, 0, 0.0])[0] += 1
+    worker.queue.put((key, request, args, kwargs, monotonic()))
+
+
 # Create a separate thread for asynchronous page saves (and other requests)
 @deprecated_signature(since='11.0.0')
 def async_manager(*, block=True) -> None:
     """Daemon to take requests from the queue and execute them in background.
 
+    Requests are passed to a worker thread per site which executes them
+    in the given order. At most :attr:`config.max_put_workers` threads
+    are started; further sites share the worker with the shortest
+    queue.
+
     .. version-changed:: 11.0
        *block* must be given as keyword argument.
+    .. version-changed:: 11.8
+       requests are executed by worker threads per site if *block* is
+       true.
 
     :param block: If true, block :attr:`page_put_queue` if necessary
         until a request is available to process. Otherwise process a
-        request if one is immediately available, else leave the function.
+        request if one is immediately available in the current thread,
+        else leave the function.
     """
     while True:
         if not block and page_put_queue.empty():
@@ -427,28 +561,71 @@ def async_manager(*, block=True) -> None:
         except ShutDown:
             break
 
-        with _page_put_queue_busy:
-            if request is None:  # Python < 3.13 not handled by ShutDown
-                break
+        if request is None:  # Python < 3.13 not handled by ShutDown
+            page_put_queue.task_done()
+            break
+
+        if block:
+            _dispatch(request, args, kwargs)
+        else:
             request(*args, **kwargs)
             page_put_queue.task_done()
 
+    if block:
+        # leave the workers after their queues are processed
+        for worker in _put_workers:
+            worker.queue.put((None, None, [], {}, 0))
+
 
 def async_request(request: Callable, *args: Any, **kwargs: Any) -> None:
-    """Put a request on the queue, and start the daemon if necessary."""
+    """Put a request on the queue, and start the daemon if necessary.
+
+    .. version-changed:: 11.8
+       wait while :attr:`config.max_queue_size` requests of all sites
+       are unfinished.
+    """
     if not _putthread.is_alive():
         # ignore RuntimeError if start() is called more than once
         with page_put_queue.mutex, suppress(RuntimeError):
             _putthread.start()
 
+    # The queues of the put workers are unbounded to not stop other sites
+    # behind a slow one. Instead, the callers wait until the number of
+    # all unfinished requests is below the size of page_put_queue.
+    maxsize = page_put_queue.maxsize
+    if maxsize > 0:
+        with _put_done:
+            _put_done.wait_for(
+                lambda: page_put_queue.unfinished_tasks < maxsize)
     page_put_queue.put((request, args, kwargs))
 
 
+def async_stats() -> dict[str, tuple[int, int, float]]:
+    """Return the state of asynchronous requests per site.
+
+    Requests which cannot be assigned to a site are listed with an empty
+    site name.
+
+    .. version-added:: 11.8
+
+    :return: a mapping of site names to the number of pending requests,
+        the number of done requests and their average latency in seconds
+        from queuing to completion
+    """
+    with _put_lock:
+        return {key or '': (pending, done, latency / done if done else 0.0)
+                for key, (pending, done, latency) in _put_stats.items()}
+
+
 #: Queue to hold pending requests
 page_put_queue: Queue = Queue(_config.max_queue_size)
 
-# RLock to signal that async_manager is working on a request. See T147178.
-_page_put_queue_busy: RLock = RLock()
+# Workers executing the requests, the worker of a site and statistics
+_put_workers: list[_PutWorker] = []
+_put_sites: dict[str | None, _PutWorker] = {}
+_put_stats: dict[str | None, list] = {}
+_put_lock = threading.Lock()
+_put_done = threading.Condition(_put_lock)
 
 # set up the background thread
 _putthread = threading.Thread(target=async_manager,
@@ -18,8 +18,14 @@ This module requires requests-sse to be installed::
 from __future__ import annotations
 
 import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Generator
 from datetime import timedelta
 from functools import partial
+from pathlib import Path
 from typing import Any
 
 from requests.packages.urllib3.exceptions import ProtocolError
@@ -118,6 +124,13 @@ class EventStreams(GeneratorWrapper):
 
         :keyword bool canary: If True, include canary events, see
             https://w.wiki/7$2z for more info.
+        :keyword str | os.PathLike checkpoint: A file where the id of
+            the last processed event is stored. An event counts as
+            processed when the next event or batch is requested. If the
+            file exists, the stream resumes after the stored event
+            unless *latest_event_id* is given.
+
+            .. version-added:: 11.8
         :keyword APISite site: A project site object. Used if no *url*
             is given.
         :keyword int retry: Number of milliseconds to wait after disconnects
@@ -173,6 +186,13 @@ class EventStreams(GeneratorWrapper):
         self.filter: dict[str, list[Any]] = {'all': [], 'any': [], 'none': []}
         self._total: int | None = None
         self._canary = kwargs.pop('canary', False)
+        self._checkpoint = kwargs.pop('checkpoint', None)
+        if self._checkpoint and 'latest_event_id' not in kwargs:
+            path = Path(self._checkpoint)
+            if path.is_file():
+                event_id = path.read_text(encoding='utf-8').strip()
+                if event_id:
+                    kwargs['latest_event_id'] = event_id
 
         try:
             self._site = kwargs.pop('site')
@@ -217,6 +237,8 @@ class EventStreams(GeneratorWrapper):
             kwargs['since'] = self._since
         if kwargs['timeout'] == config.socket_timeout:
             kwargs.pop('timeout')
+        if self._checkpoint:
+            kwargs['checkpoint'] = self._checkpoint
         return '{}({})'.format(type(self).__name__, ', '.join(
             f'{k}={v!r}' for k, v in kwargs.items()))
 
@@ -362,12 +384,24 @@ class EventStreams(GeneratorWrapper):
 
         return any(function(data) for function in self.filter['any'])
 
-    @property
-    def generator(self):
-        """Inner generator.
+    def _save_checkpoint(self, event_id: str | None) -> None:
+        """Store *event_id* as the last processed event.
 
-        .. version-changed:: 7.6
-           changed from iterator method to generator property
+        .. version-added:: 11.8
+        """
+        if not self._checkpoint or event_id is None:
+            return
+
+        path = Path(self._checkpoint)
+        temp = path.with_name(path.name + '.tmp')
+        temp.write_text(event_id, encoding='utf-8')
+        os.replace(temp, path)
+
+    def _events(self) -> Generator[tuple[str | None, dict[str, Any]]]:
+        """Yield the id and the data of events passing the filters.
+
+        .. version-added:: 11.8
+           Extracted from :attr:`generator`.
         """
         n = 0
         event = None
@@ -400,7 +434,7 @@ class EventStreams(GeneratorWrapper):
                     else:
                         if self.streamfilter(element):
                             n += 1
-                            yield element
+                            yield event.last_event_id, element
                 # else: ignore empty message
             elif event.type == 'error':  # pragma: no cover
                 warning(f'Encountered error: {event.data}')
@@ -413,13 +447,104 @@ class EventStreams(GeneratorWrapper):
         self.source.close()
         del self.source
 
+    @property
+    def generator(self):
+        """Inner generator.
+
+        .. version-changed:: 7.6
+           changed from iterator method to generator property
+        .. version-changed:: 11.8
+           store the id of the processed event in the *checkpoint* file
+        """
+        for event_id, element in self._events():
+            yield element
+            self._save_checkpoint(event_id)
+
+    def batches(self, size: int = 50, latency: float = 5.0
+                ) -> Generator[list[dict[str, Any]]]:
+        """Yield events in lists bounded by count and latency.
+
+        A batch is yielded if it holds *size* events or if *latency*
+        seconds passed since its first event was received. Events are
+        received by a background thread while the caller processes the
+        previous batch. The *checkpoint* file is updated when the next
+        batch is requested.
 
-def site_rc_listener(site: BaseSite, total: int | None = None):
+        .. version-added:: 11.8
+
+        :param size: maximum number of events in a batch
+        :param latency: maximum number of seconds to wait for more
+            events after the first event of a batch
+        """
+        received: queue.Queue = queue.Queue(maxsize=size)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    received.put(item, timeout=1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def receive() -> None:
+            try:
+                for item in self._events():
+                    if not put(item):
+                        return
+            except Exception as e:  # pragma: no cover
+                put(e)
+            else:
+                put(done)
+
+        thread = threading.Thread(target=receive, name='EventStreams',
+                                  daemon=True)
+        thread.start()
+        last: Any = None
+        try:
+            while last is None:
+                item = received.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):  # pragma: no cover
+                    raise item
+
+                batch = [item]
+                deadline = time.monotonic() + latency
+                while len(batch) < size:
+                    try:
+                        item = received.get(
+                            timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is done or isinstance(item, Exception):
+                        last = item
+                        break
+                    batch.append(item)
+
+                yield [element for _, element in batch]
+                self._save_checkpoint(batch[-1][0])
+
+            if isinstance(last, Exception):  # pragma: no cover
+                raise last
+        finally:
+            stop.set()
+
+
+def site_rc_listener(site: BaseSite, total: int | None = None, *,
+                     checkpoint: str | os.PathLike | None = None):
     """Yield changes received from EventStream.
 
+    .. version-changed:: 11.8
+       *checkpoint* parameter was added.
+
     :param site: The pywikibot.Site object to yield live recent changes
         for
     :param total: The maximum number of changes to return
+    :param checkpoint: A file to store the id of the last processed
+        event and to resume from it
     :return: A recent changes listener configured for given site
     :raises ModuleNotFoundError: requests-sse package installation is
         required
@@ -427,7 +552,8 @@ def site_rc_listener(site: BaseSite, total: int | None = None):
     if isinstance(EventSource, ModuleNotFoundError):
         raise ModuleNotFoundError(INSTALL_MSG) from EventSource
 
-    stream = EventStreams(streams='recentchange', site=site)
+    stream = EventStreams(streams='recentchange', site=site,
+                          checkpoint=checkpoint)
     stream.set_maximum_items(total)
     stream.register_filter(server_name=site.hostname())
     return stream
@@ -26,8 +26,15 @@ To enable access via cookies, assign cookie handling class::
 
     session.cookies = http.cookie_jar
 
+To use the configured connection pools, mount the adapters::
+
+    http.mount_adapters(session)
+
 .. version-changed:: 8.0
    Cookies are lazy loaded when logging to site.
+.. version-changed:: 11.8
+   Connection pools are configured by ``http_*`` config variables and
+   pool statistics are logged when the session is closed.
 """
 from __future__ import annotations
 
@@ -35,16 +42,24 @@ import atexit
 import codecs
 import os
 import re
+import socket
 import sys
 import threading
 import traceback
+from collections import Counter
 from contextlib import suppress
+from functools import cache
 from http import HTTPStatus, cookiejar
 from string import Formatter
+from types import ModuleType
+from typing import Any
 from urllib.parse import quote, urlparse
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
 
 import pywikibot
 from pywikibot import config, tools
@@ -58,12 +73,6 @@ from pywikibot.logging import critical, debug, error, log, warning
 from pywikibot.tools import file_mode_checker, issue_deprecation_warning
 
 
-try:
-    import requests_oauthlib
-except ImportError as e:
-    requests_oauthlib = e
-
-
 class PywikibotCookieJar(cookiejar.LWPCookieJar):
 
     """CookieJar which create the filename and checks file permissions.
@@ -110,11 +119,163 @@ class PywikibotCookieJar(cookiejar.LWPCookieJar):
             super().save(*args, **kwargs)
 
 
+#: Connection pool statistics per host. Counters are ``requests``
+#: (connections taken from the pool), ``new`` (opened connections) and
+#: ``discarded`` (connections closed because the pool was full).
+#:
+#: .. version-added:: 11.8
+pool_statistics: dict[str, Counter[str]] = {}
+_pool_statistics_lock = threading.Lock()
+
+
+def _count(host: str, key: str) -> None:
+    """Increment a connection pool counter of *host*."""
+    with _pool_statistics_lock:
+        pool_statistics.setdefault(host, Counter())[key] += 1
+
+
+class _CountingPoolMixin:
+
+    """Connection pool mixin which counts connection usage."""
+
+    host: str
+    pool: Any
+
+    def _get_conn(self, *args, **kwargs):
+        """Count requested connections."""
+        _count(self.host, 'requests')
+        return super()._get_conn(*args, **kwargs)
+
+    def _new_conn(self, *args, **kwargs):
+        """Count opened connections."""
+        _count(self.host, 'new')
+        return super()._new_conn(*args, **kwargs)
+
+    def _put_conn(self, conn) -> None:
+        """Count connections discarded due to a full pool."""
+        if conn is not None and self.pool is not None and self.pool.full():
+            _count(self.host, 'discarded')
+        super()._put_conn(conn)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+
+    """HTTP connection pool with usage statistics."""
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+
+    """HTTPS connection pool with usage statistics."""
+
+
+class PywikibotHTTPAdapter(HTTPAdapter):
+
+    """Transport adapter with configurable pools and statistics.
+
+    The pool size, blocking behaviour, keep-alive and retry policy
+    default to the ``http_*`` variables of :mod:`config`. The counters
+    of the created connection pools are collected in
+    :data:`pool_statistics`.
+
+    .. version-added:: 11.8
+    """
+
+    def __init__(self, *,
+                 pool_connections: int | None = None,
+                 pool_maxsize: int | None = None,
+                 pool_block: bool | None = None,
+                 keep_alive: bool | None = None,
+                 max_retries: int | None = None,
+                 retry_backoff: float | None = None) -> None:
+        """Initializer.
+
+        :param pool_connections: number of cached host pools
+        :param pool_maxsize: maximum number of connections kept per host
+        :param pool_block: wait for a free connection if the pool is
+            exhausted
+        :param keep_alive: enable TCP keep-alive on pooled connections;
+            otherwise every connection is closed after use
+        :param max_retries: number of retries for failed connections
+        :param retry_backoff: backoff factor between retries in seconds
+        """
+        if keep_alive is None:
+            keep_alive = config.http_keep_alive
+        if retry_backoff is None:
+            retry_backoff = config.http_retry_backoff
+        if max_retries is None:
+            max_retries = config.http_max_retries
+        self.keep_alive = keep_alive
+
+        super().__init__(
+            pool_connections=(pool_connections
+                              or config.http_pool_connections),
+            pool_maxsize=pool_maxsize or config.http_pool_maxsize,
+            pool_block=(config.http_pool_block if pool_block is None
+                        else pool_block),
+            max_retries=Retry(total=max_retries, read=False,
+                              backoff_factor=retry_backoff),
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs) -> None:
+        """Initialize the pool manager with counting connection pools."""
+        if self.keep_alive:
+            options = HTTPConnectionPool.ConnectionCls.default_socket_options
+            pool_kwargs.setdefault('socket_options', [
+                *options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+    def add_headers(self, request, **kwargs) -> None:
+        """Close the connection after use if keep-alive is disabled."""
+        if not self.keep_alive:
+            request.headers['Connection'] = 'close'
+
+
+def mount_adapters(http_session: requests.Session) -> None:
+    """Mount configured transport adapters to a session.
+
+    A :class:`PywikibotHTTPAdapter` with the default settings is mounted
+    for all hosts. For every host in :attr:`config.http_adapter_settings`
+    a separate adapter with its own pool settings is mounted.
+
+    .. version-added:: 11.8
+
+    :param http_session: the session to mount the adapters to
+    """
+    adapter = PywikibotHTTPAdapter()
+    for scheme in ('http://', 'https://'):
+        http_session.mount(scheme, adapter)
+
+    for host, settings in config.http_adapter_settings.items():
+        adapter = PywikibotHTTPAdapter(**settings)
+        for scheme in ('http://', 'https://'):
+            http_session.mount(f'{scheme}{host}/', adapter)
+
+
+def _log_pool_statistics() -> None:
+    """Log the connection pool statistics per host."""
+    with _pool_statistics_lock:
+        items = sorted(pool_statistics.items())
+    for host, counter in items:
+        hits = counter['requests'] - counter['new']
+        debug(f'Connection pool {host}: {counter["requests"]} requests, '
+              f'{hits} reused, {counter["new"]} new, '
+              f'{counter["discarded"]} discarded connections')
+        if counter['discarded']:
+            log(f'Connection pool for {host} was full; consider to '
+                f'increase config.http_pool_maxsize')
+
+
 #: global :class:`PywikibotCookieJar` instance.
 cookie_jar = PywikibotCookieJar()
 #: global :class:`requests.Session`.
 session = requests.Session()
 session.cookies = cookie_jar
+mount_adapters(session)
 
 
 def flush() -> None:  # pragma: no cover
@@ -123,8 +284,11 @@ def flush() -> None:  # pragma: no cover
     .. version-changed:: 8.1
        log the traceback and show the exception value in the critical
        message
+    .. version-changed:: 11.8
+       log connection pool statistics.
     """
     log('Closing network session.')
+    _log_pool_statistics()
     session.close()
 
     if hasattr(sys, 'last_type'):
@@ -503,6 +667,7 @@ def fetch(uri: str,
 
     auth = get_authentication(uri)
     if auth is not None and len(auth) == 4:
+        requests_oauthlib = _requests_oauthlib()
         if isinstance(requests_oauthlib, ImportError):
             raise ModuleNotFoundError(f"""{requests_oauthlib}. Install it with
 
@@ -647,3 +812,28 @@ def _decide_encoding(response: requests.Response,
 
     return _try_decode(response.content, header_encoding) \
         or _try_decode(response.content, charset)
+
+
+@cache
+def _requests_oauthlib() -> ModuleType | ImportError:
+    """Import the *requests_oauthlib* package on first use.
+
+    .. version-added:: 11.8
+
+    :return: the package or the exception if it is not installed
+    """
+    try:
+        import requests_oauthlib
+    except ImportError as e:
+        return e
+    return requests_oauthlib
+
+
+def __getattr__(name: str) -> Any:
+    """Return the lazily imported *requests_oauthlib* module attribute.
+
+    .. version-added:: 11.8
+    """
+    if name == 'requests_oauthlib':
+        return _requests_oauthlib()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -165,6 +165,27 @@ fake_user_agent_exceptions: dict[str, bool | str] = {}
 site_interface = 'APISite'
 # number of days to cache namespaces, api configuration, etc.
 API_config_expiry = 30
+# Storage backend for cached API requests. 'sqlite' keeps all entries in
+# a single indexed database file inside the apicache directory, 'file'
+# stores one pickle file per request.
+API_cache_backend = 'sqlite'
+# Maximum size of the sqlite API cache data in MiB. Least recently used
+# entries are evicted if it is exceeded. 0 means unlimited.
+API_cache_maxsize = 256
+# Load the siteinfo and API parameter information of a site from a single
+# snapshot file inside the 'snapshots' directory when the site is
+# created. The snapshot is revalidated in the background with one
+# siteinfo request. Use the maintenance script 'snapshot' to build the
+# snapshots of a whole family in advance.
+site_snapshots = False
+
+# Keep the text of loaded revisions in a local database which is shared
+# by all bot runs. Only revision metadata is requested for pages whose
+# latest revision text is stored already.
+revision_store = False
+# Maximum size of the compressed revision texts in MiB. Least recently
+# used revisions are evicted if it is exceeded. 0 means unlimited.
+revision_store_maxsize = 512
 
 # The maximum number of bytes which uses a GET request, if not positive
 # it'll always use POST requests
@@ -716,6 +737,25 @@ maxthrottle = 60
 # 'put_throttle' seconds.
 put_throttle: int | float = 10
 
+# Registry of running bot processes used to scale the throttle delays.
+# 'sqlite' stores the processes in the throttle.db database file with
+# atomic updates; 'file' uses the throttle.ctrl text file. The text file
+# is also used if the database cannot be opened.
+throttle_registry = 'sqlite'
+
+# Throttle algorithm. 'delay' waits 'minthrottle' and 'put_throttle'
+# seconds between requests, multiplied by the number of running bots.
+# 'bucket' uses token buckets per site instead: reads and writes may be
+# sent in bursts of 'read_bucket_burst' and 'write_bucket_burst' requests
+# but do not exceed the sustained rates below (requests per minute). With
+# the 'sqlite' throttle_registry the buckets are shared by all bots on
+# this host, otherwise each process has its own budget.
+throttle_mode = 'delay'
+read_bucket_rate: int | float = 600
+read_bucket_burst = 10
+write_bucket_rate: int | float = 6
+write_bucket_burst = 1
+
 # Sometimes you want to know when a delay is inserted. If a delay is larger
 # than 'noisysleep' seconds, it is logged on the screen.
 noisysleep = 3.0
@@ -734,6 +774,31 @@ maxlag = 5
 # -1 indicates limit by api restriction
 step = -1
 
+# Number of page groups which PreloadingGenerator retrieves in advance by
+# a background thread while the current pages are processed, e.g. by
+# replace.py or cosmetic_changes.py. 0 disables prefetching. Each group
+# holds up to 50 pages including their content.
+preload_prefetch = 0
+
+# Number of pages which pagegenerators.GeneratorFactory keeps in memory
+# for -intersect of generators which are not sorted by title. If more
+# pages are found in some but not yet in all generators, their keys are
+# moved to a temporary database on disk. 0 keeps all keys in memory.
+intersect_spill_size = 1000000
+
+# Number of parsed link titles which are cached per site. Link texts
+# found again, e.g. by page generators or link scanning scripts, are not
+# parsed again. 0 disables the cache.
+link_cache_size = 10000
+
+# Number of page texts whose parse results are shared by textlib
+# functions like removeDisabledParts(), isDisabled(), extract_sections(),
+# getCategoryLinks() and extract_templates_and_params(). Scripts which
+# analyse the same text several times do not parse it again. Each entry
+# holds the text, its stripped variants and the parsed document. 0
+# disables the cache.
+wikitext_cache_size = 0
+
 # Maximum number of times to retry an API request before quitting.
 max_retries = 15
 # Minimum time to wait before resubmitting a failed API request.
@@ -780,6 +845,30 @@ db_port = 3306
 # See also: https://requests.readthedocs.io/en/stable/user/advanced/#timeouts
 socket_timeout = (6.05, 45)
 
+# Number of hosts whose connection pools are kept by the HTTP session.
+http_pool_connections = 10
+# Maximum number of connections kept alive per host. It should not be
+# lower than the number of threads accessing the same host; otherwise
+# connections are discarded after use and new TLS handshakes are needed.
+http_pool_maxsize = 10
+# Wait for a free connection instead of opening a new one when all
+# connections of a host pool are in use.
+http_pool_block = False
+# Enable TCP keep-alive probes on pooled connections to keep idle
+# connections open. Set to False to close every connection after use.
+http_keep_alive = True
+# Number of times the transport retries failed connections before an
+# error is raised. API requests are retried independently of this
+# setting, see max_retries above.
+http_max_retries = 0
+# Backoff factor in seconds between transport retries.
+http_retry_backoff = 0.5
+# Host specific connection pool settings which override the values
+# above. Valid keys are 'pool_maxsize', 'pool_block', 'keep_alive',
+# 'max_retries' and 'retry_backoff', e.g.
+# http_adapter_settings['commons.wikimedia.org'] = {'pool_maxsize': 20}
+http_adapter_settings: dict[str, dict[str, bool | float]] = {}
+
 
 # ############# COSMETIC CHANGES SETTINGS ##############
 # The bot can make some additional changes to each page it edits, e.g. fix
@@ -851,6 +940,11 @@ simulate: bool | str = False
 # processing. As higher this value this effect will decrease.
 max_queue_size = 64
 
+# Maximum number of threads which execute asynchronous requests like
+# page saves. Requests of a site are executed by one thread in the given
+# order; further sites share the thread with the shortest queue.
+max_put_workers = 8
+
 # Pickle protocol version to use for storing dumps.
 # This config variable is not used for loading dumps.
 # Version 0 is a more or less human-readable protocol.
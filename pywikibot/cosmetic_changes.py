@@ -57,6 +57,7 @@ or by adding a list to the given one::
 from __future__ import annotations
 
 import re
+import time
 from collections.abc import Callable
 from contextlib import suppress
 from enum import IntEnum
@@ -232,6 +233,11 @@ class CosmeticChangesToolkit:
 
     .. version-changed:: 7.0
        `from_page()` method was removed
+    .. version-changed:: 11.8
+       the methods share the parse results of each text version with
+       :meth:`textlib.wikitext_cache.enabled()
+       <textlib.WikitextCache.enabled>`; the time spent by each method
+       is collected in :attr:`timings`.
     """
 
     def __init__(self, page: pywikibot.page.BasePage, *,
@@ -287,9 +293,14 @@ class CosmeticChangesToolkit:
         if stdnum_isbn:
             self.common_methods.append(self.fix_ISBN)
 
+        #: seconds spent by each method
+        self.timings: dict[str, float] = dict.fromkeys(
+            (method.__name__ for method in self.common_methods), 0.0)
+
     def safe_execute(self, method: Callable[[str], str], text: str) -> str:
         """Execute the method and catch exceptions if enabled."""
         result = None
+        start = time.perf_counter()
         try:
             result = method(text)
         except Exception as e:
@@ -299,15 +310,34 @@ class CosmeticChangesToolkit:
             pywikibot.warning(
                 f'Unable to perform "{method.__name__}" on "{self.title}"!')
             pywikibot.error(e)
+        finally:
+            name = method.__name__
+            self.timings[name] = (self.timings.get(name, 0.0)
+                                  + time.perf_counter() - start)
 
         return text if result is None else result
 
     def _change(self, text: str) -> str:
-        """Execute all clean up methods."""
-        for method in self.common_methods:
-            text = self.safe_execute(method, text)
+        """Execute all clean up methods.
+
+        .. version-changed:: 11.8
+           disabled parts and sections of a text are searched once for
+           all methods which do not change it.
+        """
+        with textlib.wikitext_cache.enabled():
+            for method in self.common_methods:
+                text = self.safe_execute(method, text)
         return text
 
+    def timing_report(self) -> str:
+        """Return the time spent by each method, slowest first.
+
+        .. version-added:: 11.8
+        """
+        timings = sorted(self.timings.items(), key=lambda item: -item[1])
+        return '\n'.join(f'{name}: {seconds * 1000:.1f} ms'
+                         for name, seconds in timings)
+
     def change(self, text: str) -> bool | str:
         """Execute all clean up methods and catch errors if activated."""
         try:
@@ -320,6 +350,9 @@ class CosmeticChangesToolkit:
                 pywikibot.error(e)
                 return False
             raise
+        finally:
+            pywikibot.debug(f'Cosmetic changes timings of {self.title}:\n'
+                            + self.timing_report())
 
         if self.show_diff:
             pywikibot.showDiff(text, new_text)
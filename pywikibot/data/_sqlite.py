@@ -0,0 +1,139 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""SQLite databases with least recently used eviction.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import suppress
+from pathlib import Path
+
+
+__all__ = ('SQLiteLRUMixin', )
+
+
+class SQLiteLRUMixin:
+
+    """Mixin for a SQLite database table with a size limit.
+
+    The subclass defines the :attr:`table` with its :attr:`key` columns
+    and an ``accessed`` time and a ``size`` column in its ``_schema``.
+    The total size of the table is maintained by triggers in the table
+    ``<table>_size``; entries have to be replaced with an upsert because
+    a REPLACE conflict resolution does not fire the delete trigger. The
+    least recently used entries are evicted whenever the total size
+    exceeds ``maxsize``.
+
+    The database uses write-ahead logging and a busy timeout, which
+    allows several bot processes to share it concurrently. Every thread
+    uses its own connection.
+    """
+
+    #: seconds to wait for a lock held by another process
+    timeout = 30
+
+    #: name of the table with the entries
+    table: str
+
+    #: primary key columns of :attr:`table`
+    key: tuple[str, ...]
+
+    #: maximum total size of the entries; 0 means unlimited
+    maxsize: int
+
+    _schema: str
+
+    def _open(self, path: Path) -> None:
+        """Open the database at *path* and create the tables."""
+        self.path = path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        table = self.table
+        with self._connection as conn:
+            conn.executescript(self._schema + f"""
+                CREATE TABLE IF NOT EXISTS {table}_size
+                    (total INTEGER NOT NULL);
+                INSERT INTO {table}_size SELECT IFNULL(SUM(size), 0)
+                    FROM {table}
+                    WHERE NOT EXISTS (SELECT * FROM {table}_size);
+                CREATE TRIGGER IF NOT EXISTS {table}_insert
+                    AFTER INSERT ON {table}
+                BEGIN
+                    UPDATE {table}_size SET total = total + NEW.size;
+                END;
+                CREATE TRIGGER IF NOT EXISTS {table}_update
+                    AFTER UPDATE OF size ON {table}
+                BEGIN
+                    UPDATE {table}_size
+                        SET total = total + NEW.size - OLD.size;
+                END;
+                CREATE TRIGGER IF NOT EXISTS {table}_delete
+                    AFTER DELETE ON {table}
+                BEGIN
+                    UPDATE {table}_size SET total = total - OLD.size;
+                END;
+            """)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   check_same_thread=False)
+            with suppress(sqlite3.OperationalError):
+                conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries exceeding *maxsize*.
+
+        The total size is read from the size table and only if it
+        exceeds *maxsize* the entries are scanned in access order.
+        """
+        if not self.maxsize:
+            return
+
+        table = self.table
+        excess = conn.execute(
+            f'SELECT total FROM {table}_size').fetchone()[0] - self.maxsize
+        if excess <= 0:
+            return
+
+        columns = ', '.join(self.key)
+        keys = []
+        cursor = conn.execute(f'SELECT {columns}, size FROM {table} '
+                              f'ORDER BY accessed, {columns}')
+        for *key, size in cursor:
+            keys.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        condition = ' AND '.join(f'{column} = ?' for column in self.key)
+        conn.executemany(f'DELETE FROM {table} WHERE {condition}', keys)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._connection.execute(
+            f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def close(self) -> None:
+        """Close all database connections."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
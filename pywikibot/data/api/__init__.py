@@ -11,6 +11,11 @@ from email.mime.multipart import MIMEMultipart as MIMEMultipartOrig
 from io import BytesIO
 
 from pywikibot.comms import http
+from pywikibot.data.api._cache import (
+    CacheBackend,
+    FileCacheBackend,
+    SQLiteCacheBackend,
+)
 from pywikibot.data.api._generators import (
     APIGenerator,
     APIGeneratorBase,
@@ -30,7 +35,9 @@ from pywikibot.family import SubdomainFamily
 __all__ = (
     'APIGeneratorBase',
     'APIGenerator',
+    'CacheBackend',
     'CachedRequest',
+    'FileCacheBackend',
     'ListGenerator',
     'LogEntryListGenerator',
     'OptionSet',
@@ -39,6 +46,7 @@ __all__ = (
     'PropertyGenerator',
     'QueryGenerator',
     'Request',
+    'SQLiteCacheBackend',
     'encode_url',
     'update_page',
 )
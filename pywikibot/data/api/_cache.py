@@ -0,0 +1,330 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Storage backends for :class:`CachedRequest<data.api.CachedRequest>`.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import datetime
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pywikibot
+from pywikibot import config
+from pywikibot.data._sqlite import SQLiteLRUMixin
+
+
+__all__ = (
+    'CacheBackend',
+    'CacheRecord',
+    'FileCacheBackend',
+    'SQLiteCacheBackend',
+    'get_backend',
+)
+
+
+class CacheRecord(NamedTuple):
+
+    """A single cache entry as returned by a :class:`CacheBackend`."""
+
+    description: str
+    data: Any
+    cachetime: pywikibot.Timestamp
+
+
+class CacheBackend(ABC):
+
+    """Abstract storage for API cache entries.
+
+    Entries are addressed by the hexadecimal key created by
+    :meth:`CachedRequest._create_file_name()
+    <data.api.CachedRequest._create_file_name>` and hold the unique
+    description string, the response data and the time it was cached.
+    """
+
+    #: name used by :attr:`config.API_cache_backend` to select the backend
+    name: str
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initializer.
+
+        :param directory: cache directory; it must already exist
+        """
+        self.directory = Path(directory)
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({str(self.directory)!r})'
+
+    @abstractmethod
+    def get(self, key: str, *, touch: bool = True) -> CacheRecord | None:
+        """Return the record for *key* or None if it is not cached.
+
+        :param touch: update the access time of the entry
+        """
+
+    @abstractmethod
+    def set(self, key: str, description: str, data: Any,
+            cachetime: pywikibot.Timestamp) -> None:
+        """Store a record for *key*, replacing any previous entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for *key*; missing entries are ignored."""
+
+    @abstractmethod
+    def keys(self, *,
+             older_than: datetime.datetime | None = None,
+             contains: str | None = None) -> Iterator[str]:
+        """Iterate over the keys of cached entries.
+
+        :param older_than: only yield entries cached before this time
+        :param contains: only yield entries whose description contains
+            this string
+        """
+
+    def purge(self, older_than: datetime.datetime) -> int:
+        """Delete all entries cached before *older_than*.
+
+        :return: number of deleted entries
+        """
+        count = 0
+        for count, key in enumerate(list(self.keys(older_than=older_than)),
+                                    start=1):
+            self.delete(key)
+        return count
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the backend."""
+
+
+class FileCacheBackend(CacheBackend):
+
+    """Legacy backend storing every entry as a pickle file.
+
+    The file name is the entry key and the content is a pickled tuple
+    of description, data and cache time.
+    """
+
+    name = 'file'
+
+    #: pattern of entry keys which are used as file names
+    key_regex = re.compile('[0-9a-f]{64}')
+
+    def get(self, key: str, *, touch: bool = True) -> CacheRecord | None:
+        """Return the record for *key* or None if it is not cached.
+
+        The access time is maintained by the file system and *touch* is
+        ignored.
+        """
+        try:
+            with (self.directory / key).open('rb') as f:
+                return CacheRecord(*pickle.load(f))
+        except OSError:
+            return None  # file not found
+
+    def set(self, key: str, description: str, data: Any,
+            cachetime: pywikibot.Timestamp) -> None:
+        """Store a record for *key*, replacing any previous entry."""
+        path = self.directory / key
+        with suppress(OSError), path.open('wb') as f:
+            pickle.dump((description, data, cachetime), f,
+                        protocol=config.pickle_protocol)
+            return
+        # delete invalid cache entry
+        with suppress(OSError):
+            path.unlink()
+
+    def delete(self, key: str) -> None:
+        """Remove the entry file for *key*."""
+        with suppress(FileNotFoundError):
+            (self.directory / key).unlink()
+
+    def keys(self, *,
+             older_than: datetime.datetime | None = None,
+             contains: str | None = None) -> Iterator[str]:
+        """Iterate over the entry files in the cache directory.
+
+        .. note:: *older_than* is compared with the file modification
+           time and *contains* requires loading each entry.
+        """
+        limit = older_than.timestamp() if older_than else None
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not self.key_regex.fullmatch(entry.name):
+                    continue
+                if limit is not None and entry.stat().st_mtime >= limit:
+                    continue
+                if contains is not None:
+                    record = self.get(entry.name)
+                    if record is None or contains not in record.description:
+                        continue
+                yield entry.name
+
+
+class SQLiteCacheBackend(SQLiteLRUMixin, CacheBackend):
+
+    """Backend storing all entries in a single SQLite database.
+
+    The database file ``cache.sqlite3`` is placed in the cache
+    directory. Entries are indexed by cache time and last access time.
+    The least recently used entries are evicted whenever the total data
+    size exceeds *maxsize*; expired entries are only deleted by
+    :meth:`purge`. See :class:`SQLiteLRUMixin
+    <data._sqlite.SQLiteLRUMixin>` for the shared database handling.
+    """
+
+    name = 'sqlite'
+
+    filename = 'cache.sqlite3'
+
+    table = 'cache'
+
+    key = ('key', )
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS cache (
+            key TEXT PRIMARY KEY,
+            description TEXT NOT NULL,
+            data BLOB NOT NULL,
+            cachetime REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS cache_cachetime ON cache (cachetime);
+        CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed);
+    """
+
+    def __init__(self, directory: str | Path,
+                 maxsize: int | None = None) -> None:
+        """Initializer.
+
+        :param directory: cache directory; it must already exist
+        :param maxsize: maximum size of stored data in bytes; 0 means
+            unlimited. Defaults to :attr:`config.API_cache_maxsize` MiB.
+        """
+        super().__init__(directory)
+        if maxsize is None:
+            maxsize = config.API_cache_maxsize * 1024 ** 2
+        self.maxsize = maxsize
+        self._open(self.directory / self.filename)
+
+    def get(self, key: str, *, touch: bool = True) -> CacheRecord | None:
+        """Return the record for *key* or None if it is not cached.
+
+        :param touch: update the access time of the entry which is used
+            for least recently used eviction
+        """
+        conn = self._connection
+        row = conn.execute(
+            'SELECT description, data, cachetime FROM cache WHERE key = ?',
+            (key, )).fetchone()
+        if row is None:
+            return None
+
+        if touch:
+            with suppress(sqlite3.OperationalError), conn:
+                conn.execute('UPDATE cache SET accessed = ? WHERE key = ?',
+                             (time.time(), key))
+
+        description, data, cachetime = row
+        return CacheRecord(
+            description,
+            pickle.loads(data),
+            pywikibot.Timestamp.fromtimestamp(cachetime,
+                                              datetime.timezone.utc))
+
+    def set(self, key: str, description: str, data: Any,
+            cachetime: pywikibot.Timestamp) -> None:
+        """Store a record for *key* and evict entries above *maxsize*."""
+        blob = pickle.dumps(data, protocol=config.pickle_protocol)
+        conn = self._connection
+        with conn:
+            conn.execute(
+                'INSERT INTO cache '
+                '(key, description, data, cachetime, accessed, size) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET '
+                'description = excluded.description, data = excluded.data, '
+                'cachetime = excluded.cachetime, '
+                'accessed = excluded.accessed, size = excluded.size',
+                (key, description, blob, cachetime.timestamp(), time.time(),
+                 len(blob)))
+            self._evict(conn)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for *key*."""
+        conn = self._connection
+        with conn:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key, ))
+
+    def keys(self, *,
+             older_than: datetime.datetime | None = None,
+             contains: str | None = None) -> Iterator[str]:
+        """Iterate over the keys of cached entries using the index."""
+        query = 'SELECT key FROM cache'
+        conditions = []
+        params: list[Any] = []
+        if older_than is not None:
+            conditions.append('cachetime < ?')
+            params.append(older_than.timestamp())
+        if contains is not None:
+            conditions.append('instr(description, ?) > 0')
+            params.append(contains)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        rows = self._connection.execute(query, params).fetchall()
+        for (key, ) in rows:
+            yield key
+
+    def purge(self, older_than: datetime.datetime) -> int:
+        """Delete all entries cached before *older_than*."""
+        conn = self._connection
+        with conn:
+            cursor = conn.execute('DELETE FROM cache WHERE cachetime < ?',
+                                  (older_than.timestamp(), ))
+        return cursor.rowcount
+
+
+_backend_classes = {cls.name: cls
+                    for cls in (FileCacheBackend, SQLiteCacheBackend)}
+_backends: dict[tuple[str, Path], CacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(directory: str | Path,
+                name: str | None = None) -> CacheBackend:
+    """Return the shared cache backend instance for *directory*.
+
+    :param directory: cache directory; it must already exist
+    :param name: backend name; defaults to
+        :attr:`config.API_cache_backend`
+    :raises ValueError: unknown backend name
+    """
+    if name is None:
+        name = config.API_cache_backend
+    try:
+        cls = _backend_classes[name]
+    except KeyError:
+        raise ValueError(
+            f'Unknown API cache backend {name!r}; use one of '
+            f'{", ".join(sorted(_backend_classes))}') from None
+
+    key = name, Path(directory)
+    with _backends_lock:
+        if key not in _backends:
+            _backends[key] = cls(directory)
+        return _backends[key]
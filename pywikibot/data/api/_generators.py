@@ -12,7 +12,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
 from contextlib import suppress
 from typing import Any, cast
 from warnings import warn
@@ -27,6 +27,7 @@ from pywikibot.exceptions import (
 )
 from pywikibot.site import Namespace
 from pywikibot.tools.collections import GeneratorWrapper
+from pywikibot.tools.threading import async_iterate
 
 
 __all__ = (
@@ -58,6 +59,8 @@ class APIGeneratorBase(ABC):
     .. version-changed:: 10.4
        Introduced :attr:`filter_func` and :meth:`filter_item` for
        instance-level item filtering.
+    .. version-changed:: 11.8
+       Generators can be iterated asynchronously with ``async for``.
     """
 
     _filter_func: Callable[[Any], bool] | None = None
@@ -103,6 +106,27 @@ class APIGeneratorBase(ABC):
 
         return True
 
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Iterate the generator asynchronously.
+
+        Requests including continuations are submitted in a worker
+        thread; throttling, maxlag and retry handling are the same as
+        for synchronous iteration. Several generators, e.g. for
+        different sites, can proceed concurrently within one event loop:
+
+        .. code-block:: python
+
+           async def count(gen):
+               return sum([1 async for _ in gen])
+
+           async def main():
+               return await asyncio.gather(*(count(gen) for gen in gens))
+
+        .. version-added:: 11.8
+        """
+        # subclasses are iterable by GeneratorWrapper
+        return async_iterate(cast(Iterable[Any], self))
+
     def _clean_kwargs(self, kwargs, **mw_api_args):
         """Clean kwargs, define site and request class."""
         if 'site' not in kwargs:
@@ -486,6 +510,19 @@ class QueryGenerator(APIGeneratorBase, GeneratorWrapper):
            Return False if module has no prefix instead raising
            AttributeError.
 
+        :return: True if yes, False otherwise
+        """
+        return self.support_parameter('namespace')
+
+    def support_parameter(self, name: str) -> bool:
+        """Check if *name* is a supported parameter of the limited module.
+
+        The parameter name is given without the module prefix, e.g.
+        ``'filterredir'`` for ``apfilterredir`` of :api:`Allpages`.
+
+        .. version-added:: 11.8
+
+        :param name: parameter name without prefix
         :return: True if yes, False otherwise
         """
         if not self.limited_module:
@@ -493,7 +530,7 @@ class QueryGenerator(APIGeneratorBase, GeneratorWrapper):
 
         return bool(
             self.site._paraminfo.parameter('query+' + self.limited_module,
-                                           'namespace'))
+                                           name))
 
     def set_namespace(self, namespaces) -> None:
         """Set a namespace filter on this query.
@@ -546,6 +583,45 @@ class QueryGenerator(APIGeneratorBase, GeneratorWrapper):
         elif self.prefix + 'namespace' in self.request:
             del self.request[self.prefix + 'namespace']
 
+    def set_filterredir(self, redirects: bool) -> None:
+        """Let the API yield either redirects or non-redirects only.
+
+        .. version-added:: 11.8
+
+        :param redirects: If True, yield redirects only; otherwise only
+            pages which are not redirects
+        :raises TypeError: module does not support a filterredir
+            parameter. Check it with :meth:`support_parameter` first.
+        """
+        if not self.support_parameter('filterredir'):
+            raise TypeError(f'{self.limited_module or self.modules} module'
+                            ' does not support a filterredir parameter')
+
+        self.request[self.prefix + 'filterredir'] = (
+            'redirects' if redirects else 'nonredirects')
+
+    def set_start(self, title: str) -> None:
+        """Let the API start the title ordered list at *title*.
+
+        If the request already has a later start, it is kept.
+
+        .. version-added:: 11.8
+
+        :param title: the title to start from
+        :raises TypeError: module does not support a from parameter.
+            Check it with :meth:`support_parameter` first.
+        """
+        if not self.support_parameter('from'):
+            raise TypeError(f'{self.limited_module or self.modules} module'
+                            ' does not support a from parameter')
+
+        key = self.prefix + 'from'
+        title = title.replace(' ', '_')
+        if key in self.request:
+            start = '|'.join(map(str, self.request[key]))
+            title = max(title, start.replace(' ', '_'))
+        self.request[key] = title
+
     def continue_update(self) -> None:
         """Update query with continue parameters.
 
@@ -87,7 +87,10 @@ class ParamInfo(Sized, Container):
         self._preloaded_modules |= {'query'}
 
         self._fetch(self._preloaded_modules)
+        self._init_query_modules()
 
+    def _init_query_modules(self) -> None:
+        """Verify the main module and retrieve all query submodules."""
         main_modules_param = self.parameter('main', 'action')
         assert main_modules_param
         assert 'type' in main_modules_param
@@ -103,6 +106,34 @@ class ParamInfo(Sized, Container):
             self._limit = min(query_modules_param['limit'], self._limit)
             self._add_submodules('query', query_modules_param['submodules'])
 
+    def update(self, data: dict[str, Any]) -> None:
+        """Add paraminfo of modules which was retrieved before.
+
+        The data is a mapping of module paths to their paraminfo as
+        returned by :meth:`normalize_paraminfo`, e.g. taken from a
+        :class:`site snapshot<pywikibot.site.SiteSnapshot>`.
+        Modules which are already loaded are kept.
+
+        .. version-added:: 11.8
+
+        :raises ValueError: ParamInfo is not initialized and *data* does
+            not contain the modules needed for initialization.
+        """
+        initialized = 'query' in self._modules
+        required = self.init_modules | {'query'}
+        if not initialized and not required <= set(data):
+            raise ValueError('paraminfo data does not contain the modules '
+                             f'{sorted(required)}')
+
+        modules = {path: mod for path, mod in data.items()
+                   if path not in self._paraminfo}
+        self._paraminfo.update(modules)
+        for path in modules:
+            self._generate_submodules(path)
+
+        if not initialized:
+            self._init_query_modules()
+
     @staticmethod
     def _modules_to_set(modules: Iterable | str) -> set[str]:
         """Return modules as a set."""
@@ -6,12 +6,12 @@
 """Objects representing API requests."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 import hashlib
 import inspect
 import math
 import os
-import pickle
 import pprint
 import re
 import sys
@@ -31,6 +31,7 @@ from pywikibot import config
 from pywikibot.backports import sentinel
 from pywikibot.comms import http
 from pywikibot.data import WaitingMixin
+from pywikibot.data.api._cache import CacheBackend, get_backend
 from pywikibot.exceptions import (
     Client414Error,
     Error,
@@ -1230,6 +1231,25 @@ The text message is:
 
         raise MaxlagTimeoutError(msg)
 
+    async def asubmit(self) -> dict:
+        """Submit a query asynchronously and parse the response.
+
+        The request is processed by :meth:`submit` in a worker thread of
+        the event loop's default executor. Therefore the same throttle,
+        maxlag and retry rules apply, while other coroutines can keep
+        further requests in flight, e.g. for other sites:
+
+        .. code-block:: python
+
+           async def main(requests):
+               return await asyncio.gather(*(r.asubmit() for r in requests))
+
+        .. version-added:: 11.8
+
+        :return: a dict containing data retrieved from api.php
+        """
+        return await asyncio.to_thread(self.submit)
+
 
 class CachedRequest(Request):
 
@@ -1332,6 +1352,9 @@ class CachedRequest(Request):
     def _cachefile_path(self) -> Path:
         """Create the cachefile path.
 
+        The path is only used by the ``'file'`` :meth:`cache backend
+        <_get_cache_backend>`.
+
         .. version-changed:: 8.0
            return a `pathlib.Path` object.
 
@@ -1343,17 +1366,37 @@ class CachedRequest(Request):
         """Check whether the timestamp is expired."""
         return dt + self.expiry < pywikibot.Timestamp.nowutc()
 
+    @classmethod
+    def _get_cache_backend(cls) -> CacheBackend:
+        """Return the storage backend for cache entries.
+
+        The backend is selected by :attr:`config.API_cache_backend` and
+        is shared by all requests using the same cache directory.
+
+        .. version-added:: 11.8
+
+        :meta public:
+        """
+        return get_backend(cls._get_cache_dir())
+
     def _load_cache(self) -> bool:
         """Load cache entry for request, if available.
 
+        .. version-changed:: 11.8
+           the entry is read from the :meth:`cache backend
+           <_get_cache_backend>`.
+
         :return: Whether the request was loaded from the cache
         """
         self._add_defaults()
         try:
-            filename = self._cachefile_path()
-            with filename.open('rb') as f:
-                uniquedescr, self._data, self._cachetime = pickle.load(f)
+            backend = self._get_cache_backend()
+            key = self._create_file_name()
+            record = backend.get(key)
+            if record is None:
+                return False
 
+            uniquedescr, self._data, self._cachetime = record
             if uniquedescr != self._uniquedescriptionstr():
                 raise RuntimeError('Expected unique description for the cache '
                                    'entry is different from file entry.')
@@ -1363,11 +1406,9 @@ class CachedRequest(Request):
                 return False
 
             pywikibot.debug(
-                f'{type(self).__name__}: cache ({filename.parent}) hit\n'
-                f'{filename.name}, API request:\n{uniquedescr}')
+                f'{type(self).__name__}: cache ({backend!r}) hit\n'
+                f'{key}, API request:\n{uniquedescr}')
 
-        except OSError:
-            pass  # file not found
         except Exception as e:
             pywikibot.info(f'Could not load cache: {e!r}')
         else:
@@ -1376,14 +1417,18 @@ class CachedRequest(Request):
         return False
 
     def _write_cache(self, data) -> None:
-        """Write data to self._cachefile_path()."""
-        data = self._uniquedescriptionstr(), data, pywikibot.Timestamp.nowutc()
-        path = self._cachefile_path()
-        with suppress(OSError), path.open('wb') as f:
-            pickle.dump(data, f, protocol=config.pickle_protocol)
-            return
-        # delete invalid cache entry
-        path.unlink()
+        """Write data to the cache backend.
+
+        .. version-changed:: 11.8
+           the entry is written to the :meth:`cache backend
+           <_get_cache_backend>`.
+        """
+        try:
+            self._get_cache_backend().set(self._create_file_name(),
+                                          self._uniquedescriptionstr(),
+                                          data, pywikibot.Timestamp.nowutc())
+        except Exception as e:
+            pywikibot.info(f'Could not write cache: {e!r}')
 
     def submit(self):
         """Submit cached request."""
@@ -0,0 +1,155 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Local store of revision texts shared across bot runs.
+
+The text of a revision never changes. If :attr:`config.revision_store`
+is enabled, texts loaded by :meth:`APISite.loadrevisions()
+<pywikibot.site._generators.GeneratorsMixin.loadrevisions>` and
+:meth:`APISite.preloadpages()
+<pywikibot.site._generators.GeneratorsMixin.preloadpages>` are kept in
+a local database. If the latest revision id of a page is already known,
+e.g. from a page generator, and its text is stored, only the revision
+metadata is requested from the wiki.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from pathlib import Path
+
+import pywikibot
+from pywikibot import config
+from pywikibot.backports import batched
+from pywikibot.data._sqlite import SQLiteLRUMixin
+
+
+__all__ = (
+    'RevisionStore',
+    'get_store',
+)
+
+
+class RevisionStore(SQLiteLRUMixin):
+
+    """SQLite database of compressed revision texts.
+
+    Texts are addressed by the site and the revision id. The least
+    recently used texts are evicted whenever the total compressed size
+    exceeds *maxsize*. Like the :class:`SQLiteCacheBackend
+    <data.api._cache.SQLiteCacheBackend>` of the API cache, the database
+    is handled by :class:`SQLiteLRUMixin<data._sqlite.SQLiteLRUMixin>`
+    and can be shared by several bot processes.
+
+    :param path: path of the database file
+    :param maxsize: maximum size of the compressed texts in bytes; 0
+        means unlimited. Defaults to :attr:`config.revision_store_maxsize`
+        MiB.
+    """
+
+    #: maximum number of parameters of a query
+    batch_size = 500
+
+    table = 'revisions'
+
+    key = ('site', 'revid')
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS revisions (
+            site TEXT NOT NULL,
+            revid INTEGER NOT NULL,
+            text BLOB NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL,
+            PRIMARY KEY (site, revid)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS revisions_accessed
+            ON revisions (accessed);
+    """
+
+    def __init__(self, path: str | Path, maxsize: int | None = None) -> None:
+        """Initializer."""
+        if maxsize is None:
+            maxsize = config.revision_store_maxsize * 1024 ** 2
+        self.maxsize = maxsize
+        self._open(Path(path))
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({str(self.path)!r})'
+
+    def get(self, site: pywikibot.site.BaseSite,
+            revids: Iterable[int]) -> dict[int, str]:
+        """Return the stored texts of the given revisions.
+
+        Revisions which are not stored are omitted. The access time of
+        the found revisions is updated.
+        """
+        conn = self._connection
+        texts = {}
+        for batch in batched(set(revids), self.batch_size):
+            placeholders = ', '.join('?' * len(batch))
+            rows = conn.execute(
+                'SELECT revid, text FROM revisions '
+                f'WHERE site = ? AND revid IN ({placeholders})',
+                (str(site), *batch)).fetchall()
+            texts.update((revid, zlib.decompress(blob).decode('utf-8'))
+                         for revid, blob in rows)
+
+        if texts:
+            with suppress(sqlite3.OperationalError), conn:
+                conn.executemany(
+                    'UPDATE revisions SET accessed = ? '
+                    'WHERE site = ? AND revid = ?',
+                    ((time.time(), str(site), revid) for revid in texts))
+        return texts
+
+    def set(self, site: pywikibot.site.BaseSite,
+            texts: Mapping[int, str]) -> None:
+        """Store texts by their revision ids and evict above *maxsize*."""
+        now = time.time()
+        rows = []
+        for revid, text in texts.items():
+            blob = zlib.compress(text.encode('utf-8'))
+            rows.append((str(site), revid, blob, now, len(blob)))
+
+        conn = self._connection
+        with conn:
+            conn.executemany(
+                'INSERT INTO revisions (site, revid, text, accessed, size) '
+                'VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (site, revid) DO UPDATE SET '
+                'text = excluded.text, accessed = excluded.accessed, '
+                'size = excluded.size', rows)
+            self._evict(conn)
+
+
+_store: RevisionStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> RevisionStore | None:
+    """Return the shared revision store.
+
+    The database ``revisions.sqlite3`` is placed in the
+    :attr:`config.base_dir` directory.
+
+    :return: the store or None if :attr:`config.revision_store` is
+        disabled
+    """
+    global _store
+    if not config.revision_store:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            _store = RevisionStore(config.datafilepath('revisions.sqlite3'))
+        return _store
@@ -9,7 +9,7 @@ from __future__ import annotations
 import difflib
 import math
 from collections import abc
-from collections.abc import Iterable, Sequence
+from collections.abc import Hashable, Iterable, Sequence
 from difflib import _format_range_unified  # type: ignore[attr-defined]
 from difflib import SequenceMatcher
 from heapq import nlargest
@@ -20,6 +20,7 @@ from pywikibot.tools import chars, deprecated_signature
 
 
 __all__ = [
+    'HistogramMatcher',
     'Hunk',
     'PatchManager', 'cherry_pick',
     'get_close_matches_ratio',
@@ -27,6 +28,194 @@ __all__ = [
 ]
 
 
+class HistogramMatcher(SequenceMatcher):
+
+    """Sequence matcher using the histogram diff algorithm.
+
+    The matcher has the interface of :pylib:`difflib.SequenceMatcher
+    <difflib#difflib.SequenceMatcher>` but finds the matching blocks
+    like the histogram diff of git: Elements are hashed once, common
+    heads and tails are matched directly and the remaining ranges are
+    split at the longest common block around the element which is
+    least frequent in the range of *a*. Repeated lines like table row
+    separators or list items do not slow it down and are not junked.
+    Ranges whose elements all occur more than :attr:`max_chain_length`
+    times are compared with the O(ND) algorithm of Myers up to
+    :attr:`max_edit_cost` differences.
+
+    >>> s = HistogramMatcher(None, ['a', 'b', 'c', 'b'], ['b', 'c', 'd'])
+    >>> s.get_opcodes()
+    [('delete', 0, 1, 0, 0), ('equal', 1, 3, 0, 2), ('replace', 3, 4, 2, 3)]
+
+    .. version-added:: 11.8
+    """
+
+    #: Maximum number of occurrences of an anchor element in a range
+    max_chain_length = 64
+
+    #: Maximum number of differences searched by the Myers algorithm;
+    #: ranges with more differences are replaced as a whole
+    max_edit_cost = 256
+
+    a: Sequence[Hashable]
+    b: Sequence[Hashable]
+    matching_blocks: list[difflib.Match] | None
+
+    def get_matching_blocks(self) -> list[difflib.Match]:
+        """Return list of triples describing matching subsequences.
+
+        See :pylib:`difflib.SequenceMatcher.get_matching_blocks()
+        <difflib#difflib.SequenceMatcher.get_matching_blocks>`.
+        """
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+
+        ids: dict[Hashable, int] = {}
+        a = [ids.setdefault(x, len(ids)) for x in self.a]
+        b = [ids.setdefault(x, len(ids)) for x in self.b]
+
+        blocks = []
+        ranges = [(0, len(a), 0, len(b))]
+        while ranges:
+            alo, ahi, blo, bhi = ranges.pop()
+            # common head and tail
+            i, j = alo, blo
+            while i < ahi and j < bhi and a[i] == b[j]:
+                i += 1
+                j += 1
+            if i > alo:
+                blocks.append((alo, blo, i - alo))
+                alo, blo = i, j
+            i, j = ahi, bhi
+            while i > alo and j > blo and a[i - 1] == b[j - 1]:
+                i -= 1
+                j -= 1
+            if i < ahi:
+                blocks.append((i, j, ahi - i))
+                ahi, bhi = i, j
+            if alo == ahi or blo == bhi:
+                continue
+
+            anchor = self._find_anchor(a, b, alo, ahi, blo, bhi)
+            if anchor is None:
+                blocks += self._myers(a, b, alo, ahi, blo, bhi)
+            else:
+                i, j, k = anchor
+                blocks.append(anchor)
+                ranges.append((alo, i, blo, j))
+                ranges.append((i + k, ahi, j + k, bhi))
+
+        blocks.sort()
+        non_adjacent = []
+        i1 = j1 = k1 = 0
+        for i2, j2, k2 in blocks:
+            if i1 + k1 == i2 and j1 + k1 == j2:
+                k1 += k2
+            else:
+                if k1:
+                    non_adjacent.append((i1, j1, k1))
+                i1, j1, k1 = i2, j2, k2
+        if k1:
+            non_adjacent.append((i1, j1, k1))
+        non_adjacent.append((len(a), len(b), 0))
+        self.matching_blocks = list(map(difflib.Match._make, non_adjacent))
+        return self.matching_blocks
+
+    def _find_anchor(self, a: list[int], b: list[int], alo: int, ahi: int,
+                     blo: int, bhi: int) -> tuple[int, int, int] | None:
+        """Return the longest common block around the rarest element.
+
+        Of blocks with the same size the most central one is returned;
+        the remaining ranges are balanced if there are many of them.
+
+        :return: start in *a*, start in *b* and size of the block or
+            None if all common elements are too frequent
+        """
+        positions: dict[int, list[int]] = {}
+        for i in range(alo, ahi):
+            positions.setdefault(a[i], []).append(i)
+
+        best = (alo, blo, 0)
+        best_count = self.max_chain_length
+        best_offset = 0
+        center = alo + ahi + blo + bhi
+        j = blo
+        while j < bhi:
+            next_j = j + 1
+            for i in positions.get(b[j], ()):
+                # elements occurring more than max_chain_length times
+                # are rejected; the block count is at most this number
+                if len(positions[b[j]]) > best_count:
+                    break
+                si, sj = i, j
+                while si > alo and sj > blo and a[si - 1] == b[sj - 1]:
+                    si -= 1
+                    sj -= 1
+                ei, ej = i + 1, j + 1
+                while ei < ahi and ej < bhi and a[ei] == b[ej]:
+                    ei += 1
+                    ej += 1
+                count = min(len(positions[x]) for x in a[si:ei])
+                offset = abs(si + ei + sj + ej - center)
+                if count < best_count or count == best_count and (
+                        ei - si > best[2]
+                        or ei - si == best[2] and offset < best_offset):
+                    best, best_count = (si, sj, ei - si), count
+                    best_offset = offset
+                next_j = max(next_j, ej)
+            j = next_j
+
+        return best if best[2] else None
+
+    def _myers(self, a: list[int], b: list[int], alo: int, ahi: int,
+               blo: int, bhi: int) -> list[tuple[int, int, int]]:
+        """Return the matching blocks of a range found by Myers.
+
+        :return: matching blocks or an empty list if there are more
+            than :attr:`max_edit_cost` differences
+        """
+        n, m = ahi - alo, bhi - blo
+        v = {1: 0}
+        trace = []
+        for d in range(self.max_edit_cost + 1):
+            trace.append(v.copy())
+            for k in range(-d, d + 1, 2):
+                if k == -d or k != d and v[k - 1] < v[k + 1]:
+                    x = v[k + 1]
+                else:
+                    x = v[k - 1] + 1
+                y = x - k
+                while x < n and y < m and a[alo + x] == b[blo + y]:
+                    x += 1
+                    y += 1
+                v[k] = x
+                if x >= n and y >= m:
+                    break
+            else:
+                continue
+            break
+        else:
+            return []
+
+        # follow the path back and collect the diagonals
+        blocks = []
+        for d in range(len(trace) - 1, -1, -1):
+            v = trace[d]
+            k = x - y
+            if k == -d or k != d and v[k - 1] < v[k + 1]:
+                k += 1
+            else:
+                k -= 1
+            prev_x = v[k]
+            size = min(x - prev_x, y - (prev_x - k))
+            if size > 0:
+                x -= size
+                y -= size
+                blocks.append((alo + x, blo + y, size))
+            x, y = prev_x, prev_x - k
+        return blocks
+
+
 class Hunk:
 
     """One change hunk between a and b.
@@ -39,6 +228,13 @@ class Hunk:
     NOT_APPR = -1
     PENDING = 0
 
+    #: Maximum product of removed and added lines of a replacement
+    #: whose lines are compared with each other for intraline changes.
+    #: Larger replacements are shown as removed and added lines.
+    #:
+    #: .. version-added:: 11.8
+    max_replace_pairs = 10000
+
     def __init__(self, a: str | Sequence[str],
                  b: str | Sequence[str],
                  grouped_opcode: Sequence[tuple[str, int, int, int, int]]
@@ -103,6 +299,13 @@ class Hunk:
                 for line in self.b[j1:j2]:
                     yield f'{prefix[tag]}{line.strip(lf)}{lf}'
             elif tag == 'replace':
+                if (i2 - i1) * (j2 - j1) > self.max_replace_pairs:
+                    # ndiff compares each pair of lines
+                    for line in self.a[i1:i2]:
+                        yield f'- {line.strip(lf)}{lf}'
+                    for line in self.b[j1:j2]:
+                        yield f'+ {line.strip(lf)}{lf}'
+                    continue
                 for line in difflib.ndiff(self.a[i1:i2], self.b[j1:j2]):
                     yield f'{prefix[tag]}{line.strip(lf)}{lf}'
             else:  # equal, delete
@@ -246,6 +449,9 @@ class PatchManager:
     .. version-changed:: 11.0
        *text_a* and *text_b* are positional-only parameters.
        *by_letter* and *replace_invisible* are keyword-only parameters.
+    .. version-changed:: 11.8
+       :class:`HistogramMatcher` is used by default; the *matcher*
+       parameter was added.
     """
 
     @deprecated_signature(since='11.0.0')
@@ -258,6 +464,7 @@ class PatchManager:
         *,
         by_letter: bool | None = None,
         replace_invisible: bool = False,
+        matcher: type[SequenceMatcher] = HistogramMatcher,
     ) -> None:
         """Initializer.
 
@@ -268,6 +475,9 @@ class PatchManager:
             comparison can be done letter by letter.
         :param replace_invisible: Replace invisible characters like
             U+200e with the charnumber in brackets (e.g. <200e>).
+        :param matcher: The :pylib:`difflib.SequenceMatcher
+            <difflib#difflib.SequenceMatcher>` class or a subclass which
+            finds the changes between the lines or letters.
         """
         self.context = context
         self._replace_invisible = replace_invisible
@@ -279,7 +489,7 @@ class PatchManager:
             self.b = text_b
 
         # groups and hunk have same order (one hunk correspond to one group).
-        s = difflib.SequenceMatcher(None, self.a, self.b)
+        s = matcher(None, self.a, self.b)
         self.groups = list(s.get_grouped_opcodes(0))
         self.hunks = []
         previous_hunk = None
@@ -12,8 +12,10 @@ import re
 import webbrowser
 from ast import literal_eval
 from enum import IntEnum
+from functools import cache
 from pathlib import Path
 from textwrap import fill
+from types import ModuleType
 from typing import Any, cast
 from warnings import warn
 
@@ -28,11 +30,6 @@ from pywikibot.tools import (
 )
 
 
-try:
-    import mwoauth
-except ImportError as e:
-    mwoauth = e
-
 TEST_RUNNING = os.environ.get('PYWIKIBOT_TEST_RUNNING', '0') == '1'
 
 
@@ -594,8 +591,7 @@ class OauthLoginManager(LoginManager):
             configured for the requested site.
         :raises ImportError: mwoauth package isn't installed
         """
-        if isinstance(mwoauth, ImportError):
-            raise ImportError(f'mwoauth is not installed: {mwoauth}.')
+        _require_mwoauth()
         assert password is not None and user is not None
         super().__init__(password=None, site=site, user=None)
         if self.password:
@@ -620,6 +616,7 @@ class OauthLoginManager(LoginManager):
         if self.access_token is None or force:
             pywikibot.info(f'Logging in to {self.site} via OAuth consumer '
                            f'{self.consumer_token[0]}')
+            mwoauth = _require_mwoauth()
             consumer_token = mwoauth.ConsumerToken(*self.consumer_token)
             handshaker = mwoauth.Handshaker(
                 self.site.base_url(self.site.path()), consumer_token)
@@ -685,6 +682,7 @@ class OauthLoginManager(LoginManager):
             pywikibot.error('Access token not set')
             return None
 
+        mwoauth = _require_mwoauth()
         consumer_token = mwoauth.ConsumerToken(*self.consumer_token)
         access_token = mwoauth.AccessToken(*self.access_token)
         try:
@@ -698,3 +696,41 @@ class OauthLoginManager(LoginManager):
             return identity
 
         return None
+
+
+@cache
+def _mwoauth() -> ModuleType | ImportError:
+    """Import the *mwoauth* package on first use.
+
+    .. version-added:: 11.8
+
+    :return: the package or the exception if it is not installed
+    """
+    try:
+        import mwoauth
+    except ImportError as e:
+        return e
+    return mwoauth
+
+
+def _require_mwoauth() -> ModuleType:
+    """Return the *mwoauth* package.
+
+    .. version-added:: 11.8
+
+    :raises ImportError: mwoauth package isn't installed
+    """
+    mwoauth = _mwoauth()
+    if isinstance(mwoauth, ImportError):
+        raise ImportError(f'mwoauth is not installed: {mwoauth}.')
+    return mwoauth
+
+
+def __getattr__(name: str) -> Any:
+    """Return the lazily imported *mwoauth* module attribute.
+
+    .. version-added:: 11.8
+    """
+    if name == 'mwoauth':
+        return _mwoauth()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
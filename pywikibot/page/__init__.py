@@ -11,8 +11,16 @@ from typing import Union
 from pywikibot.page._basepage import BasePage
 from pywikibot.page._category import Category
 from pywikibot.page._filepage import FileInfo, FilePage
-from pywikibot.page._links import BaseLink, Link, SiteLink, html2unicode
+from pywikibot.page._links import (
+    BaseLink,
+    Link,
+    LinkCache,
+    SiteLink,
+    html2unicode,
+)
 from pywikibot.page._page import Page
+from pywikibot.page._pageref import PageIdSet, PageRef, TitleSet
+from pywikibot.page._pipeline import EditPipeline
 from pywikibot.page._revision import Revision
 from pywikibot.page._user import Contribution, User
 from pywikibot.page._wikibase import (
@@ -33,9 +41,13 @@ from pywikibot.site import BaseSite as _BaseSite
 __all__ = (
     'BaseLink',
     'Link',
+    'LinkCache',
     'SiteLink',
     'BasePage',
     'Page',
+    'PageRef',
+    'PageIdSet',
+    'TitleSet',
     'FilePage',
     'Category',
     'User',
@@ -51,6 +63,7 @@ __all__ = (
     'WikibaseEntity',
     'MediaInfo',
     'Contribution',
+    'EditPipeline',
     'Revision',
     'html2unicode',
 )
@@ -18,7 +18,7 @@ from urllib.parse import quote_from_bytes
 from warnings import warn
 
 import pywikibot
-from pywikibot import Timestamp, config, date, i18n, textlib, tools
+from pywikibot import Timestamp, config, i18n, textlib, tools
 from pywikibot.backports import NoneType
 from pywikibot.cosmetic_changes import CANCEL, CosmeticChangesToolkit
 from pywikibot.exceptions import (
@@ -353,6 +353,7 @@ class BasePage(ComparableMixin):
         different namespaces, as some sites have categories with the
         same names. Regular titles return (None, None).
         """
+        from pywikibot import date  # slow import, only needed here
         return date.getAutoFormat(self.site.lang, self.title(with_ns=False))
 
     def isAutoTitle(self):
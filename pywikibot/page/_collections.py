@@ -203,13 +203,23 @@ class AliasesDict(BaseDataDict):
 
 class ClaimCollection(MutableMapping):
 
-    """A structure holding claims for a Wikibase entity."""
+    """A structure holding claims for a Wikibase entity.
+
+    Claims loaded by :meth:`fromJSON` are kept as raw JSON per property.
+    The :class:`Claim<pywikibot.page.Claim>` objects of a property are
+    created when the property is accessed first.
+
+    .. version-changed:: 11.8
+       claims are created lazily
+    """
 
     def __init__(self, repo) -> None:
         """Initializer."""
         super().__init__()
         self.repo = repo
         self._data = {}
+        self._raw = set()  # properties whose claims are not created yet
+        self._on_item = None
 
     @classmethod
     def fromJSON(cls, data, repo):
@@ -217,9 +227,8 @@ class ClaimCollection(MutableMapping):
         this = cls(repo)
         if data == []:  # workaround for T222159
             return this
-        for key, claims in data.items():
-            this[key] = [pywikibot.page.Claim.fromJSON(repo, claim)
-                         for claim in claims]
+        this._data.update(data)
+        this._raw.update(data)
         return this
 
     @classmethod
@@ -228,13 +237,23 @@ class ClaimCollection(MutableMapping):
         return cls(repo)
 
     def __getitem__(self, key):
+        if key in self._raw:
+            claims = [pywikibot.page.Claim.fromJSON(self.repo, claim)
+                      for claim in self._data[key]]
+            if self._on_item is not None:
+                for claim in claims:
+                    claim.on_item = self._on_item
+            self._data[key] = claims
+            self._raw.discard(key)
         return self._data[key]
 
     def __setitem__(self, key, value) -> None:
         self._data[key] = value
+        self._raw.discard(key)
 
     def __delitem__(self, key) -> None:
         del self._data[key]
+        self._raw.discard(key)
 
     def __iter__(self):
         return iter(self._data)
@@ -266,18 +285,22 @@ class ClaimCollection(MutableMapping):
 
         :param diffto: JSON containing entity data
         """
+        # claims of untouched properties are unchanged
+        unchanged = {prop for prop in self._raw
+                     if diffto and diffto.get(prop) == self._data[prop]}
+
         claims = {}
         for prop in self:
-            if self[prop]:
+            if prop not in unchanged and self[prop]:
                 claims[prop] = [claim.toJSON() for claim in self[prop]]
 
         if not diffto:
             return claims
 
         diff_claims = defaultdict(list)
-        props_add = set(claims)
+        props_add = set(claims) | unchanged
         props_orig = set(diffto)
-        for prop in (props_orig | props_add):
+        for prop in (props_orig | props_add) - unchanged:
             if prop not in props_orig:
                 diff_claims[prop].extend(claims[prop])
                 continue
@@ -315,10 +338,17 @@ class ClaimCollection(MutableMapping):
         return diff_claims
 
     def set_on_item(self, item) -> None:
-        """Set Claim.on_item attribute for all claims in this collection."""
-        for claims in self.values():
-            for claim in claims:
-                claim.on_item = item
+        """Set Claim.on_item attribute for all claims in this collection.
+
+        .. version-changed:: 11.8
+           claims which are not created yet get the attribute when
+           created.
+        """
+        self._on_item = item
+        for prop, claims in self._data.items():
+            if prop not in self._raw:
+                for claim in claims:
+                    claim.on_item = item
 
 
 class SiteLinkCollection(MutableMapping):
@@ -13,12 +13,14 @@
 from __future__ import annotations
 
 import re
+import threading
 import unicodedata
+from collections import OrderedDict
 from html.entities import name2codepoint
 from typing import Any
 
 import pywikibot
-from pywikibot import textlib
+from pywikibot import config, textlib
 from pywikibot.exceptions import InvalidTitleError, SiteDefinitionError
 from pywikibot.site import Namespace
 from pywikibot.tools import ComparableMixin, first_upper, is_ip_address
@@ -27,6 +29,7 @@ from pywikibot.tools import ComparableMixin, first_upper, is_ip_address
 __all__ = (
     'BaseLink',
     'Link',
+    'LinkCache',
     'SiteLink',
     'html2unicode',
 )
@@ -219,6 +222,102 @@ class BaseLink(ComparableMixin):
         return cls(title, namespace=page.namespace(), site=page.site)
 
 
+class LinkCache:
+
+    """Bounded cache of parsed links found on a site.
+
+    The cache maps the preprocessed link text and the default namespace
+    to the parsed site, namespace, section and title. The least recently
+    used entries are dropped above *maxsize* entries. All entries are
+    dropped if the namespaces or the interwiki map of the site are
+    reloaded. Use :meth:`Link.cache` to get the cache of a site:
+
+    >>> site = pywikibot.Site('wikipedia:test')
+    >>> cache = Link.cache(site)
+    >>> cache.clear()
+    >>> link = Link('help:foo#bar', site)
+    >>> link.title, link.section
+    ('Foo', 'bar')
+    >>> Link('help:foo#bar|label', site).title
+    'Foo'
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    .. version-added:: 11.8
+
+    :param site: the source site of the links
+    :param maxsize: the maximum number of entries
+    """
+
+    def __init__(self, site: pywikibot.site.BaseSite, maxsize: int) -> None:
+        """Initializer."""
+        self.site = site
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[tuple[str, Any], tuple[Any, ...]] = \
+            OrderedDict()
+        self._state: tuple[Any, Any] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached links."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return (f'{type(self).__name__}({self.site!r}, {self.maxsize}): '
+                f'{len(self)} links, {self.hits} hits, {self.misses} misses')
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of hits to all lookups."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _validate(self) -> None:
+        """Clear the cache if the site data has been reloaded.
+
+        .. note:: The lock must be held by the caller.
+        """
+        iwmap = getattr(self.site, '_interwikimap', None)
+        state = (self.site.namespaces, getattr(iwmap, '_map', None))
+        if self._state is None or any(
+                new is not old for new, old in zip(state, self._state)):
+            self._data.clear()
+            self._state = state
+
+    def get(self, key: tuple[str, Any]) -> tuple[Any, ...] | None:
+        """Return the parsed link and count the lookup."""
+        with self._lock:
+            self._validate()
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: tuple[str, Any], value: tuple[Any, ...]) -> None:
+        """Store a parsed link."""
+        with self._lock:
+            self._validate()
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._state = None
+            self.hits = self.misses = 0
+
+
+_link_cache_lock = threading.Lock()
+
+
 class Link(BaseLink):
 
     """A MediaWiki wikitext link (local or interwiki).
@@ -362,11 +461,54 @@ class Link(BaseLink):
                 return (newsite.family.name, newsite.code)
         return (fam.name, code)  # text before : doesn't match any known prefix
 
+    @staticmethod
+    def cache(site: pywikibot.site.BaseSite) -> LinkCache | None:
+        """Return the cache of links parsed on a source site.
+
+        The cache is kept by the site object. Equal site objects, e.g.
+        of different users, have separate caches because the parsed
+        links refer to the site objects.
+
+        .. version-added:: 11.8
+
+        :return: the cache or None if :attr:`config.link_cache_size` is
+            0
+        """
+        if not config.link_cache_size:
+            return None
+
+        with _link_cache_lock:
+            cache = getattr(site, '_link_cache', None)
+            if cache is None:
+                cache = LinkCache(site, config.link_cache_size)
+                site._link_cache = cache
+        return cache
+
     def parse(self) -> None:
         """Parse wikitext of the link.
 
         Called internally when accessing attributes.
+
+        .. version-changed:: 11.8
+           the result is kept in the :meth:`cache` of the source site.
         """
+        cache = self.cache(self._source)
+        if cache is None:
+            self._parse()
+            return
+
+        key = (self._text, self._defaultns)
+        value = cache.get(key)
+        if value is None:
+            self._parse()
+            cache.set(key, (self._site, self._namespace, self._is_interwiki,
+                            self._section, self._title))
+        else:
+            (self._site, self._namespace, self._is_interwiki,
+             self._section, self._title) = value
+
+    def _parse(self) -> None:
+        """Parse wikitext of the link without cache."""
         self._site = self._source
         self._namespace = self._defaultns
         self._is_interwiki = False
@@ -0,0 +1,321 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Compact references to pages and sets of them.
+
+A :class:`Page<pywikibot.page.Page>` object keeps its link, revisions
+and cached data in dictionaries. Holding millions of pages only to
+remember which ones were seen costs a lot of memory. :class:`PageRef`
+holds the identity of a page only; :class:`TitleSet` and
+:class:`PageIdSet` store many pages in a few contiguous buffers.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Set
+from itertools import accumulate, chain
+from typing import Any
+
+import pywikibot
+from pywikibot.page._basepage import BasePage
+from pywikibot.page._links import Link
+
+
+__all__ = (
+    'PageIdSet',
+    'PageRef',
+    'TitleSet',
+)
+
+
+class PageRef:
+
+    """Lightweight reference to a page.
+
+    A PageRef holds the site, the namespace id, the title without
+    namespace prefix and section and optionally the page id. It is
+    hashable and compares equal to other references of the same page
+    regardless of the page id:
+
+    >>> site = pywikibot.Site('wikipedia:test')
+    >>> ref = PageRef(site, 4, 'Sandbox')
+    >>> ref
+    PageRef(APISite('test', 'wikipedia'), 4, 'Sandbox')
+    >>> ref == PageRef.from_page(ref.to_page())
+    True
+
+    .. note:: The title must be normalized like the titles returned by
+       the API; use :meth:`from_page` for titles of other sources.
+
+    :param site: the site of the page
+    :param namespace: the namespace id of the page
+    :param title: the normalized title without namespace prefix
+    :param pageid: the page id if known
+    """
+
+    __slots__ = ('namespace', 'pageid', 'site', 'title')
+
+    def __init__(self, site: pywikibot.site.BaseSite, namespace: int,
+                 title: str, pageid: int | None = None) -> None:
+        """Initializer."""
+        self.site = site
+        self.namespace = int(namespace)
+        self.title = title
+        self.pageid = pageid
+
+    @classmethod
+    def from_page(cls, page: BasePage) -> PageRef:
+        """Create a reference to a page.
+
+        The page id is taken over if it is already loaded.
+        """
+        return cls(page.site, page.namespace().id,
+                   page.title(with_ns=False, with_section=False),
+                   getattr(page, '_pageid', None))
+
+    def to_page(self) -> pywikibot.Page:
+        """Return the referenced page without parsing its title again."""
+        link = Link.__new__(Link)
+        link._site = self.site
+        link._source = self.site
+        link._namespace = self.site.namespaces[self.namespace]
+        link._title = self.title
+        link._section = None
+        link._anchor = None
+
+        page = pywikibot.Page(link)
+        if self.pageid is not None:
+            page._pageid = self.pageid
+        return page
+
+    def _cmpkey(self) -> tuple[Any, int, str]:
+        """Key for comparison of PageRef objects."""
+        return self.site, self.namespace, self.title
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another PageRef."""
+        if not isinstance(other, PageRef):
+            return NotImplemented
+        return self._cmpkey() == other._cmpkey()
+
+    def __hash__(self) -> int:
+        """Return the hash of the identity of the page."""
+        return hash((self.site.sitename, self.namespace, self.title))
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        pageid = '' if self.pageid is None else f', {self.pageid}'
+        return (f'{type(self).__name__}({self.site!r}, {self.namespace}, '
+                f'{self.title!r}{pageid})')
+
+    def __getstate__(self) -> tuple[str, int, str, int | None]:
+        """Return the state for pickling with the site name."""
+        return self.site.sitename, self.namespace, self.title, self.pageid
+
+    def __setstate__(self, state) -> None:
+        """Restore the state after unpickling."""
+        sitename, self.namespace, self.title, self.pageid = state
+        self.site = pywikibot.Site(sitename)
+
+
+class _SortedStore(Set):
+
+    """Base class of sets with a sorted compact storage.
+
+    New items are collected in a small :class:`set` and merged into the
+    sorted storage when there are more than :attr:`merge_size` of them
+    or more than an eighth of the stored items. Items cannot be removed.
+    """
+
+    #: minimum number of new items before they are merged
+    merge_size = 10_000
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        """Initializer."""
+        self._pending: set[Any] = set()
+        self._size = 0
+        self.update(iterable)
+
+    def _key(self, item: Any) -> Any:
+        """Return the stored key of an item."""
+        raise NotImplementedError
+
+    def _item(self, key: Any) -> Any:
+        """Return the item of a stored key."""
+        raise NotImplementedError
+
+    def _stored(self) -> Iterator[Any]:
+        """Iterate the sorted stored keys."""
+        raise NotImplementedError
+
+    def _find(self, key: Any) -> bool:
+        """Return whether the key is in the sorted storage."""
+        raise NotImplementedError
+
+    def _store(self, keys: list[Any]) -> None:
+        """Replace the sorted storage by the given sorted keys."""
+        raise NotImplementedError
+
+    def _merge(self) -> None:
+        """Merge the pending keys into the sorted storage."""
+        if self._pending:
+            self._store(sorted(chain(self._stored(), self._pending)))
+            self._size += len(self._pending)
+            self._pending.clear()
+
+    def add(self, item: Any) -> None:
+        """Add an item to the set."""
+        key = self._key(item)
+        if key in self._pending or self._find(key):
+            return
+
+        self._pending.add(key)
+        if len(self._pending) > max(self.merge_size, self._size >> 3):
+            self._merge()
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """Add all items of an iterable to the set."""
+        for item in iterable:
+            self.add(item)
+
+    def __contains__(self, item: Any) -> bool:
+        key = self._key(item)
+        return key in self._pending or self._find(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        self._merge()
+        for key in self._stored():
+            yield self._item(key)
+
+    def __len__(self) -> int:
+        return self._size + len(self._pending)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} of {len(self)} items>'
+
+
+class PageIdSet(_SortedStore):
+
+    """Set of page ids stored in a sorted :class:`array.array`.
+
+    Page ids, :class:`PageRef` and page objects can be added or
+    searched; page objects need their :attr:`pageid
+    <pywikibot.page.BasePage.pageid>` and may load it. Iteration yields
+    the page ids in ascending order:
+
+    >>> ids = PageIdSet([3, 1, 2, 1])
+    >>> len(ids), 2 in ids, 4 in ids
+    (3, True, False)
+    >>> list(ids)
+    [1, 2, 3]
+    """
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        """Initializer."""
+        self._ids = array('q')
+        super().__init__(iterable)
+
+    def _key(self, item: int | PageRef | BasePage) -> int:
+        """Return the page id of an item."""
+        return item if isinstance(item, int) else item.pageid
+
+    def _item(self, key: int) -> int:
+        """Return the page id."""
+        return key
+
+    def _stored(self) -> Iterator[int]:
+        """Iterate the stored page ids."""
+        return iter(self._ids)
+
+    def _find(self, key: int) -> bool:
+        """Search the page id in the sorted array."""
+        i = bisect_left(self._ids, key)
+        return i < len(self._ids) and self._ids[i] == key
+
+    def _store(self, keys: list[int]) -> None:
+        """Replace the array."""
+        self._ids = array('q', keys)
+
+
+class TitleSet(_SortedStore):
+
+    """Set of pages stored by their titles in a single buffer.
+
+    The site, namespace id and title of every page are encoded in UTF-8
+    and stored in sorted order in a :class:`bytes` buffer with an
+    :class:`array.array` of offsets. Page objects and :class:`PageRef`
+    can be added or searched; iteration yields :class:`PageRef` objects
+    without page ids.
+
+    Pages are identified like :class:`PageRef` objects; the section of
+    a page is ignored.
+
+    >>> site = pywikibot.Site('wikipedia:test')
+    >>> titles = TitleSet()
+    >>> titles.add(pywikibot.Page(site, 'Foo'))
+    >>> titles.add(PageRef(site, 0, 'Foo'))
+    >>> len(titles)
+    1
+    >>> pywikibot.Page(site, 'Foo#Bar') in titles
+    True
+    >>> list(titles)
+    [PageRef(APISite('test', 'wikipedia'), 0, 'Foo')]
+    """
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        """Initializer."""
+        self._buffer = b''
+        self._offsets = array('Q', [0])
+        self._sites: list[pywikibot.site.BaseSite] = []
+        self._site_index: dict[str, int] = {}
+        super().__init__(iterable)
+
+    def _key(self, item: PageRef | BasePage) -> bytes:
+        """Encode the identity of a page."""
+        if not isinstance(item, PageRef):
+            item = PageRef.from_page(item)
+
+        sitename = item.site.sitename
+        index = self._site_index.get(sitename)
+        if index is None:
+            index = len(self._sites)
+            self._sites.append(item.site)
+            self._site_index[sitename] = index
+        return f'{index:x}:{item.namespace}:{item.title}'.encode()
+
+    def _item(self, key: bytes) -> PageRef:
+        """Decode a page reference."""
+        index, ns, title = key.decode().split(':', 2)
+        return PageRef(self._sites[int(index, 16)], int(ns), title)
+
+    def _stored(self) -> Iterator[bytes]:
+        """Iterate the stored keys."""
+        buffer, offsets = self._buffer, self._offsets
+        for i in range(len(offsets) - 1):
+            yield buffer[offsets[i]:offsets[i + 1]]
+
+    def _find(self, key: bytes) -> bool:
+        """Bisect the sorted buffer for the key."""
+        buffer, offsets = self._buffer, self._offsets
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            stored = buffer[offsets[mid]:offsets[mid + 1]]
+            if stored == key:
+                return True
+            if stored < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def _store(self, keys: list[bytes]) -> None:
+        """Replace the buffer and offsets."""
+        self._offsets = array('Q', [0])
+        self._offsets.extend(accumulate(map(len, keys)))
+        self._buffer = b''.join(keys)
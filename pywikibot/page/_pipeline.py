@@ -0,0 +1,173 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Pipeline to save many independent edits with overlapping requests.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent import futures
+from typing import Any
+
+import pywikibot
+from pywikibot.page._basepage import BasePage
+
+
+__all__ = ('EditPipeline', )
+
+
+class EditPipeline:
+
+    """Save pages in worker threads with overlapping requests.
+
+    :meth:`BasePage.save()<pywikibot.page.BasePage.save>` waits for the
+    response of every edit before the bot continues. The pipeline keeps
+    several edits in flight: while one edit waits for its response the
+    next one is sent. The requests of a site are still spaced by its
+    write :class:`Throttle<throttle.Throttle>` and maxlag back-off of a
+    site holds all workers editing that site. Bad tokens are renewed and
+    the edit is retried by the API request.
+
+    Edits of the same page are saved one after another in the given
+    order. An edit conflict is passed to the callback as
+    :exc:`EditConflictError<exceptions.EditConflictError>`; the page may
+    be reloaded and submitted again.
+
+    .. code-block:: python
+
+       def saved(page, err):
+           if err is not None:
+               pywikibot.error(f'{page} not saved: {err}')
+
+       with EditPipeline(workers=4) as pipeline:
+           for page in gen:
+               page.text = page.text.replace('foo', 'bar')
+               pipeline.submit(page, summary='foo -> bar', callback=saved)
+
+    .. warning:: A submitted page must not be modified until its
+       callback was called.
+
+    :param workers: the maximum number of edits in flight
+    :param max_pending: the maximum number of submitted edits which are
+        not done; :meth:`submit` blocks if it is reached. Defaults to
+        twice the number of *workers*.
+    """
+
+    def __init__(self, workers: int = 4,
+                 max_pending: int | None = None) -> None:
+        """Initializer."""
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='EditPipeline')
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * workers)
+        self._lock = threading.Lock()
+        # edits of pages in flight and their follow-up edits
+        self._pages: dict[BasePage, deque[tuple[Any, ...]]] = {}
+        self._idle = threading.Condition(self._lock)
+        self.saved = 0
+        self.failed = 0
+
+    def __enter__(self) -> EditPipeline:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Wait for all edits and shut down the workers."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return (f'{type(self).__name__}(workers='
+                f'{self._executor._max_workers}): {self.saved} saved, '
+                f'{self.failed} failed, {len(self._pages)} pages pending')
+
+    def submit(self, page: BasePage, *,
+               callback: Callable[[BasePage, Exception | None], Any]
+               | None = None,
+               **kwargs: Any) -> futures.Future:
+        """Submit a page to be saved.
+
+        :param page: the page to be saved
+        :param callback: called with the page and the exception or None
+            when the edit is done
+        :param kwargs: keyword arguments of :meth:`BasePage.save()
+            <pywikibot.page.BasePage.save>` except *asynchronous*
+        :return: a future which is set to the exception of the edit or
+            None
+        """
+        future: futures.Future = futures.Future()
+        edit = (page, callback, kwargs, future)
+        self._slots.acquire()
+        with self._lock:
+            waiting = self._pages.get(page)
+            if waiting is not None:
+                # the page is in flight; save after the previous edit
+                waiting.append(edit)
+                return future
+            self._pages[page] = deque()
+
+        self._start(edit)
+        return future
+
+    def _start(self, edit: tuple[Any, ...]) -> None:
+        """Pass an edit to the executor."""
+        self._executor.submit(self._save, *edit)
+
+    def _save(self, page: BasePage, callback, kwargs,
+              future: futures.Future) -> None:
+        """Save a page and start the next edit of this page."""
+        # wait while another thread backs off due to maxlag
+        with page.site.throttle.lock:
+            pass
+
+        errors = []
+        try:
+            page.save(callback=lambda _page, err: errors.append(err),
+                      **kwargs)
+        except Exception as e:
+            errors.append(e)
+
+        self._done(page, callback, future, errors[-1] if errors else None)
+
+    def _done(self, page: BasePage, callback, future: futures.Future,
+              err: Exception | None) -> None:
+        """Report the result and start the next edit of the page."""
+        with self._lock:
+            if err is None:
+                self.saved += 1
+            else:
+                self.failed += 1
+
+        try:
+            if callback:
+                callback(page, err)
+        finally:
+            future.set_result(err)
+            self._slots.release()
+            with self._lock:
+                waiting = self._pages[page]
+                edit = waiting.popleft() if waiting else None
+                if edit is None:
+                    del self._pages[page]
+                    self._idle.notify_all()
+            if edit is not None:
+                self._start(edit)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until all submitted edits are done.
+
+        :return: False if the timeout occurred
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pages, timeout)
+
+    def close(self) -> None:
+        """Wait for all submitted edits and shut down the workers."""
+        self.wait()
+        self._executor.shutdown()
+        pywikibot.log(repr(self))
@@ -23,6 +23,7 @@ from collections.abc import Callable, Generator, Iterable
 from typing import TYPE_CHECKING, Any
 
 import pywikibot
+from pywikibot import config
 from pywikibot.pagegenerators._factory import GeneratorFactory
 from pywikibot.pagegenerators._filters import (
     CategoryFilterPageGenerator,
@@ -90,6 +91,7 @@ from pywikibot.pagegenerators._generators import (
     page_with_property_generator,
 )
 from pywikibot.tools.collections import DequeGenerator
+from pywikibot.tools.threading import prefetch_map
 
 
 __all__ = (
@@ -672,33 +674,60 @@ def RepeatingGenerator(
 
 def PreloadingGenerator(generator: Iterable[pywikibot.page.Page],
                         groupsize: int = 50,
-                        quiet: bool = False
+                        quiet: bool = False,
+                        prefetch: int | None = None,
                         ) -> Generator[pywikibot.page.Page]:
     """Yield preloaded pages taken from another generator.
 
+    With *prefetch* the next groups of pages are retrieved by a
+    background thread while the current pages are processed.
+
+    .. version-changed:: 11.8
+       *prefetch* parameter was added.
+
     :param generator: Pages to iterate over
     :param groupsize: How many pages to preload at once
     :param quiet: If False (default), show the "Retrieving pages"
         message
+    :param prefetch: Number of groups retrieved in advance. If None
+        (default), :attr:`config.preload_prefetch` is used; 0 disables
+        prefetching.
     """
-    # pages may be on more than one site, for example if an interwiki
-    # generator is used, so use a separate preloader for each site
-    sites: PRELOAD_SITE_TYPE = {}
-    # build a list of pages for each site found in the iterator
-    for page in generator:
-        site = page.site
-        sites.setdefault(site, []).append(page)
-
-        groupsize = min(groupsize, site.maxlimit)
-        if len(sites[site]) >= groupsize:
-            # if this site is at the groupsize, process it
-            group = sites.pop(site)
-            yield from site.preloadpages(group, groupsize=groupsize,
-                                         quiet=quiet)
-
-    for site, pages in sites.items():
-        # process any leftover sites that never reached the groupsize
-        yield from site.preloadpages(pages, groupsize=groupsize, quiet=quiet)
+    if prefetch is None:
+        prefetch = config.preload_prefetch
+
+    def groups() -> Generator[tuple[pywikibot.site.BaseSite,
+                                    list[pywikibot.page.Page], int]]:
+        # pages may be on more than one site, for example if an
+        # interwiki generator is used, so use a separate preloader for
+        # each site
+        size = groupsize
+        sites: PRELOAD_SITE_TYPE = {}
+        # build a list of pages for each site found in the iterator
+        for page in generator:
+            site = page.site
+            sites.setdefault(site, []).append(page)
+
+            size = min(size, site.maxlimit)
+            if len(sites[site]) >= size:
+                # if this site is at the groupsize, process it
+                yield site, sites.pop(site), size
+
+        for site, pages in sites.items():
+            # process any leftover sites that never reached the groupsize
+            yield site, pages, size
+
+    if prefetch < 1:
+        for site, pages, size in groups():
+            yield from site.preloadpages(pages, groupsize=size, quiet=quiet)
+        return
+
+    def load(group):
+        site, pages, size = group
+        return list(site.preloadpages(pages, groupsize=size, quiet=quiet))
+
+    for pages in prefetch_map(load, groups(), depth=prefetch):
+        yield from pages
 
 
 def DequePreloadingGenerator(
@@ -727,11 +756,17 @@ def DequePreloadingGenerator(
 def PreloadingEntityGenerator(
     generator: Iterable[pywikibot.page.WikibaseEntity],
     groupsize: int = 50,
+    **kwargs: Any,
 ) -> Generator[pywikibot.page.WikibaseEntity]:
     """Yield preloaded pages taken from another generator.
 
     Function basically is copied from above, but for Wikibase entities.
 
+    .. version-changed:: 11.8
+       Keyword arguments are passed to :meth:`DataSite.preload_entities()
+       <pywikibot.site._datasite.DataSite.preload_entities>`, e.g.
+       *props* and *languages*.
+
     :param generator: Pages to iterate over
     :param groupsize: How many pages to preload at once
     """
@@ -744,9 +779,9 @@ def PreloadingEntityGenerator(
             # if this site is at the groupsize, process it
             group = sites.pop(site)
             repo = site.data_repository()
-            yield from repo.preload_entities(group, groupsize)
+            yield from repo.preload_entities(group, groupsize, **kwargs)
 
     for site, pages in sites.items():
         # process any leftover sites that never reached the groupsize
         repo = site.data_repository()
-        yield from repo.preload_entities(pages, groupsize)
+        yield from repo.preload_entities(pages, groupsize, **kwargs)
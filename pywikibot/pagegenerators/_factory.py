@@ -11,12 +11,11 @@ import re
 import sys
 from collections.abc import Callable, Iterable, Sequence
 from datetime import timedelta
-from functools import partial
 from itertools import zip_longest
 from typing import TYPE_CHECKING
 
 import pywikibot
-from pywikibot import i18n
+from pywikibot import config, i18n
 from pywikibot.bot import ShowingListOption
 from pywikibot.data import api
 from pywikibot.exceptions import (
@@ -51,11 +50,11 @@ from pywikibot.pagegenerators._generators import (
     UserContributionsGenerator,
     WikibaseSearchItemPageGenerator,
     WikidataSPARQLPageGenerator,
+    _filter_unique_pages,
 )
 from pywikibot.tools import issue_deprecation_warning, strtobool
 from pywikibot.tools.collections import DequeGenerator
 from pywikibot.tools.itertools import (
-    filter_unique,
     intersect_generators,
     roundrobin_generators,
 )
@@ -71,9 +70,102 @@ if TYPE_CHECKING:
     OPT_GENERATOR_TYPE = Optional[HANDLER_GEN_TYPE]
 
 
-# This is the function that will be used to de-duplicate page iterators.
-_filter_unique_pages = partial(
-    filter_unique, key=lambda page: '{}:{}:{}'.format(*page._cmpkey()))
+#: API modules which yield pages ordered by title if ascending
+_TITLE_ORDERED_MODULES = frozenset({'allcategories', 'allimages', 'allpages'})
+
+
+def _page_key(item: Any) -> Any:
+    """Return a key of a page which can be stored in a database.
+
+    Other items are returned unchanged.
+
+    .. version-added:: 11.8
+    """
+    if isinstance(item, pywikibot.page.BasePage):
+        return '{}:{}:{}'.format(*item._cmpkey())
+    return item
+
+
+def _title_key(page: pywikibot.page.BasePage) -> tuple[int, str]:
+    """Return the sort key of a page in title ordered API modules.
+
+    .. version-added:: 11.8
+    """
+    return page.namespace().id, page.title(with_ns=False, underscore=True)
+
+
+def _title_prefix(regex: str) -> str:
+    """Return the literal prefix of a title regex anchored with ``^``.
+
+    Title regexes are matched with ``re.IGNORECASE``. The prefix only
+    contains ASCII characters whose case variants are the upper and
+    lower case letter.
+
+    >>> _title_prefix('^Foo bar.*')
+    'Foo bar'
+    >>> _title_prefix('^Abc?')
+    'Ab'
+    >>> _title_prefix('^List of')
+    'L'
+    >>> _title_prefix('Foo')
+    ''
+
+    .. version-added:: 11.8
+
+    :return: the prefix or an empty string if there is none
+    """
+    if not regex.startswith('^') or '|' in regex:
+        return ''
+
+    prefix: list[str] = []
+    i = 1
+    while i < len(regex):
+        char = regex[i]
+        if char == '\\':
+            if i + 1 == len(regex) or regex[i + 1].isalnum():
+                break  # special sequence like \d
+            i += 1
+            char = regex[i]
+        elif char in '.^$*+?{}[]()':
+            break
+
+        # Python regex matches 'K' with Kelvin sign, 's' with long s
+        # and 'i' with dotted or dotless i if re.IGNORECASE is set
+        if (not char.isascii() or not char.isprintable()
+                or char.lower() in 'iks'):
+            break
+        prefix.append(char)
+        i += 1
+
+    if prefix and i < len(regex) and regex[i] in '*?{':
+        prefix.pop()  # last char is optional
+    return ''.join(prefix)
+
+
+def _title_range(prefix: str, case: str) -> tuple[str, str]:
+    """Return the range of title keys case-insensitively matching *prefix*.
+
+    All ASCII upper case letters sort before the underscore and the
+    lower case letters. Titles starting with any case variant of
+    *prefix* are greater than or equal to the first key and less than
+    or equal to the second key or start with it.
+
+    >>> _title_range('Foo bar', 'first-letter')
+    ('FOO_BAR', 'Foo_bar')
+    >>> _title_range('foo', 'case-sensitive')
+    ('FOO', 'foo')
+
+    .. version-added:: 11.8
+
+    :param prefix: a prefix returned by :func:`_title_prefix`
+    :param case: the case setting of the namespace
+    :return: the least and the greatest key
+    """
+    start = prefix.upper().replace(' ', '_')
+    end = prefix.lower().replace(' ', '_')
+    if case == 'first-letter':
+        end = end[:1].upper() + end[1:]
+    return start, end
 
 
 class GeneratorFactory:
@@ -225,6 +317,13 @@ class GeneratorFactory:
            with the *quiet* option.
            The generator specified by ``-start`` and ``-until`` is
            evaluated lazily by this method.
+        .. version-changed:: 11.8
+           ``-redirect`` filter is passed to the API module and
+           ``-titleregex`` patterns with a literal prefix restrict title
+           ordered API modules like :api:`Allpages` to their range;
+           pages of ``-catfilter`` are checked in groups. ``-intersect``
+           merges title ordered generators and keeps the keys of other
+           generators' pages on disk above ``intersect_spill_size``.
 
         :param gen: Another generator to be combined with
         :param preload: Preload pages using PreloadingGenerator
@@ -241,7 +340,11 @@ class GeneratorFactory:
             else:
                 self.gens.append(apgen)
 
+        redirects_pushed = True
+        title_ordered = len({getattr(gen, 'site', None)
+                             for gen in self.gens}) == 1
         for i, gen_item in enumerate(self.gens):
+            title_ordered &= self._title_ordered(gen_item)
             if self.namespaces:
                 if (isinstance(gen_item, api.QueryGenerator)
                         and gen_item.support_namespace()):
@@ -251,6 +354,12 @@ class GeneratorFactory:
                     self.gens[i] = NamespaceFilterPageGenerator(
                         gen_item, self.namespaces, self.site)
 
+            if self.redirectfilter is not None:
+                redirects_pushed &= self._push_redirectfilter(gen_item)
+
+            if self.titlefilter_list:
+                self.gens[i] = self._push_titlefilter(gen_item, self.gens[i])
+
             if self.limit:
                 try:
                     gen_item.set_maximum_items(self.limit)  # type: ignore[attr-defined]  # noqa: E501
@@ -279,7 +388,13 @@ class GeneratorFactory:
                     '"-intersect" ignored as only one generator is specified.')
         elif self.intersect:
             # By definition no duplicates are possible.
-            dupfiltergen = intersect_generators(*self.gens)
+            if title_ordered:
+                dupfiltergen = intersect_generators(
+                    *self.gens, key=_title_key, ordered=True)
+            else:
+                dupfiltergen = intersect_generators(
+                    *self.gens, key=_page_key,
+                    spill_size=config.intersect_spill_size)
         else:
             combine = roundrobin_generators if self.limit else itertools.chain
             dupfiltergen = _filter_unique_pages(combine(*self.gens))
@@ -289,7 +404,7 @@ class GeneratorFactory:
             dupfiltergen = SubpageFilterGenerator(
                 dupfiltergen, self.subpage_max_depth)
 
-        if self.redirectfilter is not None:
+        if self.redirectfilter is not None and not redirects_pushed:
             # Generator expects second parameter true to exclude redirects, but
             # our logic is true to assert it is a redirect, false when it isn't
             dupfiltergen = RedirectFilterPageGenerator(
@@ -337,6 +452,82 @@ class GeneratorFactory:
 
         return dupfiltergen
 
+    @staticmethod
+    def _title_ordered(gen: Iterable[pywikibot.page.BasePage]) -> bool:
+        """Return True if *gen* yields pages ordered by title.
+
+        .. version-added:: 11.8
+        """
+        if not (isinstance(gen, api.PageGenerator)
+                and gen.limited_module in _TITLE_ORDERED_MODULES):
+            return False
+
+        request = gen.request
+        return (request.get(gen.prefix + 'dir', ['ascending'])
+                == ['ascending']
+                and request.get(gen.prefix + 'sort', ['name']) == ['name'])
+
+    def _push_redirectfilter(self, gen: Iterable[pywikibot.page.BasePage]
+                             ) -> bool:
+        """Let the API module of *gen* apply the ``-redirect`` filter.
+
+        .. version-added:: 11.8
+
+        :return: True if *gen* yields the filtered pages only
+        """
+        if not (isinstance(gen, api.PageGenerator)
+                and gen.support_parameter('filterredir')):
+            return False
+
+        value = 'redirects' if self.redirectfilter else 'nonredirects'
+        current = gen.request.get(gen.prefix + 'filterredir', ['all'])
+        if current == ['all']:
+            gen.set_filterredir(bool(self.redirectfilter))
+            return True
+        return current == [value]
+
+    def _push_titlefilter(
+        self,
+        gen: Iterable[pywikibot.page.BasePage],
+        wrapped: Iterable[pywikibot.page.BasePage],
+    ) -> Iterable[pywikibot.page.BasePage]:
+        """Restrict a title ordered API module to ``-titleregex`` range.
+
+        If every title regex starts with a literal prefix anchored with
+        ``^``, the API module of *gen* starts at the least title which
+        can match and *wrapped* is stopped after the greatest one. The
+        title regexes are still applied to the remaining pages.
+
+        .. version-added:: 11.8
+
+        :param gen: the generator which might be restricted
+        :param wrapped: *gen* or a filter wrapping it
+        :return: *wrapped* or a generator stopping after the range
+        """
+        if not (self._title_ordered(gen)
+                and gen.support_parameter('from')):
+            return wrapped
+
+        prefixes = [_title_prefix(regex) for regex in self.titlefilter_list]
+        if not all(prefixes):
+            return wrapped
+
+        namespace = gen.request.get(gen.prefix + 'namespace', [])
+        if len(namespace) == 1:
+            case = gen.site.namespaces[int(namespace[0])].case
+        else:
+            case = gen.site.siteinfo['case']
+
+        ranges = [_title_range(prefix, case) for prefix in prefixes]
+        gen.set_start(min(start for start, _ in ranges))
+        ends = [end for _, end in ranges]
+
+        def in_range(page: pywikibot.page.BasePage) -> bool:
+            key = page.title(with_ns=False, underscore=True)
+            return any(key <= end or key.startswith(end) for end in ends)
+
+        return itertools.takewhile(in_range, wrapped)
+
     def getCategory(self, category: str  # noqa: N802
                     ) -> tuple[pywikibot.Category, str | None]:
         """Return Category and start as defined by category.
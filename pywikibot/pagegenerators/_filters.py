@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, NamedTuple
 
 import pywikibot
 from pywikibot import config
+from pywikibot.backports import batched
+from pywikibot.data import api
 from pywikibot.exceptions import NoPageError
 from pywikibot.proofreadpage import ProofreadPage
 from pywikibot.tools.itertools import filter_unique
@@ -343,15 +345,54 @@ def QualityFilterPageGenerator(
 def CategoryFilterPageGenerator(
     generator: Iterable[pywikibot.page.BasePage],
     category_list: Sequence[pywikibot.page.Category],
+    *,
+    groupsize: int = 50,
 ) -> Generator[pywikibot.page.BasePage]:
     """Wrap a generator to filter pages by categories specified.
 
+    Pages must be members of all categories given by *category_list*.
+    They are checked in groups of *groupsize* pages with one
+    :api:`Categories` request per site which only asks for the given
+    categories.
+
+    .. version-changed:: 11.8
+       Check pages in groups instead of retrieving all categories of
+       every page; *groupsize* parameter was added.
+
     :param generator: A generator object
     :param category_list: Categories used to filter generated pages
+    :param groupsize: How many pages to check at a time
     """
-    for page in generator:
-        if all(x in page.categories() for x in category_list):
-            yield page
+    categories = set(category_list)
+    if not categories:
+        yield from generator
+        return
+
+    for group in batched(generator, groupsize):
+        pages: PRELOAD_SITE_TYPE = {}
+        for page in group:
+            pages.setdefault(page.site, []).append(page)
+
+        members = set()
+        for site, site_pages in pages.items():
+            if any(cat.site != site for cat in categories):
+                continue
+
+            titles = {page.title(with_section=False) for page in site_pages}
+            for page_dict in site._generator(
+                    api.PropertyGenerator,
+                    type_arg='categories',
+                    titles=sorted(titles),
+                    clcategories=[cat.title() for cat in categories],
+                    cllimit='max'):
+                found = {pywikibot.Category(site, cat['title'])
+                         for cat in page_dict.get('categories', [])}
+                if categories <= found:
+                    members.add((site, page_dict['title']))
+
+        for page in group:
+            if (page.site, page.title(with_section=False)) in members:
+                yield page
 
 
 # name the generator methods
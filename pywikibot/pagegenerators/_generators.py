@@ -7,7 +7,9 @@
 from __future__ import annotations
 
 import calendar
+import copy
 import io
+import os
 import re
 import typing
 from collections import abc
@@ -35,9 +37,15 @@ if TYPE_CHECKING:
     from pywikibot.site._namespace import SingleNamespaceType
     from pywikibot.time import Timestamp
 
-# This is the function that will be used to de-duplicate page iterators.
-_filter_unique_pages = partial(
-    filter_unique, key=lambda page: '{}:{}:{}'.format(*page._cmpkey()))
+
+def _filter_unique_pages(iterable):
+    """De-duplicate page iterators using a compact :class:`TitleSet`.
+
+    .. version-changed:: 11.8
+       seen pages are kept in a :class:`pywikibot.page.TitleSet`; the
+       section of a page is ignored.
+    """
+    return filter_unique(iterable, container=pywikibot.page.TitleSet())
 
 
 def AllpagesPageGenerator(
@@ -872,7 +880,11 @@ def SearchPageGenerator(
 
 
 def LiveRCPageGenerator(site: BaseSite | None = None,
-                        total: int | None = None
+                        total: int | None = None,
+                        *,
+                        groupsize: int = 0,
+                        latency: float = 5.0,
+                        checkpoint: str | os.PathLike | None = None,
                         ) -> Generator[pywikibot.page.Page]:
     """Yield pages from a socket.io RC stream.
 
@@ -883,21 +895,61 @@ def LiveRCPageGenerator(site: BaseSite | None = None,
     `pywikibot.comms.eventstreams.rc_listener` for details on the .rcinfo
     format.
 
+    With *groupsize* the changes are collected in batches of at most
+    *groupsize* changes or *latency* seconds. The pages of a batch are
+    preloaded with a single :meth:`APISite.preloadpages()
+    <pywikibot.site._generators.GeneratorsMixin.preloadpages>` call.
+
+    .. version-changed:: 11.8
+       *groupsize*, *latency* and *checkpoint* parameters were added.
+
     :param site: Site to return recent changes for
     :param total: The maximum number of changes to return
+    :param groupsize: Maximum number of changes whose pages are
+        preloaded together. If 0 (default), pages are not preloaded.
+    :param latency: Maximum number of seconds to wait for more changes
+        of a batch
+    :param checkpoint: A file to store the id of the last processed
+        change. A restarted generator resumes after it.
     """
     if site is None:
         site = pywikibot.Site()
 
     from pywikibot.comms.eventstreams import site_rc_listener
 
-    for entry in site_rc_listener(site, total=total):
-        # The title in a log entry may have been suppressed
-        if 'title' not in entry and entry['type'] == 'log':
-            continue
-        page = pywikibot.Page(site, entry['title'], entry['namespace'])
-        page._rcinfo = entry  # type: ignore[attr-defined]
-        yield page
+    stream = site_rc_listener(site, total=total, checkpoint=checkpoint)
+    if not groupsize:
+        for entry in stream:
+            # The title in a log entry may have been suppressed
+            if 'title' not in entry and entry['type'] == 'log':
+                continue
+            page = pywikibot.Page(site, entry['title'], entry['namespace'])
+            page._rcinfo = entry  # type: ignore[attr-defined]
+            yield page
+        return
+
+    for entries in stream.batches(groupsize, latency):
+        entries = [entry for entry in entries
+                   if 'title' in entry or entry['type'] != 'log']
+        pages: dict[pywikibot.Page, pywikibot.Page] = {}
+        for entry in entries:
+            page = pywikibot.Page(site, entry['title'], entry['namespace'])
+            pages.setdefault(page, page)
+
+        for _ in site.preloadpages(pages, groupsize=groupsize):
+            pass
+
+        yielded = set()
+        for entry in entries:
+            page = pages[pywikibot.Page(site, entry['title'],
+                                        entry['namespace'])]
+            if page in yielded:
+                # a further change of the same page gets a copy
+                page = copy.copy(page)
+            else:
+                yielded.add(page)
+            page._rcinfo = entry  # type: ignore[attr-defined]
+            yield page
 
 
 class GoogleSearchPageGenerator(GeneratorWrapper):
@@ -1193,14 +1245,24 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
 
     .. version-added:: 7.2
        the `content` parameter
+    .. version-added:: 11.8
+       the *processes*, *titles* and *index* parameters
 
-    :param filename: Filename of XML dump
+    :param filename: Filename of XML dump or a sequence of dump parts
     :param start: Skip entries below that value
     :param namespaces: Namespace filter
     :param site: Current site for the generator
     :param text_predicate: A callable with entry.text as parameter and boolean
         as result to indicate the generator should return the page or not
     :param content: If True, assign old page content to Page.text
+    :param processes: number of processes which scan the dump with
+        :meth:`xmlreader.XmlDump.scan`; all CPUs are used if None.
+        *text_predicate* must be picklable if more than one process
+        is used.
+    :param titles: read only the pages with these titles from a bz2
+        multistream dump with :meth:`xmlreader.XmlDump.pages`
+    :param index: path of the multistream index file used with *titles*;
+        see :class:`xmlreader.XmlDump`
 
     :ivar skipping: True if start parameter is given, else False
     :ivar parser: holds the xmlreader.XmlDump parse method
@@ -1214,6 +1276,9 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
         site: BaseSite | None = None,
         text_predicate: Callable[[str], bool] | None = None,
         content=False,
+        processes: int | None = 1,
+        titles: Iterable[str] | None = None,
+        index: str | None = None,
     ) -> None:
         """Initializer."""
         self.text_predicate = text_predicate
@@ -1229,8 +1294,18 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
             self.namespaces = self.site.namespaces
         else:
             self.namespaces = self.site.namespaces.resolve(namespaces)
-        dump = xmlreader.XmlDump(filename, on_error=pywikibot.error)
-        self.parser = dump.parse()
+        dump = xmlreader.XmlDump(filename, on_error=pywikibot.error,
+                                 index=index)
+        if titles is not None:
+            self.parser = dump.pages(titles)
+        elif processes == 1:
+            self.parser = dump.parse()
+        else:
+            predicate = None
+            if text_predicate:
+                predicate = partial(_match_text, text_predicate)
+                self.text_predicate = None  # applied by the workers
+            self.parser = dump.scan(predicate, processes=processes)
 
     def __next__(self) -> pywikibot.page.Page:
         """Get next Page."""
@@ -1249,6 +1324,12 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
                 return page
 
 
+def _match_text(text_predicate: Callable[[str], bool],
+                entry: xmlreader.XmlEntry) -> bool:
+    """Apply a text predicate of :class:`XMLDumpPageGenerator` to entry."""
+    return text_predicate(entry.text)
+
+
 def YearPageGenerator(start: int = 1, end: int = 2050,
                       site: BaseSite | None = None
                       ) -> Generator[pywikibot.page.Page]:
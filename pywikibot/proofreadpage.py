@@ -21,7 +21,7 @@ import json
 import re
 import time
 from collections.abc import Callable, Iterable, Sequence
-from functools import partial
+from functools import cache
 from http import HTTPStatus
 from typing import Any
 from urllib.parse import unquote
@@ -39,22 +39,45 @@ from pywikibot.page import PageSourceType
 from pywikibot.tools import MediaWikiVersion, cached, remove_last_args
 
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError as e:
-    BeautifulSoup = e
+@cache
+def _beautifulsoup() -> type | ImportError:
+    """Import BeautifulSoup on first use.
 
-    def _bs4_soup(*args: Any, **kwargs: Any) -> None:
-        """Raise BeautifulSoup when called, if bs4 is not available."""
-        raise BeautifulSoup
-else:
-    from bs4 import FeatureNotFound
+    .. version-added:: 11.8
+
+    :return: the BeautifulSoup class or the exception if bs4 is not
+        installed
+    """
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError as e:
+        return e
+    return BeautifulSoup
+
+
+@cache
+def _bs4_features() -> str:
+    """Return the lxml parser if installed or the html.parser."""
+    from bs4 import BeautifulSoup, FeatureNotFound
     try:
         BeautifulSoup('', 'lxml')
     except FeatureNotFound:
-        _bs4_soup = partial(BeautifulSoup, features='html.parser')
-    else:
-        _bs4_soup = partial(BeautifulSoup, features='lxml')
+        return 'html.parser'
+    return 'lxml'
+
+
+def _bs4_soup(*args: Any, **kwargs: Any) -> Any:
+    """Parse the markup with BeautifulSoup.
+
+    .. version-changed:: 11.8
+       bs4 is imported when the function is called first.
+
+    :raises ImportError: bs4 is not installed
+    """
+    beautifulsoup = _beautifulsoup()
+    if isinstance(beautifulsoup, ImportError):
+        raise beautifulsoup
+    return beautifulsoup(*args, features=_bs4_features(), **kwargs)
 
 
 class TagAttr:
@@ -1076,9 +1099,10 @@ class IndexPage(pywikibot.Page):
             Extension.
         :raises ImportError: Bs4 is not installed.
         """
-        # Check if BeautifulSoup is imported.
-        if isinstance(BeautifulSoup, ImportError):
-            raise BeautifulSoup
+        # Check if BeautifulSoup is installed.
+        beautifulsoup = _beautifulsoup()
+        if isinstance(beautifulsoup, ImportError):
+            raise beautifulsoup
 
         if not isinstance(source, pywikibot.site.BaseSite):
             site = source.site
@@ -1441,3 +1465,13 @@ class IndexPage(pywikibot.Page):
             return self._numbers_from_page[page]
         except KeyError:
             raise KeyError(f'Invalid page: {page}.')
+
+
+def __getattr__(name: str) -> Any:
+    """Return the lazily imported *BeautifulSoup* module attribute.
+
+    .. version-added:: 11.8
+    """
+    if name == 'BeautifulSoup':
+        return _beautifulsoup()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -16,11 +16,13 @@ from pywikibot.site._datasite import DataSite
 from pywikibot.site._namespace import NamespaceArgType  # noqa: F401
 from pywikibot.site._obsoletesites import ClosedSite, RemovedSite
 from pywikibot.site._siteinfo import Siteinfo
+from pywikibot.site._snapshot import SiteSnapshot
 from pywikibot.site._tokenwallet import TokenWallet
 
 
 __all__ = ('APISite', 'BaseSite', 'ClosedSite', 'DataSite', 'RemovedSite',
-           'Namespace', 'NamespacesDict', 'Siteinfo', 'TokenWallet')
+           'Namespace', 'NamespacesDict', 'Siteinfo', 'SiteSnapshot',
+           'TokenWallet')
 
 # iiprop file information to get, used in several places
 _IIPROP = (
@@ -66,6 +66,7 @@ from pywikibot.site._generators import GeneratorsMixin
 from pywikibot.site._interwikimap import _InterwikiMap
 from pywikibot.site._namespace import Namespace, NamespaceArgType
 from pywikibot.site._siteinfo import Siteinfo
+from pywikibot.site._snapshot import SiteSnapshot
 from pywikibot.site._tokenwallet import TokenWallet
 from pywikibot.site._upload import Uploader
 from pywikibot.tools import (
@@ -134,8 +135,12 @@ class APISite(
         self._siteinfo = Siteinfo(self)
         self._tokens = TokenWallet(self)
         self._loginstatus = login.LoginStatus.NOT_ATTEMPTED
+        snapshot = SiteSnapshot(self)
+        loaded = pywikibot.config.site_snapshots and snapshot.load()
         with suppress(SiteDefinitionError):
             self.login(cookie_only=True)
+        if loaded:
+            snapshot.start_revalidation()
 
     def __getstate__(self) -> dict[str, Any]:
         """Remove TokenWallet before pickling, for security reasons."""
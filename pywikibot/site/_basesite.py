@@ -196,6 +196,7 @@ class BaseSite(ComparableMixin):
         # site cache contains exception information, which can't be pickled
         if '_iw_sites' in new:
             del new['_iw_sites']
+        new.pop('_link_cache', None)
         return new
 
     def __setstate__(self, attrs) -> None:
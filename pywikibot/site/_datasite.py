@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import json
 import uuid
 from collections.abc import Generator, Iterable
@@ -27,6 +28,7 @@ from pywikibot.exceptions import (
 from pywikibot.site._apisite import APISite
 from pywikibot.site._decorators import need_extension, need_right
 from pywikibot.tools import deprecated, merge_unique_dicts
+from pywikibot.tools.threading import prefetch_map
 
 
 __all__ = ('DataSite', )
@@ -195,46 +197,135 @@ class DataSite(APISite):
         self,
         pagelist: Iterable[pywikibot.page.WikibaseEntity
                            | pywikibot.page.Page],
-        groupsize: int = 50
+        groupsize: int = 50,
+        *,
+        props: Iterable[str] | None = None,
+        languages: Iterable[str] | None = None,
+        prefetch: int = 0,
     ) -> Generator[pywikibot.page.WikibaseEntity]:
         """Yield subclasses of WikibaseEntity's with content prefilled.
 
-        .. note:: Pages will be iterated in a different order than in
-           the underlying pagelist.
+        Entities are iterated in the same order as in the underlying
+        pagelist. An entity requested several times in a groupsize
+        batch is yielded once. Entities whose request could not be
+        assigned, e.g. because of a title normalization, follow at the
+        end of their batch.
+
+        With *prefetch* the next batches are retrieved by a background
+        thread while the caller processes the entities of the current
+        batch.
+
+        .. warning:: With *props* or *languages* the entities only hold
+           the requested parts of their data. For example the labels of
+           other languages are empty; do not edit such entities.
+
+        .. version-changed:: 11.8
+           Entities are yielded in the order of *pagelist*; *props*,
+           *languages* and *prefetch* parameters were added.
+
+        .. seealso:: :api:`Wbgetentities`
 
         :param pagelist: An iterable that yields either WikibaseEntity
             objects, or Page objects linked to an ItemPage.
         :param groupsize: How many pages to query at a time
+        :param props: Parts of the entity data to retrieve like
+            ``'labels'``, ``'descriptions'``, ``'aliases'``,
+            ``'sitelinks'`` or ``'claims'``. If None (default), the full
+            entities are retrieved.
+        :param languages: Retrieve labels, descriptions and aliases in
+            these languages only. If None (default), all languages are
+            retrieved.
+        :param prefetch: Number of batches retrieved in advance. If 0
+            (default), the next batch is requested after all entities of
+            the current batch were consumed.
         """
         if not hasattr(self, '_entity_namespaces'):
             self._cache_entity_namespaces()
-        for batch in batched(pagelist, groupsize):
-            req: dict[str, list[str]] = {'ids': [], 'titles': [], 'sites': []}
-            for p in batch:
-                if isinstance(p, pywikibot.page.WikibaseEntity):
-                    ident = p._defined_by()
-                    for key in ident:
-                        req[key].append(ident[key])
-                elif (p.site == self
-                      and p.namespace() in self._entity_namespaces.values()):
-                    req['ids'].append(p.title(with_ns=False))
-                else:
-                    assert p.site.has_data_repository, \
-                        'Site must have a data repository'
-                    req['sites'].append(p.site.dbName())
-                    req['titles'].append(p._link._text)
 
-            req = self.simple_request(action='wbgetentities', **req)
-            data = req.submit()
-            for entity in data['entities']:
-                if 'missing' in data['entities'][entity]:
-                    continue
-                cls = self._type_to_class[data['entities'][entity]['type']]
-                page = cls(self, entity)
-                # No api call is made because item._content is given
-                page._content = data['entities'][entity]
-                with suppress(IsRedirectPageError):
-                    page.get()  # cannot provide get_redirect=True (T145971)
+        if props is not None:
+            props = set(props)
+            props.add('info')  # revision id and redirects
+        if languages is not None:
+            languages = list(languages)
+
+        batches = batched(pagelist, groupsize)
+        if prefetch < 1:
+            for batch in batches:
+                yield from self._preload_entity_batch(batch, props, languages)
+            return
+
+        def load(batch):
+            return list(self._preload_entity_batch(batch, props, languages))
+
+        for entities in prefetch_map(load, batches, depth=prefetch):
+            yield from entities
+
+    def _preload_entity_batch(
+        self,
+        batch: Iterable[pywikibot.page.WikibaseEntity | pywikibot.page.Page],
+        props: set[str] | None,
+        languages: list[str] | None,
+    ) -> Generator[pywikibot.page.WikibaseEntity]:
+        """Retrieve a batch of entities and yield them in batch order.
+
+        .. version-added:: 11.8
+           Extracted from :meth:`preload_entities`.
+        """
+        req: dict[str, list[str]] = {'ids': [], 'titles': [], 'sites': []}
+        keys: list[tuple[str, str]] = []
+        for p in batch:
+            if isinstance(p, pywikibot.page.WikibaseEntity):
+                ident = p._defined_by()
+                for key in ident:
+                    req[key].append(ident[key])
+                if 'ids' in ident:
+                    keys.append(('', ident['ids'].upper()))
+                else:
+                    keys.append((ident['sites'],
+                                 ident['titles'].replace('_', ' ')))
+            elif (p.site == self
+                  and p.namespace() in self._entity_namespaces.values()):
+                req['ids'].append(p.title(with_ns=False))
+                keys.append(('', p.title(with_ns=False).upper()))
+            else:
+                assert p.site.has_data_repository, \
+                    'Site must have a data repository'
+                req['sites'].append(p.site.dbName())
+                req['titles'].append(p._link._text)
+                keys.append((p.site.dbName(), p.title()))
+
+        params: dict[str, Any] = dict(req)
+        if props is not None:
+            if req['titles']:
+                # sitelinks are needed to assign the entities
+                params['sitefilter'] = sorted(set(req['sites']))
+                props = props | {'sitelinks'}
+            params['props'] = sorted(props)
+        if languages is not None:
+            params['languages'] = languages
+
+        data = self.simple_request(action='wbgetentities', **params).submit()
+
+        entities: dict[tuple[str, str], pywikibot.page.WikibaseEntity] = {}
+        for entity, content in data['entities'].items():
+            if 'missing' in content:
+                continue
+            cls = self._type_to_class[content['type']]
+            page = cls(self, entity)
+            # No api call is made because item._content is given
+            page._content = content
+            with suppress(IsRedirectPageError):
+                page.get()  # cannot provide get_redirect=True (T145971)
+            entities[('', entity.upper())] = page
+            for dbname, sitelink in content.get('sitelinks', {}).items():
+                entities.setdefault((dbname, sitelink['title']), page)
+
+        yielded: set[int] = set()
+        for page in itertools.chain(
+                (entities[key] for key in keys if key in entities),
+                entities.values()):
+            if id(page) not in yielded:
+                yielded.add(id(page))
                 yield page
 
     def get_property_type(self, prop: pywikibot.page.Property) -> str:
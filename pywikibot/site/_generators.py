@@ -6,17 +6,20 @@
 """Objects representing API generators to MediaWiki site."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import heapq
 import itertools
 import typing
-from collections.abc import Callable, Generator, Iterable
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
 from contextlib import suppress
 from itertools import zip_longest
 from typing import Any
 
 import pywikibot
 from pywikibot.backports import batched
-from pywikibot.data import api
+from pywikibot.data import api, revisionstore
 from pywikibot.exceptions import (
     APIError,
     Error,
@@ -35,6 +38,7 @@ from pywikibot.tools import (
     is_ip_address,
 )
 from pywikibot.tools.itertools import filter_unique, union_generators
+from pywikibot.tools.threading import prefetch_map
 
 
 if typing.TYPE_CHECKING:
@@ -133,6 +137,7 @@ class GeneratorsMixin:
         categories: bool = False,
         content: bool = True,
         quiet: bool = True,
+        prefetch: int = 0,
     ) -> Generator[pywikibot.Page]:
         """Return a generator to a list of preloaded pages.
 
@@ -140,6 +145,13 @@ class GeneratorsMixin:
         pagelist. In case of duplicates in a groupsize batch, return the
         first entry.
 
+        With *prefetch* the next batches are retrieved by a background
+        thread while the caller processes the pages of the current
+        batch. At most *prefetch* batches are held in advance.
+
+        .. note:: A page which occurs in several batches may be reloaded
+           by the background thread while the caller still processes it.
+
         .. version-changed:: 7.6
            *content* parameter was added.
         .. version-changed:: 7.7
@@ -148,6 +160,8 @@ class GeneratorsMixin:
            *groupsize* is maxlimit by default. *quiet* parameter was
            added. No longer show the "Retrieving pages from site"
            message by default.
+        .. version-changed:: 11.8
+           *prefetch* parameter was added.
 
         :param pagelist: An iterable that returns Page objects
         :param groupsize: How many Pages to query at a time. If None
@@ -163,6 +177,107 @@ class GeneratorsMixin:
         :param content: Preload page content
         :param quiet: If True (default), do not show the "Retrieving
             pages" message
+        :param prefetch: Number of batches retrieved in advance. If 0
+            (default), the next batch is requested after all pages of
+            the current batch were consumed.
+        """
+        props = self._preload_props(templates=templates, langlinks=langlinks,
+                                    pageprops=pageprops,
+                                    categories=categories)
+        groupsize_ = min(groupsize or self.maxlimit, self.maxlimit)
+        batches = batched(pagelist, groupsize_)
+        if prefetch < 1:
+            for batch in batches:
+                yield from self._preload_batch(batch, props, content=content,
+                                               quiet=quiet)
+            return
+
+        def load(batch):
+            return list(self._preload_batch(batch, props, content=content,
+                                            quiet=quiet))
+
+        for pages in prefetch_map(load, batches, depth=prefetch):
+            yield from pages
+
+    async def apreloadpages(
+        self,
+        pagelist: Iterable[pywikibot.Page],
+        *,
+        groupsize: int | None = None,
+        concurrency: int = 4,
+        templates: bool = False,
+        langlinks: bool = False,
+        pageprops: bool = False,
+        categories: bool = False,
+        content: bool = True,
+        quiet: bool = True,
+    ) -> AsyncGenerator[pywikibot.Page]:
+        """Asynchronously iterate preloaded pages.
+
+        This is the asynchronous counterpart of :meth:`preloadpages`.
+        Up to *concurrency* batches of *groupsize* pages are requested
+        at the same time; pages are iterated in the same order as in
+        the underlying pagelist. Requests are sent by
+        :meth:`Request.asubmit()<data.api.Request.asubmit>` and respect
+        the site :class:`throttle<throttle.Throttle>` and maxlag
+        settings.
+
+        **Example:**
+
+        >>> import asyncio
+        >>> site = pywikibot.Site('wikipedia:test')
+        >>> pages = [pywikibot.Page(site, title) for title in ('Foo', 'Bar')]
+        >>> async def titles():
+        ...     return [p.title() async for p in site.apreloadpages(pages)]
+        >>> asyncio.run(titles())
+        ['Foo', 'Bar']
+
+        .. version-added:: 11.8
+
+        :param pagelist: An iterable that returns Page objects. It is
+            consumed in the event loop thread and should not block.
+        :param concurrency: Maximum number of batches in flight
+        :param groupsize: How many Pages to query at a time
+        :param templates: Preload transcluded pages
+        :param langlinks: Preload all language links
+        :param pageprops: Preload various properties defined in page
+            content
+        :param categories: Preload page categories
+        :param content: Preload page content
+        :param quiet: If True (default), do not show the "Retrieving
+            pages" message
+        """
+        props = self._preload_props(templates=templates, langlinks=langlinks,
+                                    pageprops=pageprops,
+                                    categories=categories)
+        groupsize_ = min(groupsize or self.maxlimit, self.maxlimit)
+
+        def load(batch):
+            return list(self._preload_batch(batch, props, content=content,
+                                            quiet=quiet))
+
+        pending: deque[asyncio.Future[list[pywikibot.Page]]] = deque()
+        try:
+            for batch in batched(pagelist, groupsize_):
+                pending.append(
+                    asyncio.ensure_future(asyncio.to_thread(load, batch)))
+                if len(pending) >= max(concurrency, 1):
+                    for page in await pending.popleft():
+                        yield page
+
+            while pending:
+                for page in await pending.popleft():
+                    yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _preload_props(*, templates: bool, langlinks: bool,
+                       pageprops: bool, categories: bool) -> str:
+        """Return the prop parameter for preloading pages.
+
+        .. version-added:: 11.8
         """
         props = 'revisions|info|categoryinfo'
         if templates:
@@ -173,78 +288,178 @@ class GeneratorsMixin:
             props += '|pageprops'
         if categories:
             props += '|categories'
+        return props
 
-        groupsize_ = min(groupsize or self.maxlimit, self.maxlimit)
-        for batch in batched(pagelist, groupsize_):
-            # Do not use p.pageid property as it will force page loading.
-            pageids = [str(p._pageid) for p in batch
-                       if hasattr(p, '_pageid') and p._pageid > 0]
-            cache: dict[str, tuple[int, pywikibot.Page]] = {}
-            # In case of duplicates, return the first entry.
-            for priority, page in enumerate(batch):
-                try:
-                    cache.setdefault(page.title(with_section=False),
-                                     (priority, page))
-                except InvalidTitleError:
-                    pywikibot.exception()
-
-            prio_queue: list[tuple[int, pywikibot.Page]] = []
-            next_prio = 0
-            rvgen = api.PropertyGenerator(props, site=self)
-            rvgen.set_maximum_items(-1)  # suppress use of "rvlimit" parameter
+    def _preload_batch(
+        self,
+        batch: Iterable[pywikibot.Page],
+        props: str,
+        *,
+        content: bool,
+        quiet: bool,
+    ) -> Generator[pywikibot.Page]:
+        """Preload a single batch of pages and yield them in order.
 
-            if len(pageids) == len(batch) \
-               and len(set(pageids)) <= self.maxlimit:
-                # only use pageids if all pages have them
-                rvgen.request['pageids'] = set(pageids)
-            else:
-                rvgen.request['titles'] = list(cache.keys())
-            rvgen.request['rvprop'] = self._rvprops(content=content)
-            if not quiet:
-                pywikibot.info(f'Retrieving {len(cache)} pages from {self}.')
+        Helper method for :meth:`preloadpages`. If the
+        :mod:`revision store<pywikibot.data.revisionstore>` is enabled,
+        pages with a known latest revision id whose text is stored are
+        loaded without content first. Their text is taken from the
+        store unless the page was changed meanwhile.
 
-            for pagedata in rvgen:
-                pywikibot.debug(f'Preloading {pagedata}')
-                try:
-                    if (pd_title := pagedata['title']) not in cache:
-                        # API always returns a "normalized" title which is
-                        # usually the same as the canonical form returned by
-                        # page.title(), but sometimes not (e.g.,
-                        # gender-specific localizations of "User" namespace).
-                        # This checks to see if there is a normalized title in
-                        # the response that corresponds to the canonical form
-                        # used in the query.
-                        for key, value in cache.items():
-                            if self.sametitle(key, pd_title):
-                                cache[pd_title] = value
-                                break
-                        else:
-                            pywikibot.warning('preloadpages: Query returned '
-                                              f'unexpected title {pd_title!r}')
-                            continue
-
-                except KeyError:
-                    pywikibot.debug(f"No 'title' in {pagedata}\n"
-                                    f'{pageids=!s}\n'
-                                    f'titles={list(cache.keys())}')
-                    continue
+        .. version-added:: 11.8
+        """
+        store = revisionstore.get_store() if content else None
+        if store is None:
+            yield from self._preload_request(batch, props, content=content,
+                                             quiet=quiet)
+            return
 
-                priority, page = cache[pagedata['title']]
-                api.update_page(page, pagedata, rvgen.props)
-                priority, page = heapq.heappushpop(prio_queue,
-                                                   (priority, page))
-                # Smallest priority matches expected one; yield.
-                if priority == next_prio:
-                    yield page
-                    next_prio += 1
+        batch = list(batch)
+        texts = store.get(self, {page._revid for page in batch
+                                 if hasattr(page, '_revid')})
+        stored = [page for page in batch
+                  if getattr(page, '_revid', None) in texts]
+        others = [page for page in batch
+                  if getattr(page, '_revid', None) not in texts]
+
+        pages = []
+        if stored:
+            for page in self._preload_request(stored, props, content=False,
+                                              quiet=quiet, texts=texts):
+                if page._latest_cached_revision() is None:
+                    others.append(page)  # changed since it was stored
                 else:
-                    # Push back onto the heap.
-                    heapq.heappush(prio_queue, (priority, page))
+                    pages.append(page)
+        if others:
+            loaded = list(self._preload_request(others, props, content=True,
+                                                quiet=quiet))
+            self._store_revisions(store, (page._latest_cached_revision()
+                                          for page in loaded))
+            pages += loaded
+
+        order: dict[int, int] = {}
+        for priority, page in enumerate(batch):
+            order.setdefault(id(page), priority)
+        yield from sorted(pages, key=lambda page: order[id(page)])
+
+    def _preload_request(
+        self,
+        batch: Iterable[pywikibot.Page],
+        props: str,
+        *,
+        content: bool,
+        quiet: bool,
+        texts: dict[int, str] | None = None,
+    ) -> Generator[pywikibot.Page]:
+        """Request a single batch of pages and yield them in order.
 
-            # Empty the heap.
-            while prio_queue:
-                priority, page = heapq.heappop(prio_queue)
+        Helper method for :meth:`_preload_batch`.
+
+        .. version-added:: 11.8
+
+        :param texts: stored revision texts which are restored for the
+            loaded revisions
+        """
+        # Do not use p.pageid property as it will force page loading.
+        pageids = [str(p._pageid) for p in batch
+                   if hasattr(p, '_pageid') and p._pageid > 0]
+        cache: dict[str, tuple[int, pywikibot.Page]] = {}
+        # In case of duplicates, return the first entry.
+        for priority, page in enumerate(batch):
+            try:
+                cache.setdefault(page.title(with_section=False),
+                                 (priority, page))
+            except InvalidTitleError:
+                pywikibot.exception()
+
+        prio_queue: list[tuple[int, pywikibot.Page]] = []
+        next_prio = 0
+        rvgen = api.PropertyGenerator(props, site=self)
+        rvgen.set_maximum_items(-1)  # suppress use of "rvlimit" parameter
+
+        if len(pageids) == len(batch) \
+           and len(set(pageids)) <= self.maxlimit:
+            # only use pageids if all pages have them
+            rvgen.request['pageids'] = set(pageids)
+        else:
+            rvgen.request['titles'] = list(cache.keys())
+        rvgen.request['rvprop'] = self._rvprops(content=content)
+        if not quiet:
+            pywikibot.info(f'Retrieving {len(cache)} pages from {self}.')
+
+        for pagedata in rvgen:
+            pywikibot.debug(f'Preloading {pagedata}')
+            try:
+                if (pd_title := pagedata['title']) not in cache:
+                    # API always returns a "normalized" title which is
+                    # usually the same as the canonical form returned by
+                    # page.title(), but sometimes not (e.g.,
+                    # gender-specific localizations of "User" namespace).
+                    # This checks to see if there is a normalized title in
+                    # the response that corresponds to the canonical form
+                    # used in the query.
+                    for key, value in cache.items():
+                        if self.sametitle(key, pd_title):
+                            cache[pd_title] = value
+                            break
+                    else:
+                        pywikibot.warning('preloadpages: Query returned '
+                                          f'unexpected title {pd_title!r}')
+                        continue
+
+            except KeyError:
+                pywikibot.debug(f"No 'title' in {pagedata}\n"
+                                f'{pageids=!s}\n'
+                                f'titles={list(cache.keys())}')
+                continue
+
+            priority, page = cache[pagedata['title']]
+            if texts:
+                self._restore_revisions(pagedata, texts)
+            api.update_page(page, pagedata, rvgen.props)
+            priority, page = heapq.heappushpop(prio_queue,
+                                               (priority, page))
+            # Smallest priority matches expected one; yield.
+            if priority == next_prio:
                 yield page
+                next_prio += 1
+            else:
+                # Push back onto the heap.
+                heapq.heappush(prio_queue, (priority, page))
+
+        # Empty the heap.
+        while prio_queue:
+            priority, page = heapq.heappop(prio_queue)
+            yield page
+
+    @staticmethod
+    def _restore_revisions(pagedata: dict[str, Any],
+                           texts: dict[int, str]) -> None:
+        """Add stored texts to the revisions of a query result.
+
+        A text is only added if its SHA-1 matches the revision.
+
+        .. version-added:: 11.8
+        """
+        for rev in pagedata.get('revisions', []):
+            text = texts.get(rev['revid'])
+            if text is not None and rev.get('sha1') == hashlib.sha1(
+                    text.encode('utf-8')).hexdigest():
+                rev.setdefault('slots', {}).setdefault('main', {})['*'] = text
+
+    def _store_revisions(
+        self,
+        store: revisionstore.RevisionStore,
+        revisions: Iterable[pywikibot.page.Revision | None],
+    ) -> None:
+        """Store the texts of loaded revisions.
+
+        .. version-added:: 11.8
+        """
+        texts = {rev.revid: rev.text for rev in revisions
+                 if rev is not None and rev.text is not None}
+        if texts:
+            store.set(self, texts)
 
     def pagebacklinks(
         self,
@@ -804,6 +1019,20 @@ class GeneratorsMixin:
         """
         latest = all(val is None for val in kwargs.values())
 
+        store = None
+        if content and section is None:
+            store = revisionstore.get_store()
+        if store is not None and latest and hasattr(page, '_revid'):
+            # the latest revision text might be stored already
+            texts = store.get(self, [page._revid])
+            if texts:
+                props = self._preload_props(templates=False, langlinks=False,
+                                            pageprops=False, categories=False)
+                list(self._preload_request([page], props, content=False,
+                                           quiet=True, texts=texts))
+                if page._latest_cached_revision() is not None:
+                    return
+
         revids = kwargs.get('revids')
         startid = kwargs.get('startid')
         starttime = kwargs.get('starttime')
@@ -890,6 +1119,10 @@ class GeneratorsMixin:
             if 'missing' in pagedata:
                 raise NoPageError(page)
             api.update_page(page, pagedata, rvgen.props)
+            if store is not None:
+                self._store_revisions(store, (
+                    page._revisions[rev['revid']]
+                    for rev in pagedata.get('revisions', [])))
 
     def pagelanglinks(
         self,
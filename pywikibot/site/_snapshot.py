@@ -0,0 +1,244 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Warm-start snapshots of the bootstrap metadata of a site.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import os
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pywikibot
+from pywikibot import config
+from pywikibot.data import api
+from pywikibot.site._interwikimap import _InterwikiMap
+from pywikibot.site._namespace import NamespacesDict
+from pywikibot.tools import MediaWikiVersion
+
+
+if TYPE_CHECKING:
+    from pywikibot.site import APISite
+
+
+__all__ = ('SiteSnapshot', )
+
+
+class SiteSnapshot:
+
+    """Snapshot of the siteinfo and API parameter information of a site.
+
+    Creating a usable :class:`APISite<pywikibot.site.APISite>` needs
+    several siteinfo properties, the interwiki map and the parameter
+    information of the bootstrap API modules. Each of them is a cached
+    request or an API call. A snapshot holds all of them in a single
+    compressed JSON file which is read once when the site is created:
+
+    .. code-block:: python
+
+       snapshot = SiteSnapshot(site)
+       if not snapshot.load():
+           snapshot.build()  # retrieve the data and save the snapshot
+       snapshot.start_revalidation()
+
+    The snapshot is used by :class:`APISite<pywikibot.site.APISite>` if
+    :attr:`config.site_snapshots` is set. It is revalidated in a
+    background thread with a single siteinfo request. If the MediaWiki
+    version has changed the parameter information is retrieved again
+    when it is used and the next snapshot contains the new one.
+
+    .. note:: :attr:`userinfo<pywikibot.site.APISite.userinfo>` is not
+       part of the snapshot; it depends on the login session which is
+       restored when the site is created.
+
+    :param site: the site of the snapshot
+    """
+
+    #: format version of the snapshot file
+    VERSION = 1
+
+    #: siteinfo properties which are always part of a snapshot
+    properties = (
+        'extensions',
+        'general',
+        'interwikimap',
+        'magicwords',
+        'namespacealiases',
+        'namespaces',
+    )
+
+    def __init__(self, site: APISite) -> None:
+        """Initializer."""
+        self.site = site
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({self.site!r})'
+
+    @staticmethod
+    def directory() -> Path:
+        """Return the directory of the snapshot files."""
+        return Path(config.base_dir, 'snapshots')
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the snapshot file."""
+        return self.directory() / (f'{self.site.family.name}-'
+                                   f'{self.site.code}.json.gz')
+
+    def load(self) -> bool:
+        """Load the snapshot into the site.
+
+        Siteinfo properties and API modules which are already loaded are
+        kept.
+
+        :return: whether a valid snapshot was loaded
+        """
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            pywikibot.log(f'Could not read {self}: {e!r}')
+            return False
+
+        if data.get('version') != self.VERSION \
+           or data.get('site') != self.site.sitename:
+            pywikibot.log(f'{self} is outdated or belongs to another site')
+            return False
+
+        cache = self.site._siteinfo._cache
+        for prop, (value, timestamp) in data['siteinfo'].items():
+            cache.setdefault(prop, (value, pywikibot.Timestamp.fromtimestamp(
+                timestamp, datetime.timezone.utc)))
+
+        if data['paraminfo']:
+            try:
+                self.site._paraminfo.update(data['paraminfo'])
+            except (AssertionError, KeyError, RuntimeError,
+                    ValueError) as e:
+                pywikibot.log(f'Could not load paraminfo of {self}: {e!r}')
+                self.site._paraminfo = api.ParamInfo(self.site)
+
+        pywikibot.debug(f'{self} loaded')
+        return True
+
+    def save(self) -> None:
+        """Write the currently loaded data of the site to the snapshot.
+
+        The file is replaced atomically; concurrent bots read either the
+        old or the new snapshot.
+        """
+        utc = datetime.timezone.utc
+        siteinfo = {
+            # cache times without timezone are UTC
+            prop: (value, cache_time.replace(
+                tzinfo=cache_time.tzinfo or utc).timestamp())
+            for prop, (value, cache_time)
+            in list(self.site._siteinfo._cache.items())
+            if cache_time  # skip default values
+        }
+        paraminfo = self.site._paraminfo
+        data = {
+            'version': self.VERSION,
+            'site': self.site.sitename,
+            'siteinfo': siteinfo,
+            'paraminfo': dict(paraminfo._paraminfo)
+            if 'query' in paraminfo._modules else {},
+        }
+
+        path = self.path
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp, path)
+        finally:
+            with suppress(FileNotFoundError):
+                tmp.unlink()
+
+    def build(self) -> None:
+        """Retrieve all snapshot data from the site and save it.
+
+        The siteinfo properties are retrieved with one request.
+        """
+        siteinfo = self.site._siteinfo
+        props = [prop for prop in self.properties
+                 if not siteinfo.is_cached(prop)]
+        if props:
+            siteinfo._cache.update(siteinfo._get_siteinfo(props, False))
+        self.site._paraminfo.fetch(())  # initialize ParamInfo
+        self.save()
+
+    def revalidate(self) -> set[str]:
+        """Refresh the siteinfo with a single request and save it.
+
+        Data derived from changed properties is replaced: the
+        namespaces, the interwiki map and, if the MediaWiki version has
+        changed, the API parameter information. The site may be used by
+        other threads meanwhile; the new data is built first and swapped
+        in by single assignments, so no attribute is missing at any
+        time.
+
+        :return: the changed siteinfo properties
+        """
+        site = self.site
+        cache = site._siteinfo._cache
+        props = set(self.properties).union(
+            prop for prop, (_, cache_time) in list(cache.items())
+            if cache_time)
+        fresh = site._siteinfo._get_siteinfo(sorted(props), 0)
+
+        changed = set()
+        for prop, (value, _) in fresh.items():
+            old = cache.get(prop, (None, None))[0]
+            if prop == 'general':
+                # 'general' contains the current time; compare the version
+                old = old and old.get('generator')
+                value = value.get('generator')
+            if old != value:
+                changed.add(prop)
+        cache.update(fresh)
+
+        if changed:
+            pywikibot.log(f'{self}: siteinfo {sorted(changed)} changed')
+        if 'general' in changed:
+            site._paraminfo = api.ParamInfo(site)
+            site._mw_version_time = (MediaWikiVersion(site.version()),
+                                     time.time())
+        if changed & {'namespaces', 'namespacealiases'}:
+            site._namespaces = NamespacesDict(site._build_namespaces())
+        if 'interwikimap' in changed:
+            site._interwikimap = _InterwikiMap(site)
+
+        self.save()
+        return changed
+
+    def _revalidate(self) -> None:
+        """Revalidate the snapshot and log errors."""
+        try:
+            self.revalidate()
+        except Exception as e:
+            pywikibot.log(f'Could not revalidate {self}: {e!r}')
+
+    def start_revalidation(self) -> threading.Thread:
+        """Revalidate the snapshot in a background thread.
+
+        :return: the started daemon thread
+        """
+        thread = threading.Thread(target=self._revalidate, daemon=True,
+                                  name=f'Snapshot-{self.site.sitename}')
+        thread.start()
+        return thread
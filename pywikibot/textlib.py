@@ -9,12 +9,23 @@ from __future__ import annotations
 import itertools
 import re
 import sys
+import threading
+from bisect import bisect_right
 from collections import OrderedDict
-from collections.abc import Callable, Container, Iterable, Mapping, Sequence
-from contextlib import closing, suppress
+from collections.abc import (
+    Callable,
+    Container,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from contextlib import closing, contextmanager, suppress
 from dataclasses import dataclass
+from functools import cache
 from html.parser import HTMLParser
-from typing import NamedTuple
+from types import ModuleType
+from typing import Any, NamedTuple
 
 import pywikibot
 from pywikibot.backports import pairwise
@@ -26,15 +37,6 @@ from pywikibot.tools.chars import INVISIBLE_REGEX
 from pywikibot.userinterfaces.transliteration import NON_ASCII_DIGITS
 
 
-try:
-    import wikitextparser
-except ModuleNotFoundError:
-    try:
-        import mwparserfromhell as wikitextparser
-    except ModuleNotFoundError as e:
-        wikitextparser = e
-
-
 # cache for replaceExcept to avoid recompile or regexes each call
 _regex_cache: dict[str, re.Pattern[str]] = {}
 
@@ -375,6 +377,83 @@ def get_regexes(
     return result
 
 
+class _ExceptionFinder:
+
+    """Find the next exception match for :func:`replaceExcept`.
+
+    The next match of every exception regex is remembered together with
+    the position it was searched from. It is the result of any later
+    search from a position up to its start, so each regex is searched
+    again only when this match was passed. After a replacement, matches
+    behind the replaced text are moved instead of being searched again.
+    Without look-behind assertions, a match attempt sees at most one
+    character in front of it, e.g. for ``\\b`` or ``^``. Regexes with
+    look-behind assertions are always searched again after a
+    replacement.
+
+    .. version-added:: 11.8
+    """
+
+    #: look-behind assertion in a regex pattern
+    LOOKBEHIND = re.compile(r'\(\?<[=!]')
+
+    def __init__(self, regexes: list[re.Pattern[str]]) -> None:
+        """Initializer."""
+        self.regexes = regexes
+        #: whether the regex may see more than one character in front
+        self.lookbehind = [bool(self.LOOKBEHIND.search(regex.pattern))
+                           for regex in regexes]
+        #: position each regex was searched from, None if not searched
+        self.positions: list[int | None] = [None] * len(regexes)
+        #: span of the next match of each regex, None if there is none
+        self.spans: list[tuple[int, int] | None] = [None] * len(regexes)
+
+    def next(self, text: str, index: int) -> tuple[int, int] | None:
+        """Return the span of the first exception match from *index*.
+
+        If several matches start at the same position, the span of the
+        first regex is returned.
+        """
+        result = None
+        for i, regex in enumerate(self.regexes):
+            pos, span = self.positions[i], self.spans[i]
+            if pos is None or pos > index \
+               or span is not None and span[0] < index:
+                match = regex.search(text, index)
+                span = match.span() if match else None
+                self.positions[i], self.spans[i] = index, span
+
+            if span is not None and (result is None or span[0] < result[0]):
+                result = span
+        return result
+
+    def replaced(self, text: str, start: int, end: int, length: int) -> None:
+        """Update matches after *text[start:end]* was replaced.
+
+        Matches which start behind the replaced text are kept and moved.
+        A regex must be searched again if its match does not start
+        behind the replacement, if it matches directly behind it or if
+        it has a look-behind assertion, because these see the new text.
+
+        :param text: the new text
+        :param length: length of the replacement
+        """
+        delta = length - (end - start)
+        for i, regex in enumerate(self.regexes):
+            pos, span = self.positions[i], self.spans[i]
+            if pos is None:
+                continue
+
+            if pos > start or self.lookbehind[i] \
+               or span is not None and span[0] <= end \
+               or regex.match(text, start + length):
+                self.positions[i] = None
+            else:
+                self.positions[i] = start + length
+                if span is not None:
+                    self.spans[i] = span[0] + delta, span[1] + delta
+
+
 def replaceExcept(text: str,
                   old: str | re.Pattern[str],
                   new: str | Callable[[re.Match[str]], str],
@@ -415,7 +494,7 @@ def replaceExcept(text: str,
     if not old.search(text):
         return text + marker
 
-    dontTouchRegexes = get_regexes(exceptions, site)
+    exception_finder = _ExceptionFinder(get_regexes(exceptions, site))
 
     index = 0
     replaced = 0
@@ -430,19 +509,12 @@ def replaceExcept(text: str,
             break
 
         # check which exception will occur next.
-        nextExceptionMatch = None
-        for dontTouchR in dontTouchRegexes:
-            excMatch = dontTouchR.search(text, index)
-            if excMatch and (
-                    nextExceptionMatch is None
-                    or excMatch.start() < nextExceptionMatch.start()):
-                nextExceptionMatch = excMatch
-
-        if nextExceptionMatch is not None \
-                and nextExceptionMatch.start() <= match.start():
+        next_exception = exception_finder.next(text, index)
+        if next_exception is not None \
+                and next_exception[0] <= match.start():
             # an HTML comment or text in nowiki tags stands before the next
             # valid match. Skip.
-            index = nextExceptionMatch.end()
+            index = next_exception[1]
             continue
 
         # We found a valid match. Replace it.
@@ -481,6 +553,8 @@ def replaceExcept(text: str,
             replacement += new[last:]
 
         text = text[:match.start()] + replacement + text[match.end():]
+        exception_finder.replaced(text, match.start(), match.end(),
+                                  len(replacement))
 
         # continue the search on the remaining text
         if allowoverlap:
@@ -498,6 +572,216 @@ def replaceExcept(text: str,
     return text[:markerpos] + marker + text[markerpos:]
 
 
+class _ParsedText:
+
+    """Parse results of a wikitext which are shared by textlib functions.
+
+    .. version-added:: 11.8
+    """
+
+    __slots__ = ('spans', 'stripped', 'tree')
+
+    def __init__(self) -> None:
+        """Initializer."""
+        #: texts without disabled parts by tags and site
+        self.stripped: dict[tuple[Any, Any], str] = {}
+        #: start and end offsets of disabled parts by tags
+        self.spans: dict[tuple[Any, ...], tuple[list[int], list[int]]] = {}
+        #: parsed document of the wikitext parser package
+        self.tree: Any = None
+
+
+class WikitextCache:
+
+    """Bounded cache of parse results of wikitexts.
+
+    Textlib functions are often called several times with the same
+    text, e.g. if a bot reads the categories, language links, sections
+    and templates of a page. With this cache they share the results of
+    :func:`removeDisabledParts`, the disabled parts found by
+    :func:`isDisabled` and the document parsed by
+    :func:`extract_templates_and_params`. The text itself is the key;
+    the least recently used texts are dropped above *maxsize* entries.
+    Texts shorter than :attr:`min_length` are cheap to parse and not
+    cached.
+
+    The module cache :data:`wikitext_cache` is enabled by the
+    ``wikitext_cache_size`` config setting or temporarily for the
+    current thread with :meth:`enabled`:
+
+    >>> cache = WikitextCache(maxsize=2)
+    >>> text = 'foo <!-- bar --> baz' * 100
+    >>> parsed = cache.lookup(text)
+    >>> cache.lookup(text) is parsed
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+    >>> cache.lookup('foo') is None
+    True
+
+    .. version-added:: 11.8
+
+    :param maxsize: the maximum number of texts; the
+        ``wikitext_cache_size`` config setting is used if None
+    """
+
+    #: minimum length of cached texts
+    min_length = 1000
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        """Initializer."""
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, _ParsedText] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        """Return the number of cached texts."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return (f'{type(self).__name__}({self.maxsize}): {len(self)} texts, '
+                f'{self.hits} hits, {self.misses} misses')
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of texts; 0 disables the cache."""
+        maxsize = getattr(self._local, 'maxsize', 0)
+        if self._maxsize is None:
+            return max(maxsize, pywikibot.config.wikitext_cache_size)
+        return max(maxsize, self._maxsize)
+
+    @contextmanager
+    def enabled(self, maxsize: int = 4) -> Generator[None]:
+        """Enable the cache in the current thread within a context.
+
+        A larger *maxsize* of the cache is kept. Entries which were
+        added are dropped when the cache is disabled afterwards.
+
+        >>> cache = WikitextCache(maxsize=0)
+        >>> text = 'foo' * 500
+        >>> with cache.enabled():
+        ...     cache.lookup(text) is cache.lookup(text)
+        True
+        >>> len(cache), cache.lookup(text)
+        (0, None)
+
+        :param maxsize: the minimal number of texts within the context
+        """
+        previous = getattr(self._local, 'maxsize', 0)
+        self._local.maxsize = max(previous, maxsize)
+        try:
+            yield
+        finally:
+            self._local.maxsize = previous
+            if self.maxsize <= 0:
+                with self._lock:
+                    self._data.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of hits to all lookups."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def lookup(self, text: str) -> _ParsedText | None:
+        """Return the parse results of a text and count the lookup.
+
+        An empty entry is added if the text is not cached yet.
+
+        :return: the parse results or None if the text is not cached
+            because the cache is disabled or the text is too short
+        """
+        maxsize = self.maxsize
+        if maxsize <= 0 or len(text) < self.min_length:
+            return None
+
+        with self._lock:
+            parsed = self._data.get(text)
+            if parsed is None:
+                self.misses += 1
+                parsed = self._data[text] = _ParsedText()
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+            else:
+                self.hits += 1
+                self._data.move_to_end(text)
+            return parsed
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+#: Parse results shared by textlib functions, see :class:`WikitextCache`
+wikitext_cache = WikitextCache()
+
+
+def _disabled_tags(tags: Iterable | None,
+                   include: Container | None = None) -> list:
+    """Return the tags of disabled parts used by removeDisabledParts.
+
+    .. version-added:: 11.8
+    """
+    if not tags:
+        tags = ['comment', 'includeonly', 'nowiki', 'pre', 'syntaxhighlight']
+    # avoid set(tags) because sets are internally ordered using the hash
+    # which for strings is salted per Python process => the output of
+    # this function would likely be different per script run because
+    # the replacements would be done in different order and the disabled
+    # parts may overlap and suppress each other
+    # see https://docs.python.org/3/reference/datamodel.html#object.__hash__
+    # ("Note" at the end of the section)
+    if include:
+        return [tag for tag in tags if tag not in include]
+    return list(tags)
+
+
+def _disabled_spans(text: str, tags: list) -> tuple[list[int], list[int]]:
+    """Return the offsets of the parts removed by removeDisabledParts.
+
+    The parts are removed in the order of *tags* like
+    :func:`removeDisabledParts` does. Overlapping parts are merged.
+
+    .. version-added:: 11.8
+
+    :return: sorted start offsets and the corresponding end offsets
+    """
+    positions = list(range(len(text)))  # original offsets of text
+    spans = []
+    for regex in get_regexes(tags):
+        chunks: list[str] = []
+        offsets: list[int] = []
+        last = 0
+        for match in regex.finditer(text):
+            start, end = match.span()
+            if start == end:
+                continue
+            spans.append((positions[start], positions[end - 1] + 1))
+            chunks.append(text[last:start])
+            offsets += positions[last:start]
+            last = end
+        if last:
+            chunks.append(text[last:])
+            text = ''.join(chunks)
+            positions = offsets + positions[last:]
+
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in sorted(spans):
+        if ends and start < ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
 def removeDisabledParts(text: str,
                         tags: Iterable | None = None,
                         include: Container | None = None,
@@ -516,6 +800,9 @@ def removeDisabledParts(text: str,
     .. version-changed:: 7.0
        the order of removals will correspond to the tags argument
        if provided as an ordered collection (list, tuple)
+    .. version-changed:: 11.8
+       the result is cached by :data:`wikitext_cache` if the
+       ``wikitext_cache_size`` config setting is set.
 
     :param tags: The exact set of parts which should be removed using
         keywords from :func:`get_regexes`.
@@ -525,21 +812,18 @@ def removeDisabledParts(text: str,
         disabled parts listed above do not need it.
     :return: Text stripped from disabled parts.
     """
-    if not tags:
-        tags = ['comment', 'includeonly', 'nowiki', 'pre', 'syntaxhighlight']
-    # avoid set(tags) because sets are internally ordered using the hash
-    # which for strings is salted per Python process => the output of
-    # this function would likely be different per script run because
-    # the replacements would be done in different order and the disabled
-    # parts may overlap and suppress each other
-    # see https://docs.python.org/3/reference/datamodel.html#object.__hash__
-    # ("Note" at the end of the section)
-    if include:
-        tags = [tag for tag in tags if tag not in include]
-    regexes = get_regexes(tags, site)
-    for regex in regexes:
-        text = regex.sub('', text)
-    return text
+    tags = _disabled_tags(tags, include)
+    parsed = wikitext_cache.lookup(text)
+    key = (tuple(tags), site)
+    if parsed is not None and key in parsed.stripped:
+        return parsed.stripped[key]
+
+    stripped = text
+    for regex in get_regexes(tags, site):
+        stripped = regex.sub('', stripped)
+    if parsed is not None:
+        parsed.stripped[key] = stripped
+    return stripped
 
 
 def removeHTMLParts(text: str,
@@ -750,11 +1034,29 @@ def isDisabled(text: str, index: int, tags=None) -> bool:
     """Return True if text[index] is disabled, e.g. by a comment or nowiki tag.
 
     For the tags parameter, see :py:obj:`removeDisabledParts`.
+
+    .. version-changed:: 11.8
+       the disabled parts of the text are cached by
+       :data:`wikitext_cache` if it is enabled. Indexes outside of
+       them are not disabled and need no further search.
     """
+    parsed = wikitext_cache.lookup(text)
+    if parsed is not None:
+        tags = _disabled_tags(tags)
+        key = tuple(tags)
+        spans = parsed.spans.get(key)
+        if spans is None:
+            spans = parsed.spans[key] = _disabled_spans(text, tags)
+        starts, ends = spans
+        i = bisect_right(starts, index) - 1
+        if i < 0 or index > ends[i]:
+            return False
+
     # Find a marker that is not already in the text.
     marker = findmarker(text)
     text = text[:index] + marker + text[index:]
-    text = removeDisabledParts(text, tags)
+    for regex in get_regexes(_disabled_tags(tags)):
+        text = regex.sub('', text)
     return marker not in text
 
 
@@ -2054,6 +2356,9 @@ def extract_templates_and_params(
        *mwparserfromhell* is strictly recommended.
     .. version-changed:: 11.1
        Raise ModuleNotFoundError if no wikitext parser is installed.
+    .. version-changed:: 11.8
+       the parsed text is cached by :data:`wikitext_cache` if the
+       ``wikitext_cache_size`` config setting is set.
 
     :param text: The wikitext from which templates are extracted
     :param remove_disabled_parts: If enabled, remove disabled wikitext
@@ -2069,6 +2374,7 @@ def extract_templates_and_params(
             attr = not param.positional
         return attr
 
+    wikitextparser = _wikitext_parser()
     if isinstance(wikitextparser, Exception):
         raise wikitextparser
 
@@ -2079,7 +2385,13 @@ def extract_templates_and_params(
     pywikibot.debug(f'Using {parser_name!r} wikitext parser')
 
     result = []
-    parsed = wikitextparser.parse(text)
+    cached = wikitext_cache.lookup(text)
+    if cached is None:
+        parsed = wikitextparser.parse(text)
+    else:
+        if cached.tree is None:
+            cached.tree = wikitextparser.parse(text)
+        parsed = cached.tree
     if parser_name == 'wikitextparser':
         templates = parsed.templates
         arguments = 'arguments'
@@ -2471,5 +2783,35 @@ class TimeStripper:
         return timestamp
 
 
+@cache
+def _wikitext_parser() -> ModuleType | ModuleNotFoundError:
+    """Import the wikitext parser package on first use.
+
+    *wikitextparser* is preferred over *mwparserfromhell*.
+
+    .. version-added:: 11.8
+
+    :return: the parser package or the exception if none is installed
+    """
+    try:
+        import wikitextparser
+    except ModuleNotFoundError:
+        try:
+            import mwparserfromhell as wikitextparser
+        except ModuleNotFoundError as e:
+            return e
+    return wikitextparser
+
+
+def __getattr__(name: str) -> Any:
+    """Return the lazily imported *wikitextparser* module attribute.
+
+    .. version-added:: 11.8
+    """
+    if name == 'wikitextparser':
+        return _wikitext_parser()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 wrapper = ModuleDeprecationWrapper(__name__)
 wrapper.add_deprecated_attr('to_latin_digits', to_ascii_digits, since='10.3.0')
@@ -9,18 +9,25 @@ This module defines the :class:`Throttle` class, which ensures that
 automated access to wiki servers adheres to responsible rate limits. It
 avoids overloading the servers by introducing configurable delays
 between requests, and coordinates these limits across processes using a
-shared control file ``throttle.ctrl``.
+shared process registry.
 
 It supports both read and write throttling, automatic adjustment based
 on the number of concurrent bot instances, and optional lag-aware delays.
+
+.. version-changed:: 11.8
+   Running processes are registered in a SQLite database by default;
+   see :class:`SQLiteRegistry` and :class:`TextFileRegistry`.
 """
 from __future__ import annotations
 
 import hashlib
 import itertools
+import sqlite3
 import threading
 import time
+from abc import ABC, abstractmethod
 from collections import Counter
+from collections.abc import Iterable, Iterator
 from contextlib import suppress
 from platform import python_implementation
 from typing import NamedTuple
@@ -51,6 +58,337 @@ class ProcEntry(NamedTuple):
     site: str
 
 
+class ProcessRegistry(ABC):
+
+    """Registry of running bot processes shared by all processes.
+
+    The registry assigns the global :data:`pid` and counts the running
+    processes per site which is used to scale the throttle delays. It
+    also holds the state of the token buckets used by the ``'bucket'``
+    :attr:`config.throttle_mode`. The default bucket implementation
+    keeps the state in memory of the current process.
+
+    .. version-added:: 11.8
+    """
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self._buckets: dict[str, float] = {}
+        self._bucket_lock = threading.Lock()
+
+    @staticmethod
+    def _reserve_slot(tat: float | None, interval: float, tolerance: float,
+                      now: float) -> tuple[float, float]:
+        """Reserve a request slot using the generic cell rate algorithm.
+
+        :param tat: theoretical arrival time of the bucket or None
+        :param interval: seconds between two requests at the
+            sustained rate
+        :param tolerance: burst tolerance in seconds
+        :param now: current timestamp
+        :return: the seconds to wait and the new theoretical arrival
+            time
+        """
+        tat = now if tat is None else max(tat, now)
+        return max(0.0, tat - tolerance - now), tat + interval
+
+    def reserve(self, key: str, interval: float, tolerance: float,
+                now: float) -> float:
+        """Reserve a request slot of the token bucket *key*.
+
+        The slot is reserved immediately; the caller has to wait the
+        returned time before sending its request.
+
+        :param key: bucket name
+        :param interval: seconds between two requests at the
+            sustained rate
+        :param tolerance: burst tolerance in seconds
+        :param now: current timestamp
+        :return: seconds to wait
+        """
+        with self._bucket_lock:
+            wait, self._buckets[key] = self._reserve_slot(
+                self._buckets.get(key), interval, tolerance, now)
+        return wait
+
+    def defer(self, key: str, until: float) -> None:
+        """Block the token bucket *key* until the given time.
+
+        :param key: bucket name
+        :param until: theoretical arrival time the bucket is set to if
+            it is earlier
+        """
+        with self._bucket_lock:
+            self._buckets[key] = max(self._buckets.get(key, 0.0), until)
+
+    @abstractmethod
+    def check_in(self, module_id: str, site: str, now: float,
+                 expiry: int) -> tuple[int, Counter[str]]:
+        """Register or refresh this process and count running processes.
+
+        The global :data:`pid` is assigned if it is not set yet.
+
+        :param module_id: hash of the running script
+        :param site: site name; if empty the process is not registered
+        :param now: timestamp of the check-in
+        :param expiry: seconds after which entries are dropped
+        :return: number of processes for *site* including this one and
+            a counter of module ids of all running processes
+        """
+
+    @abstractmethod
+    def drop(self, now: float, expiry: int) -> None:
+        """Remove all entries of this process.
+
+        :param now: current timestamp
+        :param expiry: seconds after which entries are dropped
+        """
+
+
+class TextFileRegistry(ProcessRegistry):
+
+    """Process registry stored in the ``throttle.ctrl`` text file.
+
+    Each line has the format ``module_id pid time site``. The whole file
+    is read and rewritten with every check-in.
+
+    .. version-added:: 11.8
+    """
+
+    def __init__(self, filename) -> None:
+        """Initializer.
+
+        :param filename: path of the control file
+        """
+        super().__init__()
+        self.filename = filename
+
+    def read(self, raise_exc: bool = False) -> Iterator[ProcEntry]:
+        """Yield process entries from file."""
+        try:
+            with open(self.filename) as f:
+                lines = f.readlines()
+        except OSError:
+            if raise_exc and pid:
+                raise
+            return
+
+        for line in lines:
+            # parse line; format is "module_id pid timestamp site"
+            try:
+                _id, _pid, _time, _site = line.split(' ')
+                proc_entry = ProcEntry(
+                    module_id=_id,
+                    pid=int(_pid),
+                    time=int(float(_time)),
+                    site=_site.rstrip()
+                )
+            except (IndexError, ValueError):  # pragma: no cover
+                # Sometimes the file gets corrupted ignore that line
+                continue
+            yield proc_entry
+
+    def write(self, processes: Iterable[ProcEntry]) -> None:
+        """Write process entries to file."""
+        processes = sorted(processes, key=lambda p: (p.pid, p.site))
+
+        with suppress(IOError), open(self.filename, 'w') as f:
+            f.writelines(FORMAT_LINE.format_map(p._asdict())
+                         for p in processes)
+
+    def check_in(self, module_id: str, site: str, now: float,
+                 expiry: int) -> tuple[int, Counter[str]]:
+        """Register or refresh this process and count running processes."""
+        global pid
+        processes = []
+        used_pids = set()
+        count = 1
+
+        for proc in self.read(raise_exc=True):
+            used_pids.add(proc.pid)
+            if now - proc.time > expiry:
+                continue  # process has expired, drop from file
+
+            if proc.site == site and proc.pid != pid:
+                count += 1
+
+            if proc.site != site or proc.pid != pid:
+                processes.append(proc)
+
+        free_pid = (i for i in itertools.count(start=1)
+                    if i not in used_pids)
+        if not pid:
+            pid = next(free_pid)
+
+        processes.append(
+            ProcEntry(module_id=module_id, pid=pid, time=now, site=site))
+        modules = Counter(p.module_id for p in processes)
+
+        if not site:
+            del processes[-1]
+
+        self.write(processes)
+        return count, modules
+
+    def drop(self, now: float, expiry: int) -> None:
+        """Remove all entries of this process."""
+        processes = [p for p in self.read()
+                     if now - p.time <= expiry and p.pid != pid]
+        self.write(processes)
+
+
+class SQLiteRegistry(ProcessRegistry):
+
+    """Process registry stored in a SQLite database.
+
+    Every check-in is a single transaction which refreshes the heartbeat
+    of this process and counts the processes of the site using an
+    index, so the cost does not grow with the number of running bots.
+    Token buckets are stored in the database too and are therefore
+    shared by all processes on this host.
+
+    .. version-added:: 11.8
+    """
+
+    #: seconds to wait for a lock held by another process
+    timeout = 30
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS processes (
+            pid INTEGER NOT NULL,
+            site TEXT NOT NULL,
+            module_id TEXT NOT NULL,
+            time REAL NOT NULL,
+            PRIMARY KEY (pid, site)
+        );
+        CREATE INDEX IF NOT EXISTS processes_site_time
+            ON processes (site, time);
+        CREATE TABLE IF NOT EXISTS buckets (
+            key TEXT PRIMARY KEY,
+            tat REAL NOT NULL
+        );
+    """
+
+    def __init__(self, filename) -> None:
+        """Initializer.
+
+        :param filename: path of the database file
+        :raises sqlite3.Error: the database cannot be opened
+        """
+        super().__init__()
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, timeout=self.timeout,
+                                     isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.executescript(self._schema)
+
+    def _transaction(self, func, *args):
+        """Run *func* with the connection in an immediate transaction."""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(self._conn, *args)
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+        return result
+
+    def check_in(self, module_id: str, site: str, now: float,
+                 expiry: int) -> tuple[int, Counter[str]]:
+        """Register or refresh this process and count running processes."""
+        return self._transaction(self._check_in, module_id, site, now,
+                                 expiry)
+
+    @staticmethod
+    def _check_in(conn: sqlite3.Connection, module_id: str, site: str,
+                  now: float, expiry: int) -> tuple[int, Counter[str]]:
+        """Check in within a transaction."""
+        global pid
+        conn.execute('DELETE FROM processes WHERE time < ?',
+                     (now - expiry, ))
+        if not pid:
+            pid = conn.execute(
+                'SELECT MIN(p.pid + 1) FROM'
+                ' (SELECT 0 AS pid UNION SELECT pid FROM processes) AS p'
+                ' WHERE p.pid + 1 NOT IN (SELECT pid FROM processes)'
+            ).fetchone()[0]
+
+        if site:
+            conn.execute('INSERT OR REPLACE INTO processes '
+                         '(pid, site, module_id, time) VALUES (?, ?, ?, ?)',
+                         (pid, site, module_id, now))
+
+        count = 1 + conn.execute(
+            'SELECT COUNT(*) FROM processes WHERE site = ? AND pid != ?',
+            (site, pid)).fetchone()[0]
+        modules = Counter(dict(conn.execute(
+            'SELECT module_id, COUNT(*) FROM processes GROUP BY module_id')))
+        if not site:
+            modules[module_id] += 1
+        return count, modules
+
+    def reserve(self, key: str, interval: float, tolerance: float,
+                now: float) -> float:
+        """Reserve a request slot of the shared token bucket *key*."""
+        def reserve(conn):
+            row = conn.execute('SELECT tat FROM buckets WHERE key = ?',
+                               (key, )).fetchone()
+            wait, tat = self._reserve_slot(row and row[0], interval,
+                                           tolerance, now)
+            conn.execute('INSERT OR REPLACE INTO buckets (key, tat) '
+                         'VALUES (?, ?)', (key, tat))
+            return wait
+
+        return self._transaction(reserve)
+
+    def defer(self, key: str, until: float) -> None:
+        """Block the shared token bucket *key* until the given time."""
+        self._transaction(
+            lambda conn: conn.execute(
+                'INSERT INTO buckets (key, tat) VALUES (?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET tat = MAX(tat, excluded.tat)',
+                (key, until)))
+
+    def drop(self, now: float, expiry: int) -> None:
+        """Remove all entries of this process."""
+        self._transaction(
+            lambda conn: conn.execute(
+                'DELETE FROM processes WHERE pid = ? OR time < ?',
+                (pid, now - expiry)))
+
+
+_registries: dict[tuple[str, str], ProcessRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry() -> ProcessRegistry:
+    """Return the process registry selected by config.
+
+    The registry is chosen by :attr:`config.throttle_registry`. If the
+    SQLite database cannot be opened, the ``throttle.ctrl`` text file
+    is used instead.
+
+    .. version-added:: 11.8
+    """
+    key = config.throttle_registry, config.base_dir
+    with _registries_lock:
+        if key not in _registries:
+            registry: ProcessRegistry | None = None
+            if config.throttle_registry == 'sqlite':
+                filename = config.datafilepath('throttle.db')
+                try:
+                    registry = SQLiteRegistry(filename)
+                except sqlite3.Error as e:
+                    pywikibot.warning(
+                        f'Cannot open throttle registry {filename}: {e}; '
+                        'throttle.ctrl file is used instead')
+            _registries[key] = registry or TextFileRegistry(
+                config.datafilepath('throttle.ctrl'))
+        return _registries[key]
+
+
 class Throttle:
 
     """Control rate of access to wiki server.
@@ -62,7 +400,7 @@ class Throttle:
     the rate of access.
 
     :param site: site or sitename for this Throttle. If site is an empty
-        string, it will not be written to the throttle.ctrl file.
+        string, it will not be written to the process registry.
     :param mindelay: The minimal delay, also used for read access
     :param maxdelay: The maximal delay
     :param writedelay: The write delay
@@ -83,6 +421,8 @@ class Throttle:
         self.lock_read = threading.RLock()
         self.mysite = str(site)
         self.ctrlfilename = config.datafilepath('throttle.ctrl')
+        #: registry of running processes, see :func:`get_registry`
+        self.registry = get_registry()
         self.mindelay = mindelay or config.minthrottle
         self.maxdelay = maxdelay or config.maxthrottle
         self.writedelay = writedelay or config.put_throttle
@@ -140,81 +480,36 @@ class Throttle:
         hashobj = hashlib.blake2b(module, digest_size=2, usedforsecurity=False)
         return hashobj.hexdigest()
 
-    def _read_file(self, raise_exc: bool = False):
-        """Yield process entries from file."""
-        try:
-            with open(self.ctrlfilename) as f:
-                lines = f.readlines()
-        except OSError:
-            if raise_exc and pid:
-                raise
-            return
+    def _read_file(self, raise_exc: bool = False) -> Iterator[ProcEntry]:
+        """Yield process entries from file.
 
-        for line in lines:
-            # parse line; format is "module_id pid timestamp site"
-            try:
-                _id, _pid, _time, _site = line.split(' ')
-                proc_entry = ProcEntry(
-                    module_id=_id,
-                    pid=int(_pid),
-                    time=int(float(_time)),
-                    site=_site.rstrip()
-                )
-            except (IndexError, ValueError):  # pragma: no cover
-                # Sometimes the file gets corrupted ignore that line
-                continue
-            yield proc_entry
+        .. version-changed:: 11.8
+           delegate to :meth:`TextFileRegistry.read`.
+        """
+        return TextFileRegistry(self.ctrlfilename).read(raise_exc)
 
     def _write_file(self, processes) -> None:
-        """Write process entries to file."""
-        processes = sorted(processes, key=lambda p: (p.pid, p.site))
+        """Write process entries to file.
 
-        with suppress(IOError), open(self.ctrlfilename, 'w') as f:
-            f.writelines(FORMAT_LINE.format_map(p._asdict())
-                         for p in processes)
+        .. version-changed:: 11.8
+           delegate to :meth:`TextFileRegistry.write`.
+        """
+        TextFileRegistry(self.ctrlfilename).write(processes)
 
     def checkMultiplicity(self) -> None:
         """Count running processes for site and set process_multiplicity.
 
         .. version-changed:: 7.0
            process is not written to throttle.ctrl file if site is empty.
+        .. version-changed:: 11.8
+           processes are counted by the :attr:`registry`.
         """
-        global pid
         mysite = self.mysite
         pywikibot.debug(f'Checking multiplicity: pid = {pid}')
         with self.lock:
-            processes = []
-            used_pids = set()
-            count = 1
-
-            now = time.time()
-            for proc in self._read_file(raise_exc=True):
-                used_pids.add(proc.pid)
-                if now - proc.time > self.expiry:
-                    continue  # process has expired, drop from file
-
-                if proc.site == mysite and proc.pid != pid:
-                    count += 1
-
-                if proc.site != mysite or proc.pid != pid:
-                    processes.append(proc)
-
-            free_pid = (i for i in itertools.count(start=1)
-                        if i not in used_pids)
-            if not pid:
-                pid = next(free_pid)
-
+            count, self.modules = self.registry.check_in(
+                self._module_hash(), mysite, time.time(), self.expiry)
             self.checktime = time.time()
-            processes.append(
-                ProcEntry(module_id=self._module_hash(), pid=pid,
-                          time=self.checktime, site=mysite))
-            self.modules = Counter(p.module_id for p in processes)
-
-            if not mysite:
-                del processes[-1]
-
-            self._write_file(processes)
-
             self.process_multiplicity = count
             pywikibot.log(f'Found {count} {mysite} processes running,'
                           ' including this one.')
@@ -324,12 +619,7 @@ class Throttle:
         """Remove me from the list of running bot processes."""
         # drop all throttles with this process's pid, regardless of site
         self.checktime = 0
-
-        now = time.time()
-        processes = [p for p in self._read_file()
-                     if now - p.time <= self.expiry and p.pid != pid]
-
-        self._write_file(processes)
+        self.registry.drop(time.time(), self.expiry)
 
     @staticmethod
     def wait(seconds: int | float) -> None:
@@ -366,6 +656,9 @@ class Throttle:
         .. version-deprecated:: 10.3.0
            The *requestsize* parameter has no effect and will be removed
            in a future release.
+        .. version-changed:: 11.8
+           Use token buckets if :attr:`config.throttle_mode` is
+           ``'bucket'``.
 
         :param requestsize: Number of pages to be read or written.
             Deprecated since 10.3.0. No longer affects throttling.
@@ -374,7 +667,10 @@ class Throttle:
         """
         lock = self.lock_write if write else self.lock_read
         with lock:
-            wait = self.waittime(write=write)
+            if config.throttle_mode == 'bucket':
+                wait = self._bucket_waittime(write=write)
+            else:
+                wait = self.waittime(write=write)
             self.wait(wait)
 
             now = time.time()
@@ -383,6 +679,46 @@ class Throttle:
             else:
                 self.last_read = now
 
+    def _bucket(self, write: bool) -> tuple[str, float, float]:
+        """Return key, emission interval and burst tolerance of a bucket.
+
+        .. version-added:: 11.8
+        """
+        if write:
+            rate, burst = config.write_bucket_rate, config.write_bucket_burst
+        else:
+            rate, burst = config.read_bucket_rate, config.read_bucket_burst
+        interval = 60 / rate
+        kind = 'write' if write else 'read'
+        return f'{self.mysite}:{kind}', interval, interval * (burst - 1)
+
+    def _bucket_waittime(self, *, write: bool = False) -> float:
+        """Reserve a slot of the token bucket and return the wait time.
+
+        Used if :attr:`config.throttle_mode` is ``'bucket'``. A pending
+        :attr:`retry_after` blocks the buckets of all processes for
+        this site.
+
+        .. version-added:: 11.8
+        """
+        now = time.time()
+        # keep the heartbeat of this process in the registry
+        if now > self.checktime + self.checkdelay:
+            self.checkMultiplicity()
+        if self.retry_after:
+            self._defer_buckets(now + self.retry_after)
+        key, interval, tolerance = self._bucket(write)
+        return self.registry.reserve(key, interval, tolerance, now)
+
+    def _defer_buckets(self, until: float) -> None:
+        """Block read and write buckets of this site until *until*.
+
+        .. version-added:: 11.8
+        """
+        for write in (False, True):
+            key, _, tolerance = self._bucket(write)
+            self.registry.defer(key, until + tolerance)
+
     def lag(self, lagtime: float | None = None) -> None:
         """Seize the throttle lock due to server lag.
 
@@ -409,6 +745,9 @@ class Throttle:
                 waittime = max(self.retry_after, waittime / 5)
             # wait not more than retry_max seconds
             delay = min(waittime, config.retry_max)
+            if config.throttle_mode == 'bucket':
+                # let other processes sharing the buckets back off too
+                self._defer_buckets(started + delay)
             # account for any time we waited while acquiring the lock
             wait = delay - (time.time() - started)
             self.wait(wait)
@@ -13,6 +13,7 @@ from __future__ import annotations
 import collections
 import heapq
 import itertools
+import sqlite3
 from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
 from contextlib import suppress
 from typing import Any
@@ -28,6 +29,8 @@ __all__ = (
     'union_generators',
 )
 
+_sentinel = object()
+
 
 def islice_with_ellipsis(iterable, *args, marker: str = '…'):
     """Generator which yields the first n elements of the iterable.
@@ -96,7 +99,11 @@ def union_generators(*iterables: Iterable[Any],
     return (next(group) for _, group in itertools.groupby(merged, key=key))
 
 
-def intersect_generators(*iterables, allow_duplicates: bool = False):
+def intersect_generators(*iterables,
+                         allow_duplicates: bool = False,
+                         key: Callable[[Any], Any] | None = None,
+                         ordered: bool = False,
+                         spill_size: int | None = None):
     """Generator of intersect iterables.
 
     Yield items only if they are yielded by all iterables. zip_longest
@@ -107,6 +114,12 @@ def intersect_generators(*iterables, allow_duplicates: bool = False):
     before all iterables are finished is attempted if there is no more
     chance of finding an item in all of them.
 
+    If the iterables are sorted ascending by *key*, *ordered* should be
+    set. The iterables are merged then and no items have to be
+    remembered. Otherwise the keys of items not yet found in all
+    iterables are kept; with *spill_size* they are moved to a temporary
+    database on disk if there are more than *spill_size* keys.
+
     Sample:
 
     >>> iterables = 'mississippi', 'missouri'
@@ -114,6 +127,8 @@ def intersect_generators(*iterables, allow_duplicates: bool = False):
     ['m', 'i', 's']
     >>> list(intersect_generators(*iterables, allow_duplicates=True))
     ['m', 'i', 's', 's', 'i']
+    >>> list(intersect_generators('abcdf', 'bcef', 'bdf', ordered=True))
+    ['b', 'f']
 
 
     .. version-added:: 3.0
@@ -132,9 +147,21 @@ def intersect_generators(*iterables, allow_duplicates: bool = False):
        Iterable elements may consist of lists or tuples
        ``allow_duplicates`` is a keyword-only argument
 
+    .. version-changed:: 11.8
+       *key*, *ordered* and *spill_size* parameters were added.
+
     :param iterables: Page generators
     :param allow_duplicates: Optional keyword argument to allow duplicates
         if present in all generators
+    :param key: Optional key function to identify and compare items. If
+        ``None``, items are compared directly.
+    :param ordered: The iterables are sorted ascending by *key*
+    :param spill_size: Maximum number of keys kept in memory. If
+        ``None`` or 0, all keys are kept in memory. Keys must be int,
+        str or bytes to be moved to disk. It is ignored if *ordered* or
+        *allow_duplicates* is set.
+    :raises ValueError: an iterable is not sorted although *ordered* is
+        set
     """
     if not iterables:
         return
@@ -150,6 +177,73 @@ def intersect_generators(*iterables, allow_duplicates: bool = False):
                   ' was skipped immediately.')
             return
 
+    if key is None:
+        key = _identity
+
+    if ordered:
+        yield from _merge_intersection(iterables, key, allow_duplicates)
+    elif allow_duplicates:
+        yield from _count_intersection(iterables, key)
+    else:
+        yield from _mask_intersection(iterables, key, spill_size)
+
+
+def _identity(item):
+    """Return the item itself."""
+    return item
+
+
+def _merge_intersection(iterables, key: Callable[[Any], Any],
+                        allow_duplicates: bool) -> Generator[Any]:
+    """Intersect sorted iterables by merging them.
+
+    .. version-added:: 11.8
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    heads = [next(iterator, _sentinel) for iterator in iterators]
+    if _sentinel in heads:
+        return
+
+    keys = [key(item) for item in heads]
+
+    def advance(index: int) -> bool:
+        """Set the next item of an iterator; return False if exhausted."""
+        item = next(iterators[index], _sentinel)
+        if item is _sentinel:
+            return False
+
+        item_key = key(item)
+        if item_key < keys[index]:
+            raise ValueError(f'iterable {index} is not sorted: '
+                             f'{item_key!r} < {keys[index]!r}')
+        heads[index], keys[index] = item, item_key
+        return True
+
+    while True:
+        high = max(keys)
+        if all(item_key == high for item_key in keys):
+            yield heads[0]
+            for index in range(len(iterators)):
+                if not advance(index):
+                    return
+                while not allow_duplicates and keys[index] == high:
+                    if not advance(index):
+                        return
+            continue
+
+        for index in range(len(iterators)):
+            while keys[index] < high:
+                if not advance(index):
+                    return
+
+
+def _count_intersection(iterables,
+                        key: Callable[[Any], Any]) -> Generator[Any]:
+    """Intersect iterables allowing duplicates.
+
+    .. version-added:: 11.8
+       Extracted from :func:`intersect_generators`
+    """
     # Item is cached to check that it is found n_gen times
     # before being yielded.
     cache: collections.defaultdict[Hashable, collections.Counter[int]]
@@ -158,45 +252,149 @@ def intersect_generators(*iterables, allow_duplicates: bool = False):
 
     ones = collections.Counter(range(n_gen))
     active_iterables = set(range(n_gen))
-    seen = set()
+    # number of cache entries containing the iterable's index
+    pending = [0] * n_gen
 
     # Get items from iterables in a round-robin way.
-    sentinel = object()
-    for items in itertools.zip_longest(*iterables, fillvalue=sentinel):
+    for items in itertools.zip_longest(*iterables, fillvalue=_sentinel):
         for index, item in enumerate(items):
 
-            if item is sentinel:
+            if item is _sentinel:
                 active_iterables.discard(index)
                 continue
 
-            if not allow_duplicates and hash(item) in seen:
-                continue
-
+            item_key = key(item)
             # Each cache entry is a Counter of iterables' index
-            cache[item][index] += 1
+            counter = cache[item_key]
+            if not counter[index]:
+                pending[index] += 1
+            counter[index] += 1
 
-            if len(cache[item]) == n_gen:
+            if len(counter) == n_gen:
                 yield item
 
                 # Remove item from cache if possible or decrease Counter entry
-                if not allow_duplicates:
-                    del cache[item]
-                    seen.add(hash(item))
-                elif cache[item] == ones:
-                    del cache[item]
+                counter -= ones
+                for i in range(n_gen):
+                    if i not in counter:
+                        pending[i] -= 1
+                if counter:
+                    cache[item_key] = counter
                 else:
-                    cache[item] -= ones
+                    del cache[item_key]
 
         # We can quit if an iterable is exceeded and cached iterables is
         # a subset of active iterables.
-        if len(active_iterables) < n_gen:
-            cached_iterables = set(
-                itertools.chain.from_iterable(v.keys()
-                                              for v in cache.values()))
-            if cached_iterables <= active_iterables:
+        if len(active_iterables) < n_gen and not any(
+                pending[i] for i in range(n_gen)
+                if i not in active_iterables):
+            return
+
+
+def _mask_intersection(iterables, key: Callable[[Any], Any],
+                       spill_size: int | None) -> Generator[Any]:
+    """Intersect iterables without duplicates.
+
+    A bit mask of the iterables which yielded an item is kept by the
+    item's key. The mask of yielded items is complete and is kept to
+    skip duplicates.
+
+    .. version-added:: 11.8
+    """
+    n_gen = len(iterables)
+    complete = (1 << n_gen) - 1
+    exhausted = 0
+    # number of incomplete masks containing the iterable's bit
+    pending = [0] * n_gen
+
+    with _KeyMasks(spill_size) as masks:
+        # Get items from iterables in a round-robin way.
+        for items in itertools.zip_longest(*iterables, fillvalue=_sentinel):
+            for index, item in enumerate(items):
+                bit = 1 << index
+                if item is _sentinel:
+                    exhausted |= bit
+                    continue
+
+                item_key = key(item)
+                mask = masks.get(item_key)
+                if mask & bit or exhausted & ~mask:
+                    # duplicate or not in an exhausted iterable
+                    continue
+
+                if mask | bit == complete:
+                    yield item
+                    for i in range(n_gen):
+                        if mask >> i & 1:
+                            pending[i] -= 1
+                else:
+                    pending[index] += 1
+                masks[item_key] = mask | bit
+
+            # We can quit if an iterable is exhausted and no incomplete
+            # mask contains it.
+            if exhausted and not any(pending[i] for i in range(n_gen)
+                                     if exhausted >> i & 1):
                 return
 
 
+class _KeyMasks:
+
+    """Bit masks by keys which are moved to disk above *spill_size*.
+
+    .. version-added:: 11.8
+    """
+
+    def __init__(self, spill_size: int | None) -> None:
+        """Initializer."""
+        self.spill_size = spill_size
+        self._masks: dict[Hashable, int] = {}
+        self._db: sqlite3.Connection | None = None
+
+    def __enter__(self) -> _KeyMasks:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Remove the temporary database."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._masks.clear()
+
+    def get(self, key: Hashable) -> int:
+        """Return the mask of *key* or 0."""
+        if self._db is None:
+            return self._masks.get(key, 0)
+
+        row = self._db.execute('SELECT mask FROM masks WHERE key = ?',
+                               (key, )).fetchone()
+        return row[0] if row else 0
+
+    def __setitem__(self, key: Hashable, mask: int) -> None:
+        """Set the mask of *key*."""
+        if self._db is not None:
+            self._db.execute('INSERT OR REPLACE INTO masks VALUES (?, ?)',
+                             (key, mask))
+            return
+
+        self._masks[key] = mask
+        if self.spill_size and len(self._masks) > self.spill_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Move the masks to a temporary database."""
+        debug(f'intersect_generators: moving {len(self._masks)} keys to'
+              ' a temporary database')
+        # An empty name creates a temporary database on disk
+        self._db = sqlite3.connect('')
+        self._db.execute(
+            'CREATE TABLE masks (key PRIMARY KEY, mask INTEGER NOT NULL)')
+        self._db.executemany('INSERT INTO masks VALUES (?, ?)',
+                             self._masks.items())
+        self._masks.clear()
+
+
 def roundrobin_generators(*iterables) -> Generator[Any]:
     """Yield simultaneous from each iterable.
 
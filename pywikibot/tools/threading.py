@@ -6,13 +6,16 @@
 """Classes which can be used for threading."""
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import importlib
 import queue
 import threading
 import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
 from concurrent import futures
-from typing import Any
+from typing import Any, TypeVar
 
 import pywikibot  # T306760
 from pywikibot.tools import SPHINX_RUNNING, ModuleDeprecationWrapper
@@ -22,8 +25,13 @@ __all__ = (
     'BoundedPoolExecutor',
     'ThreadedGenerator',
     'ThreadList',
+    'async_iterate',
+    'prefetch_map',
 )
 
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
 
 class ThreadedGenerator(threading.Thread):
 
@@ -290,6 +298,73 @@ class BoundedPoolExecutor(futures.Executor):
         return f'{base.__name__}({executor.__name__!r}{self._bound(", ")})'
 
 
+async def async_iterate(iterable: Iterable[_T]) -> AsyncGenerator[_T]:
+    """Iterate a blocking iterable asynchronously.
+
+    Each item is retrieved in a worker thread of the event loop's
+    default executor, which allows other coroutines to proceed while
+    the iterable waits for I/O. The iterable is never advanced by two
+    threads at the same time.
+
+    >>> import asyncio
+    >>> async def collect():
+    ...     return [item async for item in async_iterate(range(3))]
+    >>> asyncio.run(collect())
+    [0, 1, 2]
+
+    .. version-added:: 11.8
+
+    :param iterable: a blocking iterable like an API generator
+    """
+    iterator = iter(iterable)
+    sentinel = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, sentinel)
+        if item is sentinel:
+            return
+        yield item
+
+
+def prefetch_map(func: Callable[[_T], _R],
+                 iterable: Iterable[_T],
+                 depth: int = 1) -> Generator[_R]:
+    """Yield ``func(item)`` for each item, computed ahead in a thread.
+
+    Up to *depth* results are computed by a single background worker
+    while the caller processes the current one; results are yielded in
+    the order of *iterable*. The iterable itself is advanced by the
+    calling thread only. Exceptions raised by *func* are re-raised when
+    the corresponding result is due. Pending calls are cancelled if
+    the generator is closed.
+
+    >>> list(prefetch_map(str.upper, 'abc', depth=2))
+    ['A', 'B', 'C']
+
+    .. version-added:: 11.8
+
+    :param func: callable applied to each item
+    :param iterable: items to be processed
+    :param depth: number of results computed in advance
+    :raises ValueError: *depth* is lower than 1
+    """
+    if depth < 1:
+        raise ValueError("Minimum 'depth' is 1")
+
+    executor = futures.ThreadPoolExecutor(max_workers=1,
+                                          thread_name_prefix='Prefetch')
+    pending: deque[futures.Future[_R]] = deque()
+    try:
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) > depth:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 wrapper = ModuleDeprecationWrapper(__name__)
 wrapper.add_deprecated_attr(
     'RLock',
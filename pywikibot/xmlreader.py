@@ -14,12 +14,26 @@ XmlEntry objects which can be used by other bots.
 .. version-changed:: 7.7
    *defusedxml* is used in favour of *xml.etree* if present to prevent
    vulnerable XML attacks. *defusedxml* 0.7.1 or higher is recommended.
+.. version-changed:: 11.8
+   *lxml* can be used as a faster parser if present. Dumps can be
+   scanned by several processes with :meth:`XmlDump.scan`. Single
+   pages are read from bz2 multistream dumps with a
+   :class:`MultistreamIndex`.
 """
 from __future__ import annotations
 
+import bz2
+import io
+import os
 import re
+import sqlite3
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
-from typing import NamedTuple
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
 from xml.etree.ElementTree import Element
 
 
@@ -28,8 +42,15 @@ try:
 except ImportError:
     from xml.etree.ElementTree import ParseError, iterparse
 
-from collections.abc import Callable, Iterator
+try:
+    from lxml import etree as lxml_etree
+except ImportError as e:
+    lxml_etree = e
+
+from collections.abc import Callable, Iterable, Iterator
 
+from pywikibot import config
+from pywikibot.backports import batched
 from pywikibot.tools import (
     ModuleDeprecationWrapper,
     issue_deprecation_warning,
@@ -37,6 +58,13 @@ from pywikibot.tools import (
 )
 
 
+#: start of a bz2 stream: stream header followed by the block magic
+_BZ2_MAGIC = re.compile(rb'BZh[1-9]1AY&SY')
+
+#: size of file blocks read while searching bz2 streams
+_BLOCK_SIZE = 1 << 20
+
+
 @dataclass
 class XmlEntry:
 
@@ -84,6 +112,157 @@ class RawRev(NamedTuple):
     revid: int
 
 
+class EntryFilter:
+
+    """Picklable predicate for :class:`XmlEntry` objects.
+
+    An entry matches if its title matches all *require_title* and none
+    of *exclude_title* patterns, and if its text matches none of
+    *exclude_text* and any of *text* patterns. All texts match if no
+    *text* patterns are given. The filter can be passed to
+    :meth:`XmlDump.scan`.
+
+    .. version-added:: 11.8
+    """
+
+    def __init__(
+        self,
+        *,
+        text: Iterable[re.Pattern[str]] = (),
+        exclude_text: Iterable[re.Pattern[str]] = (),
+        require_title: Iterable[re.Pattern[str]] = (),
+        exclude_title: Iterable[re.Pattern[str]] = (),
+    ) -> None:
+        """Initializer."""
+        self.text = list(text)
+        self.exclude_text = list(exclude_text)
+        self.require_title = list(require_title)
+        self.exclude_title = list(exclude_title)
+
+    def __call__(self, entry: XmlEntry) -> bool:
+        """Return True if the entry matches the filter."""
+        title, text = entry.title, entry.text
+        return (all(regex.search(title) for regex in self.require_title)
+                and not any(regex.search(title)
+                            for regex in self.exclude_title)
+                and not any(regex.search(text)
+                            for regex in self.exclude_text)
+                and (not self.text
+                     or any(regex.search(text) for regex in self.text)))
+
+
+class MultistreamIndex:
+
+    """Index of a bz2 multistream dump.
+
+    Wikimedia publishes a ``*-multistream-index.txt.bz2`` file with each
+    multistream dump. Every line holds the offset of a bz2 stream, the
+    page id and the title of a page in this stream, separated by colons.
+    The index is loaded into a SQLite database at first use; the
+    database is reused until size or modification time of the index
+    file changes.
+
+    .. version-added:: 11.8
+
+    :param filename: path of the index file
+    :param cache: path of the SQLite database. Defaults to a file named
+        after the index in the ``xmlindex`` subdirectory of
+        :attr:`config.base_dir`.
+    """
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS pages (
+            title TEXT PRIMARY KEY,
+            pageid INTEGER NOT NULL,
+            offset INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS pages_pageid ON pages (pageid);
+        CREATE TABLE IF NOT EXISTS source (
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL
+        );
+    """
+
+    #: maximum number of parameters of a query
+    batch_size = 500
+
+    def __init__(self, filename: str, cache: str | Path | None = None
+                 ) -> None:
+        """Initializer."""
+        self.filename = filename
+        if cache is None:
+            directory = Path(config.base_dir, 'xmlindex')
+            directory.mkdir(exist_ok=True)
+            cache = directory / (Path(filename).name + '.sqlite3')
+        self.cache = Path(cache)
+        self._conn = sqlite3.connect(self.cache)
+        self._conn.executescript(self._schema)
+        self._load()
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({self.filename!r})'
+
+    def __len__(self) -> int:
+        """Return the number of pages in the index."""
+        return self._conn.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+
+    def _load(self) -> None:
+        """Load the index file if the database is outdated."""
+        stat = Path(self.filename).stat()
+        source = (stat.st_size, stat.st_mtime)
+        with self._conn as conn:
+            if conn.execute('SELECT size, mtime FROM source').fetchone() \
+                    == source:
+                return
+
+            conn.execute('DELETE FROM source')
+            conn.execute('DELETE FROM pages')
+            with open_archive(self.filename) as f:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+                    self._parse_lines(f))
+            conn.execute('INSERT INTO source VALUES (?, ?)', source)
+
+    @staticmethod
+    def _parse_lines(lines: Iterable[bytes]
+                     ) -> Iterator[tuple[str, int, int]]:
+        """Yield title, page id and offset of index lines."""
+        for line in lines:
+            offset, pageid, title = line.decode('utf-8').rstrip(
+                '\r\n').split(':', 2)
+            yield title, int(pageid), int(offset)
+
+    def _lookup(self, column: str, keys: Iterable[str | int]
+                ) -> dict[str | int, int]:
+        """Return the offsets of the pages with the given keys."""
+        offsets = {}
+        for batch in batched(set(keys), self.batch_size):
+            placeholders = ', '.join('?' * len(batch))
+            offsets.update(self._conn.execute(
+                f'SELECT {column}, offset FROM pages '
+                f'WHERE {column} IN ({placeholders})', batch))
+        return offsets
+
+    def lookup(self, titles: Iterable[str]) -> dict[str, int]:
+        """Return stream offsets of the pages with the given titles.
+
+        Titles not found in the index are omitted.
+        """
+        return self._lookup('title', titles)
+
+    def lookup_ids(self, pageids: Iterable[int]) -> dict[int, int]:
+        """Return stream offsets of the pages with the given ids.
+
+        Page ids not found in the index are omitted.
+        """
+        return self._lookup('pageid', (int(pageid) for pageid in pageids))
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+
 class XmlDump:
 
     """Represents an XML dump file.
@@ -115,6 +294,12 @@ class XmlDump:
     Pear 188924
     >>>
 
+    :param filename: path of the dump file or a sequence of paths of
+        dump parts which are read in the given order
+    :param index: path of the ``multistream-index`` file of a bz2
+        multistream dump which is used by :meth:`pages`. The dump path
+        with ``-index.txt.bz2`` replacing the ``.xml.bz2`` suffix is
+        used by default.
     :param allrevisions: boolean
         If True, parse all revisions instead of only the latest one.
         Default: False.
@@ -127,8 +312,40 @@ class XmlDump:
         * `earliest` (first revision, by smallest `revisionid`)
         * `all` (all revisions for each page)
         Default: `first_found`
+    :param fields: names of the :class:`XmlEntry` fields to be read.
+        Other fields are not extracted from the dump and are set to
+        None. All fields are read by default.
+    :param parser: ``'etree'`` (default) uses :mod:`xml.etree` or
+        *defusedxml*; ``'lxml'`` uses the faster *lxml* iterparse which
+        only passes ``page`` elements to Python. *lxml* is most
+        effective together with *fields*, because strings are only
+        created for the requested fields. With *lxml* parsing cannot be
+        continued after a ParseError; *on_error* is called and parsing
+        stops. Use :mod:`xmlbench<scripts.maintenance.xmlbench>` script
+        to compare the parsers.
+
+    .. version-added:: 11.8
+       the *fields* and *parser* parameters.
+    .. version-added:: 11.8
+       the *index* parameter.
+    .. version-changed:: 11.8
+       *filename* may be a sequence of dump parts.
     """
 
+    #: maximum compressed size of the header stream read by :meth:`pages`
+    header_limit = 1 << 20
+
+    #: tasks of :meth:`scan` in flight per worker process
+    scan_window = 2
+
+    #: XML tags of :class:`XmlEntry` fields taken from a revision
+    revision_tags = {
+        'text': 'text',
+        'timestamp': 'timestamp',
+        'revisionid': 'id',
+        'comment': 'comment',
+    }
+
     def __init__(
         self,
         filename,
@@ -137,10 +354,38 @@ class XmlDump:
         # when allrevisions removed, revisions can default to 'latest'
         revisions: str = 'first_found',
         on_error: Callable[[ParseError], None] | None = None,
+        fields: Iterable[str] | None = None,
+        parser: str = 'etree',
+        index: str | None = None,
     ) -> None:
-        """Initializer."""
+        """Initializer.
+
+        :raises ImportError: *lxml* parser is requested but not
+            installed
+        :raises ValueError: unknown *fields* or *parser*
+        """
         self.filename = filename
+        self.filenames = ([filename] if isinstance(filename, str)
+                          else list(filename))
         self.on_error = on_error
+        self.index_filename = index
+        self._index: MultistreamIndex | None = None
+
+        names = set(XmlEntry.__dataclass_fields__)
+        self.fields = names if fields is None else set(fields)
+        if unknown := self.fields - names:
+            raise ValueError(
+                f'Unknown XmlEntry fields: {", ".join(sorted(unknown))}')
+
+        if parser == 'lxml':
+            if isinstance(lxml_etree, ImportError):
+                raise lxml_etree
+            self._iter_pages = self._iter_pages_lxml
+            self._findall = self._findall_lxml
+            self._findtexts = self._findtexts_lxml
+        elif parser != 'etree':
+            raise ValueError(
+                f"'parser' must be 'etree' or 'lxml', not {parser!r}")
 
         self.rev_actions = {
             'first_found': self._parse_only_first_found,
@@ -170,44 +415,257 @@ class XmlDump:
         self._parse = self.rev_actions[revisions]
         self.uri = None
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Remove the index database connection before pickling."""
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
+
+    @property
+    def index(self) -> MultistreamIndex:
+        """The index of a bz2 multistream dump.
+
+        .. version-added:: 11.8
+
+        :raises ValueError: the index file is not given and cannot be
+            derived from the dump name
+        """
+        if self._index is None:
+            filename = self.index_filename
+            if filename is None:
+                if len(self.filenames) != 1 \
+                   or not self.filenames[0].endswith('.xml.bz2'):
+                    raise ValueError(
+                        f'No multistream index known for {self.filename}')
+                filename = self.filenames[0][:-len('.xml.bz2')] \
+                    + '-index.txt.bz2'
+            self._index = MultistreamIndex(filename)
+        return self._index
+
+    def pages(self, titles: Iterable[str] = (),
+              pageids: Iterable[int] = ()) -> Iterator[XmlEntry]:
+        """Yield entries of the given pages of a bz2 multistream dump.
+
+        The bz2 streams which hold the pages are looked up in the
+        :attr:`index` and only these streams are read. Entries are
+        yielded in dump order; pages which are not found in the index
+        are skipped.
+
+        .. version-added:: 11.8
+
+        :param titles: titles of the pages
+        :param pageids: page ids of the pages
+        :raises ValueError: the dump is not a single bz2 multistream
+            file or the *title* or *id* field is not read
+        """
+        if len(self.filenames) != 1:
+            raise ValueError('pages() cannot be used with dump parts')
+        if not {'title', 'id'} <= self.fields:
+            raise ValueError("pages() requires the 'title' and 'id' fields")
+
+        filename = self.filenames[0]
+        header = multistream_header(filename, self.header_limit)
+        if header is None:
+            raise ValueError(f'{filename} is not a bz2 multistream dump')
+
+        titles = {title.replace('_', ' ') for title in titles}
+        pageids = {str(pageid) for pageid in pageids}
+        offsets = set(self.index.lookup(titles).values())
+        offsets.update(self.index.lookup_ids(pageids).values())
+        for offset in sorted(offsets):
+            for _, data in bz2_streams(filename, offset, offset + 1):
+                source = io.BytesIO(
+                    header + _page_elements(data) + b'</mediawiki>')
+                for entry in self._parse_source(source):
+                    if entry.title in titles or entry.id in pageids:
+                        yield entry
+
     def parse(self) -> Iterator[XmlEntry]:
         """Generator using ElementTree iterparse function.
 
         .. version-changed:: 7.2
            if a ParseError occurs it can be handled by the callable
            given with `on_error` parameter of this instance.
+        .. version-changed:: 11.8
+           *lxml* is used if requested by the *parser* parameter. Dump
+           parts are read one after the other.
         """
-        with open_archive(self.filename) as source:
-            context = iterparse(source, events=('start', 'end', 'start-ns'))
-            root = None
-
-            while True:
-                try:
-                    event, elem = next(context)
-                except StopIteration:
-                    return
-                except ParseError as e:
-                    if self.on_error:
-                        self.on_error(e)
-                        continue
-                    raise
-
-                if event == 'start-ns' and elem[0] == '':
-                    self.uri = f'{{{elem[1]}}}'
-                    continue
+        for filename in self.filenames:
+            with open_archive(filename) as source:
+                yield from self._parse_source(source)
+
+    def _parse_source(self, source) -> Iterator[XmlEntry]:
+        """Yield entries of an opened dump file.
+
+        .. version-added:: 11.8
+        """
+        for elem in self._iter_pages(source):
+            yield from self._parse(elem)
+
+    def scan(
+        self,
+        predicate: Callable[[XmlEntry], bool] | None = None,
+        *,
+        processes: int | None = None,
+        ordered: bool = True,
+        titles: bool = False,
+        chunk_size: int = 4 << 20,
+    ) -> Iterator[XmlEntry | str]:
+        """Scan the dump with several worker processes.
+
+        Every dump part is a task of the workers. A Wikimedia bz2
+        multistream dump part is split at the bz2 stream boundaries
+        into tasks of about *chunk_size* compressed bytes. Workers parse
+        their tasks, apply *predicate* to every entry and only return
+        matching entries. Other dump parts cannot be split; see
+        :func:`multistream_header`.
+
+        This instance, *predicate* and the *on_error* callable are
+        pickled for the workers. Functions and classes have to be
+        importable from a module; :class:`EntryFilter` can be used for
+        regular expression tests.
+
+        >>> from pywikibot import xmlreader
+        >>> name = 'tests/data/xml/dummy-template.xml'
+        >>> dump = xmlreader.XmlDump(name, revisions='latest')
+        >>> for title in dump.scan(processes=1, titles=True):
+        ...     print(title)
+        ...
+        Fake page with msg
+        Fake page with unnecessary template prefix
+        Fake page with nested template
+
+        .. version-added:: 11.8
+
+        :param predicate: callable which is called with an
+            :class:`XmlEntry` and returns whether the entry is yielded.
+            All entries are yielded if None.
+        :param processes: number of worker processes; the number of
+            CPUs is used if None. With 1 the dump is scanned in the
+            current process.
+        :param ordered: yield results in dump order. Otherwise results
+            of each task are yielded as soon as it is finished. At most
+            :attr:`scan_window` tasks per process are submitted ahead of
+            the results yielded.
+        :param titles: yield page titles instead of :class:`XmlEntry`
+            objects
+        :param chunk_size: compressed size of the tasks of bz2
+            multistream dumps
+        """
+        tasks = self._scan_tasks(chunk_size)
+        scan = partial(_scan_task, self, predicate, titles)
+        if processes == 1:
+            for results in map(scan, tasks):
+                yield from results
+            return
+
+        # bound the tasks in flight; results of finished tasks are kept
+        # until they are yielded
+        window = self.scan_window * (processes or os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(processes)
+        try:
+            pending = deque(executor.submit(scan, task)
+                            for task in islice(tasks, window))
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                pending.extend(executor.submit(scan, task)
+                               for task in islice(tasks, 1))
+                yield from future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _scan_tasks(
+        self,
+        chunk_size: int
+    ) -> Iterator[tuple[str, int, int, bytes | None]]:
+        """Yield the tasks of :meth:`scan`.
+
+        A task is a tuple of the filename, the start and end offset of
+        the bz2 streams and the XML header of a multistream dump. The
+        header is None if the whole file is to be parsed.
+
+        .. version-added:: 11.8
+        """
+        for filename in self.filenames:
+            header = None
+            if filename.endswith('.bz2'):
+                header = multistream_header(filename, chunk_size)
+            if header is None:
+                yield filename, 0, 0, None
+                continue
 
-                # get the root element
-                if event == 'start' and root is None:
-                    root = elem
+            size = Path(filename).stat().st_size
+            for start in range(0, size, chunk_size):
+                yield filename, start, start + chunk_size, header
 
-                if not (event == 'end' and elem.tag == f'{self.uri}page'):
+    def _iter_pages(self, source) -> Iterator[Element]:
+        """Yield ``page`` elements using ElementTree iterparse.
+
+        The element is cleared after it was processed.
+
+        .. version-added:: 11.8
+        """
+        context = iterparse(source, events=('start', 'end', 'start-ns'))
+        root = None
+
+        while True:
+            try:
+                event, elem = next(context)
+            except StopIteration:
+                return
+            except ParseError as e:
+                if self.on_error:
+                    self.on_error(e)
                     continue
+                raise
 
-                yield from self._parse(elem)
+            if event == 'start-ns' and elem[0] == '':
+                self.uri = f'{{{elem[1]}}}'
+                continue
 
-                # clear references in the root, to allow garbage collection.
-                elem.clear()
-                root.clear()
+            # get the root element
+            if event == 'start' and root is None:
+                root = elem
+
+            if not (event == 'end' and elem.tag == f'{self.uri}page'):
+                continue
+
+            yield elem
+
+            # clear references in the root, to allow garbage collection.
+            elem.clear()
+            root.clear()
+
+    def _iter_pages_lxml(self, source) -> Iterator[Element]:
+        """Yield ``page`` elements using lxml iterparse.
+
+        Only ``page`` elements are passed from the C parser; the element
+        and its preceding siblings are removed after it was processed.
+
+        .. version-added:: 11.8
+        """
+        context = lxml_etree.iterparse(source, events=('end', ),
+                                       tag='{*}page',
+                                       resolve_entities=False,
+                                       no_network=True)
+        try:
+            for _event, elem in context:
+                if self.uri is None:
+                    self.uri = elem.tag[:elem.tag.find('}') + 1]
+                yield elem
+
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except lxml_etree.XMLSyntaxError as e:
+            if not self.on_error:
+                raise
+            self.on_error(e)
 
     def _parse_only_first_found(self, elem: Element) -> Iterator[XmlEntry]:
         """Parser that yields the first revision found.
@@ -249,10 +707,9 @@ class XmlDump:
 
         .. version-added:: 9.0
         """
-        uri = self.uri
         headers = self._headers(elem)
-        for revision in elem.findall(f'{uri}revision'):
-            revid = int(revision.findtext(f'{uri}id')) if with_id else 0
+        for revision in self._findall(elem, 'revision'):
+            revid = int(self._findtexts(revision, ['id'])[0]) if with_id else 0
             yield RawRev(headers, revision, revid)
 
     @staticmethod
@@ -284,18 +741,71 @@ class XmlDump:
 
         return edit_restriction, move_restriction
 
-    def _headers(self, elem: Element) -> Headers:
-        """Extract headers from XML chunk."""
+    def _findall(self, elem: Element, tag: str) -> Iterator[Element]:
+        """Iterate all subelements with the given tag.
+
+        .. version-added:: 11.8
+        """
+        return iter(elem.findall(self.uri + tag))
+
+    def _findall_lxml(self, elem: Element, tag: str) -> Iterator[Element]:
+        """Iterate all subelements with the given tag using lxml.
+
+        .. version-added:: 11.8
+        """
+        return elem.iterchildren(self.uri + tag)
+
+    def _findtexts(self, elem: Element,
+                   tags: Iterable[str | None]) -> list[str | None]:
+        """Return the text of the first subelement for each tag.
+
+        The text is None if the tag is None or no subelement was found.
+
+        .. version-added:: 11.8
+        """
         uri = self.uri
+        return [elem.findtext(uri + tag) if tag else None for tag in tags]
+
+    def _findtexts_lxml(self, elem: Element,
+                        tags: Iterable[str | None]) -> list[str | None]:
+        """Return the text of the first subelement for each tag.
+
+        Unlike ElementTree, lxml evaluates each find path in Python; a
+        single pass over the matching children is much faster.
+
+        .. version-added:: 11.8
+        """
+        uri = self.uri
+        tags = [uri + tag if tag else None for tag in tags]
+        texts: dict[str | None, str] = {}
+        for child in elem.iterchildren(*filter(None, tags)):
+            texts.setdefault(child.tag, child.text or '')
+        return [texts.get(tag) for tag in tags]
+
+    def _headers(self, elem: Element) -> Headers:
+        """Extract headers from XML chunk.
+
+        .. version-changed:: 11.8
+           only requested fields are extracted.
+        """
+        fields = self.fields
+        restricted = bool({'editRestriction', 'moveRestriction'} & fields)
+        title, ns, pageid, redirect, restrictions = self._findtexts(elem, (
+            'title' if 'title' in fields else None,
+            'ns' if 'ns' in fields else None,
+            'id' if 'id' in fields else None,
+            'redirect' if 'isredirect' in fields else None,
+            'restrictions' if restricted else None,
+        ))
         edit_restriction, move_restriction = self.parse_restrictions(
-            elem.findtext(f'{uri}restrictions')
-        )
+            restrictions)
 
         return Headers(
-            title=elem.findtext(f'{uri}title'),
-            ns=elem.findtext(f'{uri}ns'),
-            pageid=elem.findtext(f'{uri}id'),
-            isredirect=elem.findtext(f'{uri}redirect') is not None,
+            title=title,
+            ns=ns,
+            pageid=pageid,
+            isredirect=redirect is not None if 'isredirect' in fields
+            else None,
             edit_restriction=edit_restriction,
             move_restriction=move_restriction,
         )
@@ -303,13 +813,22 @@ class XmlDump:
     def _create_revision(
             self, headers: Headers, revision: Element
     ) -> XmlEntry:
-        """Create a Single revision."""
-        uri = self.uri
-        contributor = revision.find(f'{uri}contributor')
-        ip_editor = contributor.findtext(f'{uri}ip')
-        username = ip_editor or contributor.findtext(f'{uri}username')
-        username = username or ''  # username might be deleted
+        """Create a Single revision.
 
+        .. version-changed:: 11.8
+           only requested fields are extracted.
+        """
+        fields = self.fields
+        username = ip_editor = None
+        if {'username', 'ipedit'} & fields:
+            contributor = next(self._findall(revision, 'contributor'))
+            ip_editor, username = self._findtexts(contributor,
+                                                  ('ip', 'username'))
+            username = ip_editor or username or ''  # might be deleted
+
+        values = dict(zip(self.revision_tags, self._findtexts(revision, (
+            tag if name in fields else None
+            for name, tag in self.revision_tags.items()))))
         return XmlEntry(
             title=headers.title,
             ns=headers.ns,
@@ -317,16 +836,176 @@ class XmlDump:
             editRestriction=headers.edit_restriction,
             moveRestriction=headers.move_restriction,
             isredirect=headers.isredirect,
-            text=revision.findtext(f'{uri}text'),
-            username=username,
-            ipedit=bool(ip_editor),
-            timestamp=revision.findtext(f'{uri}timestamp'),
-            revisionid=revision.findtext(f'{uri}id'),
-            comment=revision.findtext(f'{uri}comment'),
-            # could get comment, minor as well
+            username=username if 'username' in fields else None,
+            ipedit=bool(ip_editor) if 'ipedit' in fields else None,
+            **values,
+            # could get minor as well
         )
 
 
+def _decompress_stream(
+    file,
+    data: bytes = b'',
+    limit: int | None = None,
+) -> tuple[bytes, bytes, int]:
+    """Decompress a single bz2 stream.
+
+    .. version-added:: 11.8
+
+    :param file: binary file positioned behind *data*
+    :param data: bytes at the start of the stream already read
+    :param limit: maximum compressed size of the stream
+    :return: decompressed data, bytes read behind the stream and the
+        compressed size of the stream
+    :raises EOFError: the stream is truncated or larger than *limit*
+    :raises OSError: invalid stream data
+    """
+    decompressor = bz2.BZ2Decompressor()
+    chunks = []
+    size = 0
+    while not decompressor.eof:
+        if limit is not None and size > limit:
+            raise EOFError(f'bz2 stream is larger than {limit} bytes')
+        if not data:
+            data = file.read(_BLOCK_SIZE)
+            if not data:
+                raise EOFError('bz2 stream is truncated')
+        size += len(data)
+        chunks.append(decompressor.decompress(data))
+        data = b''
+    unused = decompressor.unused_data
+    return b''.join(chunks), unused, size - len(unused)
+
+
+def bz2_streams(
+    filename: str,
+    start: int = 0,
+    end: int | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Yield offset and decompressed data of bz2 streams.
+
+    Streams are searched by their magic bytes behind *start* offset.
+    Only streams beginning before *end* are decompressed. Magic bytes
+    which do not start a valid stream are skipped.
+
+    .. version-added:: 11.8
+
+    :param filename: path of a bz2 file
+    :param start: offset in the file to search the first stream from
+    :param end: offset in the file where no stream may begin; streams
+        are searched up to the end of the file if None
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        offset = start  # offset of data
+        data = b''
+        while end is None or offset < end:
+            match = _BZ2_MAGIC.search(data)
+            if match is None:
+                block = f.read(_BLOCK_SIZE)
+                if not block:
+                    return
+
+                # keep bytes which may start a truncated magic
+                keep = data[-9:]
+                offset += len(data) - len(keep)
+                data = keep + block
+                continue
+
+            offset += match.start()
+            if end is not None and offset >= end:
+                return
+
+            try:
+                text, data, size = _decompress_stream(
+                    f, data[match.start():])
+            except (EOFError, OSError):
+                # magic bytes inside compressed data
+                offset += 1
+                f.seek(offset)
+                data = b''
+                continue
+
+            yield offset, text
+            offset += size
+
+
+def multistream_header(filename: str,
+                       limit: int | None = None) -> bytes | None:
+    """Return the XML header of a bz2 multistream dump.
+
+    Wikimedia multistream dumps hold the ``siteinfo`` in the first bz2
+    stream and whole ``page`` elements in every following stream. Other
+    multistream files, e.g. compressed by *pbzip2* or *lbzip2*, split
+    the data at arbitrary positions; they are recognized by a first
+    stream which does not end with the ``siteinfo`` element.
+
+    .. version-added:: 11.8
+
+    :param filename: path of a bz2 file
+    :param limit: maximum compressed size of the first stream
+    :return: the header or None if the file is not a Wikimedia
+        multistream dump or the first stream is larger than *limit*
+    """
+    with open(filename, 'rb') as f:
+        try:
+            text, unused, _ = _decompress_stream(f, limit=limit)
+        except (EOFError, OSError):
+            return None
+        if not (unused or f.read(1)):
+            return None
+
+    if b'<page>' in text or not text.rstrip().endswith(b'</siteinfo>'):
+        return None
+    return text
+
+
+def _page_elements(data: bytes) -> bytes:
+    """Return the ``page`` elements of a bz2 stream of a multistream dump.
+
+    The header and footer streams have no ``page`` elements.
+
+    :raises ValueError: the stream does not hold whole ``page`` elements
+    """
+    start = data.find(b'<page>')
+    if start < 0:
+        stripped = data.strip()
+        if not stripped or stripped == b'</mediawiki>' \
+           or stripped.endswith(b'</siteinfo>'):
+            return b''
+    else:
+        end = data.rfind(b'</page>') + len(b'</page>')
+        if end > start and not data[:start].strip() \
+           and data[end:].strip() in (b'', b'</mediawiki>'):
+            return data[start:end]
+    raise ValueError('bz2 stream does not hold whole page elements')
+
+
+def _scan_task(
+    dump: XmlDump,
+    predicate: Callable[[XmlEntry], bool] | None,
+    titles: bool,
+    task: tuple[str, int, int, bytes | None],
+) -> list[XmlEntry | str]:
+    """Parse a task of :meth:`XmlDump.scan` and return matching results.
+
+    .. version-added:: 11.8
+    """
+    filename, start, end, header = task
+    if header is None:
+        with open_archive(filename) as source:
+            return [entry.title if titles else entry
+                    for entry in dump._parse_source(source)
+                    if predicate is None or predicate(entry)]
+
+    pages = b''.join(_page_elements(data)
+                     for _, data in bz2_streams(filename, start, end))
+    source = io.BytesIO(header + pages + b'</mediawiki>')
+    return [entry.title if titles else entry
+            for entry in dump._parse_source(source)
+            if predicate is None or predicate(entry)]
+
+
 wrapper = ModuleDeprecationWrapper(__name__)
 wrapper.add_deprecated_attr(
     'parseRestrictions',
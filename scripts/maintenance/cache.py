@@ -8,9 +8,11 @@
 
 Syntax:
 
-    python pwb.py cache [-password] [-delete] [-c "..."] [-o "..."] [dir ...]
+    python pwb.py cache [-password] [-delete] [-older:DAYS] [-c "..."]
+        [-o "..."] [dir ...]
 
-If no directory are specified, it will detect the API caches.
+If no directory are specified, it will detect the API caches. Entries of
+the sqlite cache database and legacy pickle files are both processed.
 
 If no command is specified, it will print the filename of all entries.
 If only -delete is specified, it will delete all entries.
@@ -20,6 +22,10 @@ The following parameters are supported:
 -delete           Delete each command filtered. If that option is set the
                   default output will be nothing.
 
+-older:DAYS       Only process entries cached more than DAYS days ago.
+                  This is answered by the index of the sqlite cache
+                  database without loading other entries.
+
 -c                Filter command in python syntax. It must evaluate to True to
                   output anything.
 
@@ -72,13 +78,17 @@ from __future__ import annotations
 import datetime
 import hashlib
 import os
-import pickle
 import sys
 from pathlib import Path
 from random import sample
 
 import pywikibot
 from pywikibot.data import api
+from pywikibot.data.api import (
+    CacheBackend,
+    FileCacheBackend,
+    SQLiteCacheBackend,
+)
 
 # The follow attributes are used by eval()
 from pywikibot.login import LoginStatus  # noqa: F401
@@ -94,12 +104,24 @@ class ParseError(Exception):
 
 class CacheEntry(api.CachedRequest):
 
-    """A Request cache entry."""
+    """A Request cache entry.
+
+    .. version-changed:: 11.8
+       *backend* parameter was added.
+    """
+
+    def __init__(self, directory: str, filename: str,
+                 backend: CacheBackend | None = None) -> None:
+        """Initializer.
 
-    def __init__(self, directory: str, filename: str) -> None:
-        """Initializer."""
+        :param directory: cache directory
+        :param filename: key of the entry
+        :param backend: cache backend holding the entry; defaults to a
+            :class:`data.api.FileCacheBackend` for *directory*
+        """
         self.directory = directory
         self.filename = filename
+        self.backend = backend or FileCacheBackend(directory)
 
     def __str__(self) -> str:
         """Return string equivalent of object."""
@@ -130,9 +152,14 @@ class CacheEntry(api.CachedRequest):
         return self._get_cache_dir() / self._create_file_name()
 
     def _load_cache(self) -> bool:
-        """Load the cache entry."""
-        with self._cachefile_path().open('rb') as f:
-            self.key, self._data, self._cachetime = pickle.load(f)
+        """Load the cache entry.
+
+        :raises ValueError: the entry does not exist
+        """
+        record = self.backend.get(self.filename, touch=False)
+        if record is None:
+            raise ValueError(f'No cache entry {self.filename}')
+        self.key, self._data, self._cachetime = record
         return True
 
     def parse_key(self):
@@ -215,26 +242,82 @@ class CacheEntry(api.CachedRequest):
 
     def _delete(self) -> None:
         """Delete the cache entry."""
-        self._cachefile_path().unlink()
+        self.backend.delete(self.filename)
+
+
+def _database_entries(cache_path: str,
+                      age: datetime.timedelta | None = None) -> list:
+    """Return entries of the sqlite cache database in *cache_path*.
+
+    The entries are selected by the cache time index of the database.
+
+    .. version-added:: 11.8
+    """
+    if not os.path.exists(
+            os.path.join(cache_path, SQLiteCacheBackend.filename)):
+        return []
+
+    backend = SQLiteCacheBackend(cache_path, maxsize=0)
+    limit = pywikibot.Timestamp.nowutc() - age if age else None
+    return [CacheEntry(cache_path, key, backend)
+            for key in backend.keys(older_than=limit)]
+
+
+def _process_entry(entry, func, output_func, action_func) -> None:
+    """Rebuild a loaded entry, filter it and apply output and action.
+
+    .. version-added:: 11.8
+    """
+    try:
+        entry.parse_key()
+    except ParseError as e:
+        pywikibot.error(
+            f'Problems parsing {entry.filename} with key {entry.key}')
+        pywikibot.error(e)
+        return
+
+    try:
+        entry._rebuild()
+    except Exception:
+        pywikibot.error(f'Problems loading {entry.filename} with key '
+                        f'{entry.key}, {entry._parsed_key!r}')
+        pywikibot.exception()
+        return
+
+    if func is None or func(entry):
+        if output_func or action_func is None:
+            output = entry if output_func is None else output_func(entry)
+            if output is not None:
+                pywikibot.info(output)
+        if action_func:
+            action_func(entry)
 
 
 def process_entries(cache_path, func, use_accesstime: bool | None = None,
                     output_func=None, action_func=None, *,
-                    tests: int | None = None) -> None:
+                    tests: int | None = None,
+                    age: datetime.timedelta | None = None) -> None:
     """Check the contents of the cache.
 
-    This program tries to use file access times to determine whether
-    cache files are being used. However file access times are not always
-    usable. On many modern filesystems, they have been disabled. On Unix,
-    check the filesystem mount options. You may need to remount with
-    'strictatime'.
+    Entries of the sqlite cache database are selected by querying the
+    database; legacy pickle files in the directory are processed
+    afterwards.
+
+    For pickle files this program tries to use file access times to
+    determine whether cache files are being used. However file access
+    times are not always usable. On many modern filesystems, they have
+    been disabled. On Unix, check the filesystem mount options. You may
+    need to remount with 'strictatime'.
 
     .. version-changed:: 9.0
        default cache path to 'apicache' without Python main version.
+    .. version-changed:: 11.8
+       process the sqlite cache database; *age* parameter was added.
 
     :param use_accesstime: Whether access times should be used. `None`
         for detect, `False` for don't use and `True` for always use.
     :param tests: Only process a test sample of files
+    :param age: Only process entries older than this interval
     """
     if not cache_path:
         cache_path = os.path.join(pywikibot.config.base_dir, 'apicache')
@@ -244,14 +327,35 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
         return
 
     if os.path.isdir(cache_path):
-        filenames = [os.path.join(cache_path, filename)
-                     for filename in os.listdir(cache_path)]
+        entries = _database_entries(cache_path, age)
+        filenames = [
+            os.path.join(cache_path, filename)
+            for filename in os.listdir(cache_path)
+            if FileCacheBackend.key_regex.fullmatch(filename)]
     else:
+        entries = []
         filenames = [cache_path]
 
     if tests:
+        entries = sample(entries, min(len(entries), tests))
         filenames = sample(filenames, min(len(filenames), tests))
 
+    delete_only = (func is None and output_func is None
+                   and action_func == CacheEntry._delete)
+
+    for entry in entries:
+        # Deletion is chosen only, abbreviate this request
+        if delete_only:
+            action_func(entry)
+            continue
+
+        try:
+            entry._load_cache()
+        except ValueError:
+            continue  # deleted by another process meanwhile
+
+        _process_entry(entry, func, output_func, action_func)
+
     for filepath in filenames:
         filename = os.path.basename(filepath)
         cache_dir = os.path.dirname(filepath)
@@ -261,8 +365,7 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
         entry = CacheEntry(cache_dir, filename)
 
         # Deletion is chosen only, abbreviate this request
-        if func is None and output_func is None \
-           and action_func == CacheEntry._delete:
+        if delete_only and not age:
             action_func(entry)
             continue
 
@@ -289,29 +392,14 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
             os.utime(filepath, (stinfo.st_atime, stinfo.st_mtime))
             entry.stinfo = stinfo
 
-        try:
-            entry.parse_key()
-        except ParseError as e:
-            pywikibot.error(
-                f'Problems parsing {entry.filename} with key {entry.key}')
-            pywikibot.error(e)
+        if age and not older_than(entry, age):
             continue
 
-        try:
-            entry._rebuild()
-        except Exception:
-            pywikibot.error(f'Problems loading {entry.filename} with key '
-                            f'{entry.key}, {entry._parsed_key!r}')
-            pywikibot.exception()
+        if delete_only:
+            action_func(entry)
             continue
 
-        if func is None or func(entry):
-            if output_func or action_func is None:
-                output = entry if output_func is None else output_func(entry)
-                if output is not None:
-                    pywikibot.info(output)
-            if action_func:
-                action_func(entry)
+        _process_entry(entry, func, output_func, action_func)
 
 
 def _parse_command(command, name):
@@ -426,6 +514,7 @@ def main() -> None:
     delete = False
     command = None
     output = None
+    age = None
 
     for arg in local_args:
         if command == '':
@@ -434,6 +523,8 @@ def main() -> None:
             output = arg
         elif arg == '-delete':
             delete = True
+        elif arg.startswith('-older:'):
+            age = datetime.timedelta(days=float(arg.partition(':')[2]))
         elif arg == '-password':
             command = 'has_password(entry)'
         elif arg == '-c':
@@ -486,7 +577,7 @@ def main() -> None:
         if len(cache_paths) > 1:
             pywikibot.info(f'Processing {cache_path}')
         process_entries(cache_path, filter_func, output_func=output_func,
-                        action_func=action_func)
+                        action_func=action_func, age=age)
 
 
 if __name__ == '__main__':
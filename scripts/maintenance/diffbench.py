@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Benchmark the matchers of :class:`pywikibot.diff.PatchManager`.
+
+Synthetic pages with tables, lists and infoboxes are changed in several
+ways and compared by :pylib:`difflib.SequenceMatcher
+<difflib#difflib.SequenceMatcher>` and by
+:class:`pywikibot.diff.HistogramMatcher`.
+
+Syntax:
+
+    python pwb.py diffbench [-lines:N] [-letters:N] [-seed:N]
+
+The following parameters are supported:
+
+-lines:N          Number of lines of the synthetic pages. Default is
+                  5000.
+
+-letters:N        Number of letters of the single line page which is
+                  compared letter by letter. Default is 20000.
+
+-seed:N           Seed of the random changes. Default is 0.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from difflib import SequenceMatcher
+
+import pywikibot
+from pywikibot.diff import HistogramMatcher, PatchManager
+
+
+def make_page(lines: int) -> list[str]:
+    """Return the lines of a page with many repeated lines."""
+    page = []
+    section = 0
+    while len(page) < lines:
+        section += 1
+        page.append(f'== Section {section} ==')
+        page += ['{{Infobox', f'| name = Item {section}', '| image =',
+                 '| caption =', '}}']
+        page.append('{| class="wikitable"')
+        for row in range(30):
+            page += ['|-', f'| {row} || {row % 7} || foo']
+        page.append('|}')
+        page += [f'* Item {item % 5}' for item in range(20)]
+    return page[:lines]
+
+
+def scattered(page: list[str], rng: random.Random) -> list[str]:
+    """Change, delete and insert single lines at random positions."""
+    page = list(page)
+    for _ in range(len(page) // 50):
+        i = rng.randrange(len(page))
+        op = rng.random()
+        if op < 0.4:
+            page[i] += ' changed'
+        elif op < 0.7:
+            del page[i]
+        else:
+            page.insert(i, '| new || row')
+    return page
+
+
+def alternate(page: list[str], rng: random.Random) -> list[str]:
+    """Change every other line."""
+    return [line + ' x' if i % 2 else line for i, line in enumerate(page)]
+
+
+def moved(page: list[str], rng: random.Random) -> list[str]:
+    """Move a block of a fifth of the page to the end."""
+    start = rng.randrange(len(page) // 2)
+    end = start + len(page) // 5
+    return page[:start] + page[end:] + page[start:end]
+
+
+def reformatted(page: list[str], rng: random.Random) -> list[str]:
+    """Change all table separators; only repeated lines are left."""
+    return [line.replace('foo', 'bar') if line.startswith('|') else line
+            for line in page]
+
+
+CHANGES: dict[str, Callable[[list[str], random.Random], list[str]]] = {
+    'scattered': scattered,
+    'alternate': alternate,
+    'moved': moved,
+    'reformatted': reformatted,
+}
+
+MATCHERS = {
+    'difflib': SequenceMatcher,
+    'histogram': HistogramMatcher,
+}
+
+
+def run(text_a: str, text_b: str, **kwargs) -> tuple[int, float]:
+    """Compare the texts and return the number of hunks and seconds."""
+    start = time.perf_counter()
+    patch = PatchManager(text_a, text_b, **kwargs)
+    return len(patch.hunks), time.perf_counter() - start
+
+
+def main(*args: str) -> None:
+    """Process command line arguments and run the benchmark.
+
+    If args is an empty list, sys.argv is used.
+
+    :param args: command line arguments
+    """
+    lines = 5000
+    letters = 20000
+    seed = 0
+
+    for arg in pywikibot.handle_args(args):
+        opt, _, value = arg.partition(':')
+        if opt == '-lines':
+            lines = int(value)
+        elif opt == '-letters':
+            letters = int(value)
+        elif opt == '-seed':
+            seed = int(value)
+
+    rng = random.Random(seed)
+    page = make_page(lines)
+    cases = {name: ('\n'.join(page), '\n'.join(change(page, rng)), {})
+             for name, change in CHANGES.items()}
+    line = ''.join(rng.choice('abcdefgh ') for _ in range(letters))
+    changed = ''.join('Z' if i % 211 == 0 else char
+                      for i, char in enumerate(line))
+    cases['letters'] = (line, changed, {'by_letter': True})
+
+    pywikibot.info(f'{lines} lines, {letters} letters')
+    for name, (text_a, text_b, kwargs) in cases.items():
+        for label, matcher in MATCHERS.items():
+            hunks, seconds = run(text_a, text_b, matcher=matcher, **kwargs)
+            pywikibot.info(f'{name:<12} {label:<10} {hunks:>8} hunks '
+                           f'{seconds:8.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Script to build warm-start snapshots of sites.
+
+A snapshot holds the siteinfo and the API parameter information which
+are needed to create a site. Snapshots are used if
+:attr:`config.site_snapshots` is set. See
+:class:`pywikibot.site.SiteSnapshot` for details.
+
+Usage:
+
+    python pwb.py snapshot [-family:<fam>] [<code> ...]
+
+If no code is given, snapshots are built for all codes of the family.
+
+
+Example:
+
+    :code:`python pwb.py snapshot -family:wikisource de en fr`
+
+    builds the snapshots of the German, English and French wikisource.
+
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import pywikibot
+from pywikibot.exceptions import Error
+from pywikibot.family import Family
+from pywikibot.site import SiteSnapshot
+
+
+def main(*args: str) -> None:
+    """Script entry point to handle args."""
+    codes = pywikibot.handle_args(args)
+    family = Family.load(pywikibot.config.family)
+
+    # build the snapshots from the API cache and not from old snapshots
+    pywikibot.config.site_snapshots = False
+
+    for code in codes or sorted(family.codes):
+        try:
+            snapshot = SiteSnapshot(pywikibot.Site(code, family))
+            snapshot.build()
+        except (Error, OSError) as e:
+            pywikibot.error(f'Snapshot of {family.name}:{code} failed: {e}')
+        else:
+            pywikibot.info(f'{snapshot.path} written')
+
+
+if __name__ == '__main__':
+    main()
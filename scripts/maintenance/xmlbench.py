@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Benchmark the parsers of :class:`pywikibot.xmlreader.XmlDump`.
+
+The pages of a dump file are repeated to create a larger dump in a
+temporary directory which is read by every parser with all fields and
+with the requested fields only.
+
+Syntax:
+
+    python pwb.py xmlbench [-file:DUMP] [-scale:N] [-fields:NAMES]
+        [-revisions:MODE]
+
+The following parameters are supported:
+
+-file:DUMP        Dump file whose pages are repeated. Default is
+                  ``tests/data/xml/article-pear-0.10.xml``.
+
+-scale:N          Number of copies of each page. Default is 2000.
+
+-fields:NAMES     Comma separated XmlEntry fields read by the projected
+                  runs. Default is ``title,text``.
+
+-revisions:MODE   Revisions mode of XmlDump. Default is ``all``.
+
+.. version-added:: 11.8
+"""
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import pywikibot
+from pywikibot import xmlreader
+from pywikibot.tools import open_archive
+
+
+def scale_dump(source: str, target: Path, scale: int) -> None:
+    """Write a dump with all pages of *source* repeated *scale* times.
+
+    Titles get a numeric suffix to keep them unique.
+    """
+    with open_archive(source) as f:
+        text = f.read().decode('utf-8')
+    start = text.index('<page>')
+    end = text.rindex('</page>') + len('</page>')
+    pages = text[start:end]
+    with target.open('w', encoding='utf-8') as f:
+        f.write(text[:start])
+        for i in range(scale):
+            f.write(pages.replace('</title>', f' {i}</title>'))
+            f.write('\n  ')
+        f.write(text[end:])
+
+
+def run(filename: str, **kwargs) -> tuple[int, float]:
+    """Parse the dump and return the number of entries and seconds."""
+    dump = xmlreader.XmlDump(filename, **kwargs)
+    start = time.perf_counter()
+    count = sum(1 for _ in dump.parse())
+    return count, time.perf_counter() - start
+
+
+def main(*args: str) -> None:
+    """Process command line arguments and run the benchmark.
+
+    If args is an empty list, sys.argv is used.
+
+    :param args: command line arguments
+    """
+    source = 'tests/data/xml/article-pear-0.10.xml'
+    scale = 2000
+    fields = ['title', 'text']
+    revisions = 'all'
+
+    for arg in pywikibot.handle_args(args):
+        opt, _, value = arg.partition(':')
+        if opt == '-file':
+            source = value
+        elif opt == '-scale':
+            scale = int(value)
+        elif opt == '-fields':
+            fields = value.split(',')
+        elif opt == '-revisions':
+            revisions = value
+
+    parsers = ['etree']
+    if isinstance(xmlreader.lxml_etree, ImportError):
+        pywikibot.warning('lxml is not installed; only etree is measured')
+    else:
+        parsers.append('lxml')
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / 'dump.xml'
+        scale_dump(source, filename, scale)
+        size = filename.stat().st_size / 1024 ** 2
+        pywikibot.info(f'{source} x {scale}: {size:.1f} MiB')
+
+        for parser in parsers:
+            for projection in (None, fields):
+                count, seconds = run(str(filename), revisions=revisions,
+                                     parser=parser, fields=projection)
+                label = ','.join(projection) if projection else 'all fields'
+                pywikibot.info(
+                    f'{parser:<6} {label:<20} {count:>8} entries '
+                    f'{seconds:8.2f} s {size / seconds:8.1f} MiB/s')
+
+
+if __name__ == '__main__':
+    main()
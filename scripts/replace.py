@@ -38,6 +38,11 @@ Furthermore, the following command line parameters are supported:
                   before the one specified (may also be given as
                   -xmlstart:Article).
 
+-xmlprocesses     (Only works with -xml) Scan the XML dump with several
+                  processes. The number of processes may be given as
+                  -xmlprocesses:n; all CPUs are used by default. Cannot be
+                  combined with -xmlstart.
+
 -addcat:cat_name  Adds "cat_name" category to every altered page.
 
 -excepttitle:XYZ  Skip pages with titles that contain XYZ. If the -regex
@@ -418,6 +423,15 @@ class XmlDumpReplacePageGenerator:
 
     These pages will be retrieved from a local XML dump file.
 
+    If more than one process is used, the dump is scanned with
+    :meth:`xmlreader.XmlDump.scan<pywikibot.xmlreader.XmlDump.scan>`.
+    The workers apply title and text exceptions and search the
+    replacement patterns; only these candidates are checked for
+    replacements by the current process.
+
+    .. version-added:: 11.8
+       the *processes* parameter
+
     :param xmlFilename: The dump's path, either absolute or relative
     :param xmlStart: Skip all articles in the dump before this one
     :param replacements: A list of 2-tuples of original text (as a
@@ -425,6 +439,8 @@ class XmlDumpReplacePageGenerator:
     :param exceptions: A dictionary which defines when to ignore an
         occurrence. See docu of the ReplaceRobot initializer below.
     :type exceptions: dict
+    :param processes: number of processes which scan the dump; all
+        CPUs are used if None. *xmlStart* requires a single process.
     """
 
     def __init__(self,
@@ -432,7 +448,8 @@ class XmlDumpReplacePageGenerator:
                  xmlStart: str,
                  replacements: list[tuple[Any, str]],
                  exceptions: dict[str, Any],
-                 site) -> None:
+                 site,
+                 processes: int | None = 1) -> None:
         """Initializer."""
         self.xmlFilename = xmlFilename
         self.replacements = replacements
@@ -451,7 +468,20 @@ class XmlDumpReplacePageGenerator:
         else:
             self.site = pywikibot.Site()
         dump = xmlreader.XmlDump(self.xmlFilename, on_error=pywikibot.error)
-        self.parser = dump.parse()
+        if processes != 1 and self.skipping:
+            pywikibot.warning('-xmlstart cannot be used with several '
+                              'processes; the dump is scanned by one process')
+            processes = 1
+
+        if processes == 1:
+            self.parser = dump.parse()
+        else:
+            candidates = xmlreader.EntryFilter(
+                text=[replacement.old_regex for replacement in replacements],
+                exclude_text=self.exceptions.get('text-contains', []),
+                require_title=self.exceptions.get('require-title', []),
+                exclude_title=self.exceptions.get('title', []))
+            self.parser = dump.scan(candidates, processes=processes)
 
     def __iter__(self):
         """Iterator method."""
@@ -833,6 +863,7 @@ class _ReplaceConfig:
     xml_filename: str | None
     xml_start: str | None
     sql_query: str | None
+    xml_processes: int | None = 1
 
 
 _SCRIPT_OPTION_VALUES = {
@@ -955,6 +986,7 @@ def _parse_args(
     file_replacements: list[str] | None = []
     fix_names = []
     sql_query: str | None = None
+    xml_processes: int | None = 1
     flags = 0
     script_options = {
         'regex': False,
@@ -985,6 +1017,8 @@ def _parse_args(
         elif option in xml_options:
             name, input_function, prompt = xml_options[option]
             xml_values[name] = value or input_function(prompt)
+        elif option == '-xmlprocesses':
+            xml_processes = int(value) if value else None
         elif option == '-mysqlquery':
             sql_query = value
         elif option == '-fix':
@@ -1030,6 +1064,7 @@ def _parse_args(
         xml_filename=xml_values['xml_filename'],
         xml_start=xml_values['xml_start'],
         sql_query=sql_query,
+        xml_processes=xml_processes,
     )
 
 
@@ -1234,12 +1269,14 @@ def _build_generator(
     xml_start: str | None,
     sql_query: str | None,
     preload: bool,
+    xml_processes: int | None = 1,
 ):
     """Create and combine the configured page generators."""
     generator = None
     if xml_filename:
         generator = XmlDumpReplacePageGenerator(
-            xml_filename, xml_start, replacements, exceptions, site)
+            xml_filename, xml_start, replacements, exceptions, site,
+            processes=xml_processes)
     elif sql_query is not None:
         # Only -excepttext option is considered by the query. Other
         # exceptions are taken into account by the ReplaceRobot.
@@ -1290,6 +1327,7 @@ def main(*args: str) -> None:
         xml_start=config.xml_start,
         sql_query=config.sql_query,
         preload=config.preload,
+        xml_processes=config.xml_processes,
     )
 
     bot = ReplaceRobot(
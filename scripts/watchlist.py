@@ -32,7 +32,6 @@ Command line options:
 from __future__ import annotations
 
 import datetime
-import os
 from concurrent.futures import as_completed
 
 import pywikibot
@@ -102,14 +101,21 @@ def refresh(site):
 
 
 def refresh_all() -> None:
-    """Reload watchlists for all wikis where a watchlist is already present."""
+    """Reload watchlists for all wikis where a watchlist is already present.
+
+    .. version-changed:: 11.8
+       query the API cache backend instead of scanning the cache files.
+    """
     cache_path = CachedRequest._get_cache_dir()
-    files = os.scandir(cache_path)
+    backend = CachedRequest._get_cache_backend()
     seen = set()
     with BoundedPoolExecutor('ThreadPoolExecutor') as executor:
-        for filename in files:
-            entry = CacheEntry(cache_path, filename)
-            entry._load_cache()
+        for key in list(backend.keys(contains='watchlistraw')):
+            entry = CacheEntry(cache_path, key, backend)
+            try:
+                entry._load_cache()
+            except ValueError:
+                continue
             entry.parse_key()
             entry._rebuild()
             if entry.site in seen:
@@ -57,6 +57,7 @@ extra_deps = {
         'mwoauth>=0.4.0',
     ],
     'html': ['beautifulsoup4>=4.14.3'],
+    'lxml': ['lxml>=5.3.0'],
     'http': [
         'fake-useragent >= 2.2.0',
     ],
@@ -116,6 +116,7 @@ library_test_modules = {
     'gui',
     'http',
     'i18n',
+    'import',
     'interwiki_graph',
     'interwiki_link',
     'interwikimap',
@@ -130,9 +131,11 @@ library_test_modules = {
     'oauth',
     'page',
     'pagegenerators',
+    'pageref',
     'paraminfo',
     'plural',
     'proofreadpage',
+    'revisionstore',
     'setup',
     'site',
     'site_decorators',
@@ -141,6 +144,7 @@ library_test_modules = {
     'site_login_logout',
     'site_obsoletesites',
     'siteinfo',
+    'snapshot',
     'sparql',
     'superset',
     'tests',
@@ -7,9 +7,14 @@
 """API Request cache tests."""
 from __future__ import annotations
 
+import datetime
+import pickle
 import re
 import unittest
+from tempfile import TemporaryDirectory
 
+import pywikibot
+from pywikibot.data.api import FileCacheBackend, SQLiteCacheBackend
 from pywikibot.login import LoginStatus
 from pywikibot.site import BaseSite
 from scripts.maintenance import cache
@@ -43,5 +48,126 @@ class RequestCacheTests(TestCase):
                               tests=25)
 
 
+class CacheBackendTestMixin:
+
+    """Common tests for API cache backends."""
+
+    net = False
+
+    backend_class: type
+
+    def setUp(self) -> None:
+        """Create a backend in a temporary directory."""
+        super().setUp()
+        self._tempdir = TemporaryDirectory()
+        self.backend = self.backend_class(self._tempdir.name)
+        self.now = pywikibot.Timestamp.nowutc()
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.backend.close()
+        self._tempdir.cleanup()
+        super().tearDown()
+
+    def test_set_get(self) -> None:
+        """Test storing and loading an entry."""
+        key = 'a' * 64
+        self.assertIsNone(self.backend.get(key))
+        self.backend.set(key, 'description', {'query': [1, 2]}, self.now)
+        description, data, cachetime = self.backend.get(key)
+        self.assertEqual(description, 'description')
+        self.assertEqual(data, {'query': [1, 2]})
+        self.assertAlmostEqual(cachetime.timestamp(), self.now.timestamp(),
+                               places=3)
+        self.assertIsNotNone(cachetime.tzinfo)
+
+        self.backend.set(key, 'description', {}, self.now)
+        self.assertEqual(self.backend.get(key).data, {})
+
+    def test_delete(self) -> None:
+        """Test deleting entries."""
+        key = 'b' * 64
+        self.backend.set(key, 'description', None, self.now)
+        self.backend.delete(key)
+        self.assertIsNone(self.backend.get(key))
+        self.backend.delete(key)  # no error for missing entries
+
+    def test_keys(self) -> None:
+        """Test selecting entry keys."""
+        self.backend.set('a' * 64, 'foo watchlistraw', 1, self.now)
+        self.backend.set('b' * 64, 'bar', 2, self.now)
+        self.assertCountEqual(self.backend.keys(), ['a' * 64, 'b' * 64])
+        self.assertEqual(list(self.backend.keys(contains='watchlistraw')),
+                         ['a' * 64])
+
+
+class TestSQLiteCacheBackend(CacheBackendTestMixin, TestCase):
+
+    """Test SQLiteCacheBackend."""
+
+    backend_class = SQLiteCacheBackend
+
+    def test_expiry(self) -> None:
+        """Test selecting and purging entries by cache time."""
+        old = self.now - datetime.timedelta(days=2)
+        self.backend.set('a' * 64, 'old', 1, old)
+        self.backend.set('b' * 64, 'new', 2, self.now)
+        limit = self.now - datetime.timedelta(days=1)
+        self.assertEqual(list(self.backend.keys(older_than=limit)),
+                         ['a' * 64])
+        self.assertEqual(self.backend.purge(limit), 1)
+        self.assertLength(self.backend, 1)
+        self.assertIsNone(self.backend.get('a' * 64))
+
+    def test_eviction(self) -> None:
+        """Test least recently used eviction."""
+        size = len(pickle.dumps('x' * 100))
+        self.backend.maxsize = 2 * size
+        self.backend.set('a' * 64, 'a', 'x' * 100, self.now)
+        self.backend.set('b' * 64, 'b', 'x' * 100, self.now)
+        self.assertIsNotNone(self.backend.get('a' * 64))  # touch a
+        self.backend.set('c' * 64, 'c', 'x' * 100, self.now)
+        self.assertLength(self.backend, 2)
+        self.assertIsNone(self.backend.get('b' * 64))
+        self.assertIsNotNone(self.backend.get('a' * 64))
+        self.assertIsNotNone(self.backend.get('c' * 64))
+
+    def test_total_size(self) -> None:
+        """Test the total size maintained by the triggers."""
+        def total():
+            return self.backend._connection.execute(
+                'SELECT total FROM cache_size').fetchone()[0]
+
+        self.backend.set('a' * 64, 'a', 'x' * 100, self.now)
+        self.backend.set('b' * 64, 'b', 'x' * 100, self.now)
+        self.backend.set('a' * 64, 'a', 'x', self.now)
+        self.assertEqual(total(), len(pickle.dumps('x' * 100))
+                         + len(pickle.dumps('x')))
+        self.backend.delete('b' * 64)
+        self.assertEqual(total(), len(pickle.dumps('x')))
+
+    def test_no_purge_on_open(self) -> None:
+        """Test that opening the database keeps expired entries."""
+        old = self.now - datetime.timedelta(days=1000)
+        self.backend.set('a' * 64, 'old', 1, old)
+        other = SQLiteCacheBackend(self._tempdir.name)
+        self.assertEqual(other.get('a' * 64).data, 1)
+        other.close()
+
+    def test_shared_database(self) -> None:
+        """Test that a second connection sees written entries."""
+        other = SQLiteCacheBackend(self._tempdir.name)
+        self.backend.set('a' * 64, 'a', 1, self.now)
+        self.assertEqual(other.get('a' * 64).data, 1)
+        other.close()
+
+
+class TestFileCacheBackend(CacheBackendTestMixin, TestCase):
+
+    """Test FileCacheBackend."""
+
+    backend_class = FileCacheBackend
+
+
 if __name__ == '__main__':
     unittest.main()
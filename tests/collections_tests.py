@@ -10,6 +10,7 @@ from __future__ import annotations
 import unittest
 from contextlib import suppress
 
+from pywikibot.page import Claim
 from pywikibot.page._collections import (
     AliasesDict,
     ClaimCollection,
@@ -240,10 +241,70 @@ class TestClaimCollection(DataCollectionTestCase):
 
     collection_class = ClaimCollection
 
+    family = 'wikidata'
+    code = 'wikidata'
+
+    dry = True
+
+    data = {
+        'P1': [{
+            'id': 'Q1$a',
+            'mainsnak': {'snaktype': 'value', 'property': 'P1',
+                         'datatype': 'string',
+                         'datavalue': {'value': 'foo', 'type': 'string'}},
+            'type': 'statement',
+            'rank': 'normal',
+        }],
+        'P2': [{
+            'id': 'Q1$b',
+            'mainsnak': {'snaktype': 'somevalue', 'property': 'P2',
+                         'datatype': 'string'},
+            'type': 'statement',
+            'rank': 'normal',
+        }],
+    }
+
     def test_new_empty(self) -> None:
         """Test that new_empty method returns empty collection."""
         self._test_new_empty()
 
+    def test_lazy(self) -> None:
+        """Test that claims are created on first access."""
+        repo = self.get_repo()
+        claims = ClaimCollection.fromJSON(self.data, repo)
+        self.assertEqual(list(claims), ['P1', 'P2'])
+        self.assertEqual(claims._raw, {'P1', 'P2'})
+        self.assertIn('P2', claims)
+        claims.set_on_item('item')
+
+        claim = claims['P1'][0]
+        self.assertEqual(claim.getTarget(), 'foo')
+        self.assertEqual(claim.on_item, 'item')
+        self.assertIs(claims['P1'][0], claim)
+        self.assertEqual(claims._raw, {'P2'})
+
+        del claims['P2']
+        self.assertEqual(list(claims), ['P1'])
+        self.assertIsEmpty(claims._raw)
+
+    def test_toJSON(self) -> None:
+        """Test toJSON of untouched and changed properties."""
+        repo = self.get_repo()
+        claims = ClaimCollection.fromJSON(self.data, repo)
+        self.assertEqual(claims.toJSON(diffto=self.data), {})
+        self.assertEqual(claims._raw, {'P1', 'P2'})
+
+        claims['P1'][0].setTarget('bar')
+        diff = claims.toJSON(diffto=self.data)
+        self.assertEqual(list(diff), ['P1'])
+        self.assertEqual(
+            diff['P1'][0]['mainsnak']['datavalue']['value'], 'bar')
+        self.assertEqual(claims._raw, {'P2'})
+
+        expected = [Claim.fromJSON(repo, claim).toJSON()
+                    for claim in self.data['P2']]
+        self.assertEqual(claims.toJSON()['P2'], expected)
+
 
 class TestSiteLinkCollection(DataCollectionTestCase):
 
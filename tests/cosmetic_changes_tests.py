@@ -10,7 +10,7 @@ from __future__ import annotations
 import unittest
 from contextlib import suppress
 
-from pywikibot import Page
+from pywikibot import Page, textlib
 from pywikibot.cosmetic_changes import CANCEL, CosmeticChangesToolkit
 from pywikibot.site import NamespacesDict
 from tests.aspects import TestCase, require_modules
@@ -182,6 +182,32 @@ class TestDryCosmeticChanges(TestCosmeticChanges):
         # fixArabicLetters must not change text when site is not fa or ckb
         self.assertEqual(text, self.cct.fixArabicLetters(text))
 
+    def test_shared_parse_results(self) -> None:
+        """Test that results with shared parse results are unchanged."""
+        text = ('== Foo ==\n&#62; <!-- &#62;\n== Bar ==\n-->\n'
+                '<syntaxhighlight>&#32;</syntaxhighlight>\n'
+                '==Baz==\n<!-- comment -->\n\n') * 50
+        methods = (self.cct.resolveHtmlEntities,
+                   self.cct.removeEmptySections,
+                   self.cct.cleanUpSectionHeaders)
+        expected = [method(text) for method in methods]
+        with textlib.wikitext_cache.enabled():
+            result = [method(text) for method in methods]
+            self.assertLength(textlib.wikitext_cache, 2)
+        self.assertEqual(result, expected)
+        self.assertLength(textlib.wikitext_cache, 0)
+
+    def test_timings(self) -> None:
+        """Test the timings of the methods."""
+        cct = CosmeticChangesToolkit(Page(self.site, 'Test'))
+        self.assertEqual(set(cct.timings),
+                         {method.__name__ for method in cct.common_methods})
+        self.assertEqual(cct.safe_execute(cct.fixHtml, '<b>Foo</b>'),
+                         "'''Foo'''")
+        self.assertGreater(cct.timings['fixHtml'], 0)
+        self.assertEqual(cct.timings['fixTypo'], 0)
+        self.assertStartsWith(cct.timing_report(), 'fixHtml: ')
+
 
 class TestDryFixSyntaxSave(TestCosmeticChanges):
 
@@ -47,6 +47,20 @@ class TestDataSitePreloading(WikidataTestCase):
             seen.append(item)
         self.assertLength(seen, 5)
 
+    def test_item_order_props(self) -> None:
+        """Test preloading order and projection of ItemPage objects."""
+        datasite = self.get_repo()
+        ids = ['Q5', 'Q2', 'Q1', 'Q2', 'Q4']
+        items = [pywikibot.ItemPage(datasite, ident) for ident in ids]
+        result = list(datasite.preload_entities(
+            items, 2, props=['labels'], languages=['en'], prefetch=1))
+        self.assertEqual([item.id for item in result],
+                         ['Q5', 'Q2', 'Q1', 'Q2', 'Q4'])
+        for item in result:
+            with self.subTest(item=item):
+                self.assertEqual(set(item.labels), {'en'})
+                self.assertNotIn('claims', item._content)
+
     def test_property(self) -> None:
         """Test that preloading works for properties."""
         datasite = self.get_repo()
@@ -6,11 +6,15 @@
 """Test diff module."""
 from __future__ import annotations
 
+import random
 import unittest
 from contextlib import suppress
+from difflib import SequenceMatcher
 from unittest.mock import Mock, patch
 
 from pywikibot.diff import (
+    HistogramMatcher,
+    Hunk,
     PatchManager,
     cherry_pick,
     get_close_matches_ratio,
@@ -220,6 +224,99 @@ class TestPatchManager(TestCase):
                 self.assertIsEmpty(p.hunks)
 
 
+class TestHistogramMatcher(TestCase):
+
+    """Test HistogramMatcher class."""
+
+    net = False
+
+    @staticmethod
+    def lcs_length(a, b) -> int:
+        """Return the length of the longest common subsequence."""
+        previous = [0] * (len(b) + 1)
+        for x in a:
+            current = [0]
+            for j, y in enumerate(b):
+                current.append(previous[j] + 1 if x == y
+                               else max(previous[j + 1], current[j]))
+            previous = current
+        return previous[-1]
+
+    def check_opcodes(self, a, b, matcher) -> None:
+        """Check that the opcodes of matcher turn a into b."""
+        result = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                self.assertEqual(a[i1:i2], b[j1:j2])
+            result += b[j1:j2]
+        self.assertEqual(result, b)
+
+    def test_random(self) -> None:
+        """Test opcodes of random sequences."""
+        rng = random.Random(0)
+        for chain_length in (-1, 1, 64):
+            for _ in range(100):
+                alphabet = rng.choice(['ab', 'abcd', 'abcdefghij'])
+                a = [rng.choice(alphabet) for _ in range(rng.randrange(40))]
+                b = [rng.choice(alphabet) for _ in range(rng.randrange(40))]
+                with self.subTest(a=a, b=b, chain_length=chain_length), \
+                        patch.object(HistogramMatcher, 'max_chain_length',
+                                     chain_length):
+                    matcher = HistogramMatcher(None, a, b)
+                    self.check_opcodes(a, b, matcher)
+                    if chain_length < 0:  # Myers only
+                        self.assertEqual(
+                            sum(block.size
+                                for block in matcher.get_matching_blocks()),
+                            self.lcs_length(a, b))
+
+    def test_repeated_lines(self) -> None:
+        """Test that repeated lines are not junked."""
+        a = ['|-\n', '| foo\n', '| bar\n'] * 500
+        b = list(a)
+        b[300] = '| baz\n'
+        matcher = HistogramMatcher(None, a, b)
+        self.check_opcodes(a, b, matcher)
+        self.assertEqual(matcher.get_opcodes(),
+                         [('equal', 0, 300, 0, 300),
+                          ('replace', 300, 301, 300, 301),
+                          ('equal', 301, 1500, 301, 1500)])
+        self.assertEqual(matcher.ratio(), 1499 / 1500)
+
+    def test_max_chain_length(self) -> None:
+        """Test that too frequent elements are not used as anchor."""
+        a = ['x', 'y', 'x', 'y', 'x']
+        b = ['y', 'x', 'y', 'x', 'y']
+        with patch.object(HistogramMatcher, 'max_chain_length', 2):
+            matcher = HistogramMatcher(None, a, b)
+            self.assertEqual(matcher._find_anchor(a, b, 0, 5, 0, 5),
+                             (1, 0, 4))
+        with patch.object(HistogramMatcher, 'max_chain_length', 1):
+            matcher = HistogramMatcher(None, a, b)
+            self.assertIsNone(matcher._find_anchor(a, b, 0, 5, 0, 5))
+
+    def test_patch_manager(self) -> None:
+        """Test PatchManager with different matchers."""
+        a = ''.join(f'line {i}\n' for i in range(50))
+        b = a.replace('line 7\n', 'line 7a\n').replace('line 40\n', '')
+        hunks = [hunk.diff_plain_text for hunk in PatchManager(a, b).hunks]
+        self.assertEqual(hunks, [
+            '@@ -8 +8 @@\n\n- line 7\n+ line 7a\n?       +\n',
+            '@@ -41 +40,0 @@\n\n- line 40\n'])
+        patch_manager = PatchManager(a, b, matcher=SequenceMatcher)
+        self.assertEqual(
+            [hunk.diff_plain_text for hunk in patch_manager.hunks], hunks)
+
+    def test_large_replacement(self) -> None:
+        """Test that lines of large replacements are not compared."""
+        a = 'foo\nbar\n'
+        b = 'baz\nbar!\n'
+        with patch.object(Hunk, 'max_replace_pairs', 3):
+            hunk = PatchManager(a, b).hunks[0]
+        self.assertEqual(hunk.diff, ['- foo\n', '- bar\n',
+                                     '+ baz\n', '+ bar!\n'])
+
+
 class TestCherryPick(TestCase):
 
     """Test cherry_pick method."""
@@ -7,6 +7,7 @@
 """API tests which do not interact with a site."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 import unittest
 from pathlib import Path
@@ -257,6 +258,22 @@ class DryWriteAssertTests(DefaultSiteTestCase):
         self.assertTrue(self.site.logged_in())
 
 
+class DryAsyncSubmitTests(DefaultSiteTestCase):
+
+    """Test asynchronous Request submission."""
+
+    dry = True
+
+    def test_asubmit(self) -> None:
+        """Test that asubmit returns the result of submit."""
+        req = Request(site=self.site, parameters={'action': 'query'})
+        with patch.object(Request, 'submit',
+                          return_value={'query': {}}) as submit:
+            result = asyncio.run(req.asubmit())
+        self.assertEqual(result, {'query': {}})
+        submit.assert_called_once_with()
+
+
 class DryMimeTests(TestCase):
 
     """Test MIME request handling without a real site."""
@@ -7,19 +7,145 @@
 """Tests for editing pages."""
 from __future__ import annotations
 
+import threading
 import time
 import unittest
 from contextlib import suppress
+from unittest import mock
 
 import pywikibot
 from pywikibot import page_put_queue
-from pywikibot.exceptions import Error
+from pywikibot.exceptions import EditConflictError, Error
+from pywikibot.page import EditPipeline
 from tests.aspects import TestCase
 
 
 called_back = False
 
 
+class TestAsyncRequests(TestCase):
+
+    """Test asynchronous requests executed by put workers."""
+
+    sites = {
+        'enwp': {
+            'family': 'wikipedia',
+            'code': 'en',
+        },
+        'dewp': {
+            'family': 'wikipedia',
+            'code': 'de',
+        },
+    }
+
+    dry = True
+
+    def test_workers(self) -> None:
+        """Test that sites are handled in parallel and in order."""
+        enwp, dewp = self.get_site('enwp'), self.get_site('dewp')
+        done = {enwp: [], dewp: []}
+        threads = {}
+        event = threading.Event()
+
+        def request(site, num) -> None:
+            threads[site] = threading.current_thread()
+            if site == enwp and num == 0:
+                # blocks the worker of enwp until dewp is processed
+                self.assertTrue(event.wait(10))
+            done[site].append(num)
+
+        def last(site) -> None:
+            event.set()
+
+        for num in range(3):
+            pywikibot.async_request(request, enwp, num)
+        pywikibot.async_request(request, dewp, 0)
+        pywikibot.async_request(last, site=dewp)
+        page_put_queue.join()
+
+        self.assertEqual(done, {enwp: [0, 1, 2], dewp: [0]})
+        self.assertIsNot(threads[enwp], threads[dewp])
+        self.assertStartsWith(threads[enwp].name, 'Put-Thread-')
+
+        stats = pywikibot.async_stats()
+        self.assertEqual(stats[enwp.sitename][:2], (0, 3))
+        self.assertEqual(stats[dewp.sitename][:2], (0, 2))
+        self.assertGreater(stats[enwp.sitename][2], 0)
+
+    def test_queue_size(self) -> None:
+        """Test that callers wait for unfinished requests of all sites."""
+        enwp, dewp = self.get_site('enwp'), self.get_site('dewp')
+        event = threading.Event()
+        done = []
+
+        def request(site, num) -> None:
+            if num == 0:
+                self.assertTrue(event.wait(10))
+            done.append(num)
+
+        with mock.patch.object(page_put_queue, 'maxsize', 2), \
+             mock.patch.object(pywikibot, '_put_stats', {}):
+            pywikibot.async_request(request, enwp, 0)
+            pywikibot.async_request(request, enwp, 1)
+            caller = threading.Thread(target=pywikibot.async_request,
+                                      args=(request, dewp, 2))
+            caller.start()
+            caller.join(0.5)
+            self.assertTrue(caller.is_alive())
+            self.assertEqual(done, [])
+            event.set()
+            caller.join(10)
+            self.assertFalse(caller.is_alive())
+            page_put_queue.join()
+        self.assertCountEqual(done, [0, 1, 2])
+
+
+class TestEditPipeline(TestCase):
+
+    """Test EditPipeline with a patched save method."""
+
+    family = 'wikipedia'
+    code = 'en'
+
+    dry = True
+
+    def test_pipeline(self) -> None:
+        """Test overlapping edits, order and errors."""
+        saved = []
+        results = {}
+        event = threading.Event()
+        threads = set()
+
+        def save(page, *, callback, summary=None) -> None:
+            threads.add(threading.current_thread())
+            if page.title() == 'A' and summary == 1:
+                # the first edit waits for another page to be saved
+                self.assertTrue(event.wait(10))
+            if page.title() == 'C':
+                callback(page, EditConflictError(page))
+                return
+            saved.append((page.title(), summary))
+            event.set()
+            callback(page, None)
+
+        def callback(page, err) -> None:
+            results.setdefault(page.title(), []).append(err)
+
+        pages = [pywikibot.Page(self.site, title) for title in 'ABC']
+        with mock.patch.object(pywikibot.Page, 'save', save), \
+             EditPipeline(workers=3) as pipeline:
+            for summary in (1, 2):
+                pipeline.submit(pages[0], summary=summary, callback=callback)
+            pipeline.submit(pages[1], summary=3, callback=callback)
+            future = pipeline.submit(pages[2], summary=4)
+            self.assertIsInstance(future.result(10), EditConflictError)
+
+        self.assertEqual(saved, [('B', 3), ('A', 1), ('A', 2)])
+        self.assertEqual(results, {'A': [None, None], 'B': [None]})
+        self.assertEqual((pipeline.saved, pipeline.failed), (3, 1))
+        self.assertGreater(len(threads), 1)
+
+
 class TestGeneralWrite(TestCase):
 
     """Run general write tests."""
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 import json
 import re
+import tempfile
 import unittest
 from contextlib import suppress
+from pathlib import Path
 from unittest import mock
 
 from pywikibot import Site, config
@@ -273,6 +275,56 @@ class TestEventStreamsFilter(TestCase):
                     self._test_filter(none_type, all_type, any_type, result)
 
 
+class TestEventStreamsBatches(TestCase):
+
+    """Batch and checkpoint tests for eventstreams module."""
+
+    family = 'wikipedia'
+    code = 'en'
+
+    dry = True
+
+    @staticmethod
+    def _source(events):
+        """Return a mocked EventSource class yielding *events*."""
+        messages = [mock.Mock(type='message', data=json.dumps(event),
+                              last_event_id=str(i))
+                    for i, event in enumerate(events)]
+        source = mock.MagicMock()
+        source.return_value.__next__.side_effect = messages
+        return source
+
+    def test_batches(self) -> None:
+        """Test batches bounded by size and the total."""
+        events = [{'id': i} for i in range(7)]
+        with mock.patch('pywikibot.comms.eventstreams.EventSource',
+                        new=self._source(events)):
+            es = EventStreams(url='dummy url', site=self.site)
+            es.set_maximum_items(7)
+            batches = list(es.batches(size=3, latency=10))
+        self.assertEqual(batches, [events[:3], events[3:6], events[6:]])
+
+    def test_checkpoint(self) -> None:
+        """Test that processed events are stored and resumed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = Path(tmpdir, 'rc.checkpoint')
+            events = [{'id': i} for i in range(3)]
+            with mock.patch('pywikibot.comms.eventstreams.EventSource',
+                            new=self._source(events)):
+                es = EventStreams(url='dummy url', site=self.site,
+                                  checkpoint=checkpoint)
+                gen = iter(es)
+                next(gen)
+                self.assertFalse(checkpoint.exists())
+                next(gen)
+                self.assertEqual(checkpoint.read_text(), '0')
+
+            with mock.patch('pywikibot.comms.eventstreams.EventSource'):
+                es = EventStreams(url='dummy url', site=self.site,
+                                  checkpoint=checkpoint)
+            self.assertEqual(es.sse_kwargs['latest_event_id'], '0')
+
+
 class EventStreamsTestClass(EventStreams):
 
     """Test class of EventStreams."""
@@ -8,10 +8,12 @@
 from __future__ import annotations
 
 import re
+import threading
 import unittest
 import warnings
 from contextlib import suppress
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from platform import python_implementation
 from unittest.mock import patch
 
@@ -537,6 +539,69 @@ class QueryStringParamsTestCase(HttpbinTestCase):
         self.assertEqual(r.json()['args'], {'fish%26chips': 'delicious'})
 
 
+class _OkHandler(BaseHTTPRequestHandler):
+
+    """Request handler which answers every GET request with 200 OK."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Send an empty response."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        """Suppress logging."""
+
+
+class ConnectionPoolTestCase(TestCase):
+
+    """Test connection pool configuration and statistics."""
+
+    net = False
+
+    def test_adapter_settings(self) -> None:
+        """Test that adapters use config and host settings."""
+        session = requests.Session()
+        with patch.dict(config.http_adapter_settings,
+                        {'commons.wikimedia.org': {'pool_maxsize': 25,
+                                                   'max_retries': 2}}):
+            http.mount_adapters(session)
+        default = session.get_adapter('https://en.wikipedia.org/w/api.php')
+        commons = session.get_adapter(
+            'https://commons.wikimedia.org/w/api.php')
+        self.assertIsInstance(default, http.PywikibotHTTPAdapter)
+        self.assertIsInstance(commons, http.PywikibotHTTPAdapter)
+        self.assertIsNot(default, commons)
+        self.assertEqual(default._pool_maxsize, config.http_pool_maxsize)
+        self.assertEqual(commons._pool_maxsize, 25)
+        self.assertEqual(commons.max_retries.total, 2)
+        session.close()
+
+    def test_statistics(self) -> None:
+        """Test that reused connections are counted."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _OkHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        host = '127.0.0.1'
+        http.pool_statistics.pop(host, None)
+        session = requests.Session()
+        session.trust_env = False
+        http.mount_adapters(session)
+        for _ in range(3):
+            session.get(f'http://{host}:{server.server_port}/').close()
+        session.close()
+
+        stats = http.pool_statistics[host]
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['new'], 1)
+        self.assertEqual(stats['discarded'], 0)
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()
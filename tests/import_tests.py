@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Test the imports of the pywikibot package."""
+from __future__ import annotations
+
+import os
+import re
+import statistics
+import sys
+import unittest
+from contextlib import suppress
+
+import pywikibot
+from tests.aspects import TestCase
+from tests.utils import execute
+
+
+#: Maximum cumulative import time of ``import pywikibot`` in seconds.
+#: It is the median of :data:`IMPORT_TIME_RUNS` measurements with
+#: ``python -X importtime`` and about a fifth of the budget on a current
+#: machine with compiled bytecode.
+IMPORT_TIME_BUDGET = 1.5
+
+#: Number of interpreters which measure the import time
+IMPORT_TIME_RUNS = 3
+
+#: Modules which must not be imported by ``import pywikibot``
+LAZY_MODULES = {
+    'bs4',
+    'mwoauth',
+    'mwparserfromhell',
+    'requests_oauthlib',
+    'wikitextparser',
+    *(f'pywikibot.{name}' for name in pywikibot._lazy_modules),
+}
+
+IMPORTTIME_REGEX = re.compile(
+    r'import time: +(?P<self>\d+) \| +(?P<cumulative>\d+) \| (?P<name> *\S+)')
+
+
+class TestImportTime(TestCase):
+
+    """Test lazily imported modules and the import time."""
+
+    net = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Import pywikibot in new interpreters with ``-X importtime``."""
+        super().setUpClass()
+        cls.runs = []
+        for _ in range(IMPORT_TIME_RUNS):
+            result = execute([sys.executable, '-X', 'importtime', '-c',
+                              'import pywikibot'], timeout=60)
+            cls.runs.append({
+                match['name'].strip(): int(match['cumulative']) / 1_000_000
+                for match in IMPORTTIME_REGEX.finditer(result['stderr'])
+            })
+        cls.imports = cls.runs[0]
+
+    @unittest.skipIf(os.environ.get('PYWIKIBOT_TEST_NO_TIMING', '0') == '1',
+                     'PYWIKIBOT_TEST_NO_TIMING is set')
+    @unittest.skipIf(sys.gettrace() is not None or 'coverage' in sys.modules,
+                     'import time is distorted by tracing or coverage')
+    def test_import_time(self) -> None:
+        """Test that the median import time is within the budget.
+
+        Set the ``PYWIKIBOT_TEST_NO_TIMING`` environment variable to
+        skip this test on slow or heavily loaded machines.
+        """
+        for imports in self.runs:
+            self.assertIn('pywikibot', imports)
+        seconds = statistics.median(
+            imports['pywikibot'] for imports in self.runs)
+        self.assertLess(seconds, IMPORT_TIME_BUDGET,
+                        f'median time of import pywikibot: {seconds:.2f} s')
+
+    def test_lazy_modules(self) -> None:
+        """Test that heavy and optional modules are not imported."""
+        self.assertIn('pywikibot.site', self.imports)
+        self.assertFalse(LAZY_MODULES & set(self.imports))
+
+    def test_lazy_access(self) -> None:
+        """Test access of lazily imported submodules."""
+        self.assertEqual(pywikibot.xmlreader.__name__, 'pywikibot.xmlreader')
+        self.assertIs(pywikibot.PatchManager,
+                      pywikibot.diff.PatchManager)
+        with self.assertRaisesRegex(AttributeError, 'no attribute'):
+            pywikibot.foo  # noqa: B018
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import re
 from contextlib import suppress
+from unittest.mock import patch
 
 import pywikibot
 from pywikibot import Site, config
 from pywikibot.exceptions import InvalidTitleError, SiteDefinitionError
-from pywikibot.page import Link, Page, SiteLink
+from pywikibot.page import Link, LinkCache, Page, SiteLink
 from pywikibot.site import Namespace
 from tests.aspects import (
     DefaultSiteTestCase,
@@ -22,6 +23,7 @@ from tests.aspects import (
     WikimediaDefaultSiteTestCase,
     unittest,
 )
+from tests.utils import DrySite
 
 
 class TestCreateSeparated(DefaultSiteTestCase):
@@ -56,6 +58,84 @@ class TestCreateSeparated(DefaultSiteTestCase):
                         'Foo', 'Bar', 'Baz')
 
 
+class TestLinkCache(DefaultSiteTestCase):
+
+    """Test the cache of parsed links."""
+
+    dry = True
+
+    def setUp(self) -> None:
+        """Clear the cache of the site."""
+        super().setUp()
+        self.cache = Link.cache(self.site)
+        self.cache.clear()
+
+    def test_cache(self) -> None:
+        """Test that parsed links are reused."""
+        link = Link('help:foo#bar', self.site)
+        self.assertEqual(link.title, 'Foo')
+        self.assertEqual(link.section, 'bar')
+        self.assertEqual(link.namespace, 12)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        link = Link(' help:foo#bar|label', self.site)
+        self.assertEqual(link.title, 'Foo')
+        self.assertEqual(link.section, 'bar')
+        self.assertEqual(link.namespace, 12)
+        self.assertEqual(link.anchor, 'label')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+        # other default namespace
+        link = Link('Foo', self.site, default_namespace=10)
+        self.assertEqual(link.namespace, 10)
+        self.assertLength(self.cache, 2)
+
+        # invalid titles are not cached
+        for _ in range(2):
+            with self.assertRaises(InvalidTitleError):
+                Link('Foo~~~', self.site).parse()
+        self.assertLength(self.cache, 2)
+
+    def test_maxsize(self) -> None:
+        """Test that least recently used links are dropped."""
+        self.cache.maxsize = 2
+        try:
+            for title in ('A', 'B', 'A', 'C'):
+                Link(title, self.site).parse()
+            self.assertEqual(list(self.cache._data),
+                             [('A', 0), ('C', 0)])
+        finally:
+            self.cache.maxsize = config.link_cache_size
+
+    def test_reload(self) -> None:
+        """Test that the cache is cleared if namespaces are reloaded."""
+        Link('Foo', self.site).parse()
+        self.assertLength(self.cache, 1)
+        self.cache._state = (None, None)
+        Link('Bar', self.site).parse()
+        self.assertLength(self.cache, 1)
+
+    def test_equal_sites(self) -> None:
+        """Test that equal site objects have separate caches."""
+        other = DrySite(self.site.code, self.site.family.name, None)
+        self.assertEqual(other, self.site)
+        self.assertIsNot(other, self.site)
+        self.assertIsNot(Link.cache(other), self.cache)
+        for site in (self.site, other, self.site):
+            with self.subTest(site=site):
+                self.assertIs(Link('Foo', site).site, site)
+        self.assertIs(Link.cache(self.site).site, self.site)
+
+    def test_disabled(self) -> None:
+        """Test link_cache_size config setting."""
+        self.assertIsInstance(self.cache, LinkCache)
+        with patch.object(config, 'link_cache_size', 0):
+            self.assertIsNone(Link.cache(self.site))
+            self.assertEqual(Link('Foo', self.site).title, 'Foo')
+        self.assertIsEmpty(self.cache)
+
+
 # ---- Tests checking if the parser does (not) accept (in)valid titles
 
 
@@ -26,6 +26,7 @@ from pywikibot.pagegenerators import (
     PreloadingGenerator,
     WikibaseItemFilterPageGenerator,
 )
+from pywikibot.pagegenerators._factory import _title_prefix, _title_range
 from tests import join_data_path
 from tests.aspects import (
     DefaultSiteTestCase,
@@ -656,6 +657,16 @@ class TestPreloadingGenerator(DefaultSiteTestCase):
             self.assertEqual(page, links[count])
         self.assertLength(links, count + 1)
 
+    def test_prefetch(self) -> None:
+        """Test PreloadingGenerator with prefetched groups."""
+        mainpage = self.get_mainpage()
+        links = [page for page in self.site.pagelinks(mainpage, total=20)
+                 if page.exists()]
+        pages = list(PreloadingGenerator(links, groupsize=5, prefetch=2))
+        self.assertEqual(pages, links)
+        for page in pages:
+            self.assertIsNotNone(page._revisions[page._revid].text)
+
 
 class TestDequePreloadingGenerator(DefaultSiteTestCase):
 
@@ -837,6 +848,31 @@ class DryFactoryGeneratorTest(TestCase):
         gf.handle_arg('-ns:not:User')
         self.assertEqual(gf.namespaces, {1, 3, 4, 5})
 
+    def test_title_prefix(self) -> None:
+        """Test literal prefix of title regexes."""
+        for regex, prefix in (('^Foo', 'Foo'),
+                              ('^Foo\\.bar$', 'Foo.bar'),
+                              ('^Foo?', 'Fo'),
+                              ('^Foo\\d', 'Foo'),
+                              ('^Bake', 'Ba'),
+                              ('^Äb', ''),
+                              ('^Foo|Bar', ''),
+                              ('Foo', '')):
+            with self.subTest(regex=regex):
+                self.assertEqual(_title_prefix(regex), prefix)
+
+    def test_title_range(self) -> None:
+        """Test title key range of a case-insensitive prefix."""
+        start, end = _title_range('ab c', 'first-letter')
+        self.assertEqual((start, end), ('AB_C', 'Ab_c'))
+        for key in ('AB_C', 'AB_Cd', 'Ab_C', 'Ab_c', 'Ab_cd'):
+            with self.subTest(key=key):
+                self.assertGreaterEqual(key, start)
+                self.assertTrue(key <= end or key.startswith(end))
+        for key in ('AB_B', 'AA', 'Ab_d', 'Ac'):
+            with self.subTest(key=key):
+                self.assertFalse(start <= key <= end or key.startswith(end))
+
     def test_invalid_arg(self) -> None:
         """Test invalid / non-generator arguments."""
         gf = pagegenerators.GeneratorFactory(site=self.get_site())
@@ -1063,6 +1099,23 @@ class TestFactoryGenerator(DefaultSiteTestCase):
         self.assertLessEqual(len(pages), 10)
         self.assertPagesInNamespaces(pages, 1)
 
+    def test_regexfilter_pushdown(self) -> None:
+        """Test titleregex and redirect filter pushed to allpages."""
+        gf = pagegenerators.GeneratorFactory(site=self.site)
+        self.assertTrue(gf.handle_arg('-titleregex:^Ma'))
+        self.assertTrue(gf.handle_arg('-redirect:false'))
+        apgen = self.site.allpages(total=10)
+        gen = gf.getCombinedGenerator(gen=apgen)
+        self.assertIsNotNone(gen)
+        self.assertEqual(apgen.request['gapfrom'], ['MA'])
+        self.assertEqual(apgen.request['gapfilterredir'], ['nonredirects'])
+        pages = list(gen)
+        self.assertLessEqual(len(pages), 10)
+        for page in pages:
+            self.assertIsInstance(page, pywikibot.Page)
+            self.assertRegex(page.title().lower(), '^ma')
+            self.assertFalse(page.isRedirectPage())
+
     def test_regexfilternot_default(self) -> None:
         """Test allpages generator with titleregexnot filter."""
         gf = pagegenerators.GeneratorFactory()
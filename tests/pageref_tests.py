@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Tests for the page._pageref module."""
+from __future__ import annotations
+
+import unittest
+from contextlib import suppress
+
+import pywikibot
+from pywikibot.page import PageIdSet, PageRef, TitleSet
+from pywikibot.pagegenerators._generators import _filter_unique_pages
+from tests.aspects import DefaultSiteTestCase, TestCase
+
+
+class TestPageRef(DefaultSiteTestCase):
+
+    """Test PageRef."""
+
+    dry = True
+
+    def test_from_page(self) -> None:
+        """Test conversion from and to pages."""
+        page = pywikibot.Page(self.site, 'Help:Test page#Testing')
+        page._pageid = 42
+        ref = PageRef.from_page(page)
+        self.assertEqual(ref.namespace, 12)
+        self.assertEqual(ref.title, 'Test page')
+        self.assertEqual(ref.pageid, 42)
+        self.assertFalse(hasattr(ref, '__dict__'))
+
+        new = ref.to_page()
+        self.assertIsInstance(new, pywikibot.Page)
+        self.assertEqual(new, pywikibot.Page(self.site, 'Help:Test page'))
+        self.assertEqual(new.title(), 'Help:Test page')
+        self.assertEqual(new._pageid, 42)
+
+    def test_equality(self) -> None:
+        """Test comparison and hashing."""
+        ref1 = PageRef(self.site, 0, 'Foo', 1)
+        ref2 = PageRef(self.site, self.site.namespaces.MAIN, 'Foo')
+        ref3 = PageRef(self.site, 1, 'Foo')
+        self.assertEqual(ref1, ref2)
+        self.assertNotEqual(ref1, ref3)
+        self.assertEqual(hash(ref1), hash(ref2))
+        self.assertLength({ref1, ref2, ref3}, 2)
+
+
+class TestTitleSet(DefaultSiteTestCase):
+
+    """Test TitleSet."""
+
+    dry = True
+
+    def test_titles(self) -> None:
+        """Test adding and searching pages."""
+        titles = TitleSet()
+        titles.merge_size = 3
+        names = ['Foo', 'Bar', 'Talk:Foo', 'Foo', 'Baz', 'Ä', 'Help:Bar']
+        for name in names:
+            titles.add(pywikibot.Page(self.site, name))
+        self.assertLength(titles, 6)
+        self.assertLength(titles._offsets, 5)  # four merged titles
+        titles.add(PageRef(self.site, 0, 'Qux'))
+        self.assertLength(titles._pending, 3)
+
+        for name in [*names, 'Qux', 'Foo#Section']:
+            with self.subTest(title=name):
+                self.assertIn(pywikibot.Page(self.site, name), titles)
+        for name in ['Fo', 'Help:Foo', 'Talk:Bar', 'Quux']:
+            with self.subTest(title=name):
+                self.assertNotIn(pywikibot.Page(self.site, name), titles)
+
+        refs = list(titles)
+        self.assertIsEmpty(titles._pending)
+        self.assertLength(refs, 7)
+        self.assertEqual(
+            {ref.to_page() for ref in refs},
+            {pywikibot.Page(self.site, name) for name in [*names, 'Qux']})
+
+    def test_filter_unique(self) -> None:
+        """Test de-duplication of pagegenerators."""
+        gen = (pywikibot.Page(self.site, name)
+               for name in ['A', 'B', 'A', 'Talk:A', 'B'])
+        self.assertPageTitlesEqual(_filter_unique_pages(gen),
+                                   ['A', 'B', 'Talk:A'])
+
+
+class TestPageIdSet(TestCase):
+
+    """Test PageIdSet."""
+
+    net = False
+
+    def test_ids(self) -> None:
+        """Test adding and searching page ids."""
+        ids = PageIdSet()
+        ids.merge_size = 2
+        ids.update([5, 3, 9, 3, 1, 7])
+        self.assertLength(ids, 5)
+        self.assertIn(9, ids)
+        self.assertNotIn(4, ids)
+        self.assertIn(PageRef(None, 0, '', 7), ids)
+        self.assertEqual(list(ids), [1, 3, 5, 7, 9])
+        self.assertEqual(ids & {1, 2, 3}, {1, 3})
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -329,7 +329,8 @@ class TestReplaceHelpers(TestCase):
             '-regex', '-nocase', '-dotall', '-multiline', '-sleep:1.5',
             '-always', '-quiet', '-recursive', '-allowoverlap',
             '-addcat:Test', '-summary:summary', '-nopreload',
-            '-xml:dump.xml', '-xmlstart:Start', '-mysqlquery:query',
+            '-xml:dump.xml', '-xmlstart:Start', '-xmlprocesses:4',
+            '-mysqlquery:query',
             '-fix:no-msg', '-excepttitle:Skip', '1', '2',
         ), generator_factory)
 
@@ -352,6 +353,7 @@ class TestReplaceHelpers(TestCase):
             options.flags, re.IGNORECASE | re.DOTALL | re.MULTILINE)
         self.assertEqual(options.xml_filename, 'dump.xml')
         self.assertEqual(options.xml_start, 'Start')
+        self.assertEqual(options.xml_processes, 4)
         self.assertEqual(options.sql_query, 'query')
         handle_args.assert_called_once()
 
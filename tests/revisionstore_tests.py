@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Tests for the revision store."""
+from __future__ import annotations
+
+import hashlib
+import unittest
+from contextlib import suppress
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pywikibot.data.revisionstore import RevisionStore
+from pywikibot.site import APISite
+from tests.aspects import TestCase
+
+
+class RevisionStoreTests(TestCase):
+
+    """Test RevisionStore."""
+
+    net = False
+
+    def setUp(self) -> None:
+        """Create a store in a temporary directory."""
+        super().setUp()
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = RevisionStore(Path(directory.name, 'revisions.sqlite3'),
+                                   maxsize=0)
+        self.addCleanup(self.store.close)
+
+    def test_get_set(self) -> None:
+        """Test storing and reading texts."""
+        self.store.set('wikipedia:en', {1: 'foo', 2: 'bär' * 100})
+        self.store.set('wikipedia:de', {1: 'bar'})
+        self.assertLength(self.store, 3)
+        self.assertEqual(self.store.get('wikipedia:en', [1, 2, 3]),
+                         {1: 'foo', 2: 'bär' * 100})
+        self.assertEqual(self.store.get('wikipedia:de', [1, 2]), {1: 'bar'})
+        self.assertEqual(self.store.get('wikipedia:fr', [1]), {})
+
+    def test_evict(self) -> None:
+        """Test that least recently used texts are evicted."""
+        self.store.set('wikipedia:en', {1: 'foo'})
+        self.store.set('wikipedia:en', {2: 'bar'})
+        self.store.get('wikipedia:en', [1])
+        self.store.maxsize = 2 * len(self.store._connection.execute(
+            'SELECT text FROM revisions WHERE revid = 1').fetchone()[0])
+        self.store.set('wikipedia:en', {3: 'baz'})
+        self.assertEqual(self.store.get('wikipedia:en', [1, 2, 3]),
+                         {1: 'foo', 3: 'baz'})
+
+    def test_restore_revisions(self) -> None:
+        """Test that only texts matching the SHA-1 are restored."""
+        sha1 = hashlib.sha1(b'foo').hexdigest()
+        pagedata = {'revisions': [{'revid': 1, 'sha1': sha1},
+                                  {'revid': 2, 'sha1': sha1},
+                                  {'revid': 3}]}
+        APISite._restore_revisions(pagedata, {1: 'foo', 2: 'bar', 3: 'foo'})
+        revisions = pagedata['revisions']
+        self.assertEqual(revisions[0]['slots'], {'main': {'*': 'foo'}})
+        self.assertNotIn('slots', revisions[1])
+        self.assertNotIn('slots', revisions[2])
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
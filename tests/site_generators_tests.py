@@ -7,6 +7,7 @@
 """Tests for generators of the site module."""
 from __future__ import annotations
 
+import asyncio
 import unittest
 from contextlib import suppress
 from datetime import timedelta
@@ -2136,6 +2137,28 @@ class TestPagePreloading(DefaultSiteTestCase):
         pages = list(self.site.preloadpages(dupl_links, groupsize=40))
         self.assertEqual(pages, links)
 
+    def test_async_order(self) -> None:
+        """Test apreloadpages outcome is following same order of input."""
+        async def collect(links):
+            return [page async for page in self.site.apreloadpages(
+                links, groupsize=5, concurrency=3)]
+
+        mainpage = self.get_mainpage()
+        links = [page for page in self.site.pagelinks(mainpage, total=20)
+                 if page.exists()]
+        pages = asyncio.run(collect(links))
+        self.assertEqual(pages, links)
+        self.assertTrue(all(page._revisions for page in pages))
+
+    def test_prefetch_order(self) -> None:
+        """Test prefetched outcome is following same order of input."""
+        mainpage = self.get_mainpage()
+        links = [page for page in self.site.pagelinks(mainpage, total=20)
+                 if page.exists()]
+        pages = list(self.site.preloadpages(links, groupsize=5, prefetch=2))
+        self.assertEqual(pages, links)
+        self.assertTrue(all(page._revisions for page in pages))
+
     def test_pageids(self) -> None:
         """Test basic preloading with pageids."""
         mysite = self.get_site()
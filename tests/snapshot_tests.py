@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Tests for the site._snapshot module."""
+from __future__ import annotations
+
+import unittest
+from contextlib import suppress
+from datetime import timezone
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pywikibot
+from pywikibot import config
+from pywikibot.data.api import ParamInfo
+from pywikibot.site import Siteinfo, SiteSnapshot
+from tests.aspects import DefaultSiteTestCase
+
+
+class TestSiteSnapshot(DefaultSiteTestCase):
+
+    """Test SiteSnapshot in dry mode."""
+
+    dry = True
+
+    def setUp(self) -> None:
+        """Use a temporary base directory and real Siteinfo."""
+        super().setUp()
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch.object(config, 'base_dir', tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.site = self.get_site()
+        self.site._siteinfo = Siteinfo(self.site)
+        self.site._paraminfo = ParamInfo(self.site)
+        self.cache_time = pywikibot.Timestamp(2026, 1, 2, 3, 4, 5,
+                                              tzinfo=timezone.utc)
+        self.site._siteinfo._cache.update({
+            'general': ({'generator': 'MediaWiki 1.46', 'lang': 'en'},
+                        self.cache_time),
+            'interwikimap': ([{'prefix': 'foo', 'url': 'x/$1'}],
+                             self.cache_time),
+            'rightsinfo': ({}, False),  # default value is not saved
+        })
+
+    def test_save_load(self) -> None:
+        """Test saving and loading a snapshot."""
+        snapshot = SiteSnapshot(self.site)
+        self.assertFalse(snapshot.load())
+        snapshot.save()
+        self.assertTrue(snapshot.path.exists())
+
+        self.site._siteinfo = Siteinfo(self.site)
+        self.site._siteinfo._cache['interwikimap'] = ([], False)
+        self.assertTrue(snapshot.load())
+        cache = self.site._siteinfo._cache
+        self.assertEqual(set(cache), {'general', 'interwikimap'})
+        self.assertEqual(cache['general'][0]['generator'], 'MediaWiki 1.46')
+        self.assertEqual(cache['general'][1], self.cache_time)
+        self.assertEqual(self.site._siteinfo['lang'], 'en')
+        self.assertEqual(cache['interwikimap'], ([], False))  # kept
+
+    def test_version(self) -> None:
+        """Test that snapshots of other versions are ignored."""
+        snapshot = SiteSnapshot(self.site)
+        snapshot.save()
+        self.site._siteinfo = Siteinfo(self.site)
+        with patch.object(SiteSnapshot, 'VERSION', 0):
+            self.assertFalse(snapshot.load())
+        self.assertFalse(self.site._siteinfo.is_cached('general'))
+
+    def test_revalidate(self) -> None:
+        """Test revalidation with a single siteinfo request."""
+        now = pywikibot.Timestamp.nowutc()
+        fresh = {
+            'general': ({'generator': 'MediaWiki 1.46', 'lang': 'en',
+                         'time': str(now)}, now),
+            'interwikimap': ([{'prefix': 'bar', 'url': 'y/$1'}], now),
+        }
+        snapshot = SiteSnapshot(self.site)
+        interwikimap = self.site._interwikimap
+        interwikimap._map = {}
+        paraminfo = self.site._paraminfo
+        with patch.object(Siteinfo, '_get_siteinfo',
+                          return_value=fresh) as mock:
+            changed = snapshot.revalidate()
+        mock.assert_called_once()
+        self.assertEqual(set(mock.call_args[0][0]),
+                         set(SiteSnapshot.properties) | {'interwikimap'})
+        self.assertEqual(changed, {'interwikimap'})
+        # the interwiki map is replaced; the old one stays usable
+        self.assertIsNot(self.site._interwikimap, interwikimap)
+        self.assertIsNone(self.site._interwikimap._map)
+        self.assertEqual(interwikimap._map, {})
+        self.assertIs(self.site._paraminfo, paraminfo)
+        self.assertEqual(self.site._siteinfo._cache['general'][1], now)
+        self.assertTrue(snapshot.path.exists())
+
+    def test_revalidate_version(self) -> None:
+        """Test that a new MediaWiki version replaces the paraminfo."""
+        now = pywikibot.Timestamp.nowutc()
+        fresh = {'general': ({'generator': 'MediaWiki 1.47', 'lang': 'en'},
+                             now)}
+        paraminfo = self.site._paraminfo
+        with patch.object(Siteinfo, '_get_siteinfo', return_value=fresh):
+            changed = SiteSnapshot(self.site).revalidate()
+        self.assertEqual(changed, {'general'})
+        self.assertIsNot(self.site._paraminfo, paraminfo)
+        self.assertEqual(self.site._mw_version_time[0], self.site.version())
+
+    def test_paraminfo_update(self) -> None:
+        """Test that ParamInfo.update needs the bootstrap modules."""
+        with self.assertRaisesRegex(ValueError, 'does not contain'):
+            self.site._paraminfo.update({'main': {}})
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import functools
+import random
 import re
 import unittest
 from collections import OrderedDict
@@ -669,6 +670,79 @@ class TestDisabledParts(DefaultSiteTestCase):
             'text This is a reference. text')
 
 
+class TestWikitextCache(DefaultSiteTestCase):
+
+    """Test textlib functions with a WikitextCache."""
+
+    dry = True
+
+    text = ('A <!-- B <nowiki>C</nowiki> --> D <nowiki>E<!-- F --></nowiki>'
+            ' G <pre>H</pre><!--I--><!--J--> K\n== L ==\n{{M|N=O}}\n') * 20
+
+    def setUp(self) -> None:
+        """Patch the module cache."""
+        super().setUp()
+        self.cache = textlib.WikitextCache(maxsize=2)
+        patcher = mock.patch.object(textlib, 'wikitext_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookup(self) -> None:
+        """Test bounded lookup of texts."""
+        texts = [str(i) * 1000 for i in range(3)]
+        parsed = [self.cache.lookup(text) for text in texts]
+        self.assertLength(self.cache, 2)
+        self.assertIs(self.cache.lookup(texts[2]), parsed[2])
+        self.assertIsNot(self.cache.lookup(texts[0]), parsed[0])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+        self.assertIsNone(self.cache.lookup('short text'))
+        with mock.patch.object(pywikibot.config, 'wikitext_cache_size', 0):
+            self.assertIsNone(textlib.WikitextCache().lookup(texts[0]))
+
+    def test_remove_disabled_parts(self) -> None:
+        """Test that removeDisabledParts results are shared."""
+        stripped = textlib.removeDisabledParts(self.text)
+        self.assertIs(textlib.removeDisabledParts(self.text), stripped)
+        self.assertNotIn('nowiki', stripped)
+        self.assertIn('nowiki',
+                      textlib.removeDisabledParts(self.text, tags=['pre']))
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_is_disabled(self) -> None:
+        """Test isDisabled with cached disabled parts."""
+        with mock.patch.object(self.cache, 'min_length', len(self.text) + 1):
+            expected = [textlib.isDisabled(self.text, match.start())
+                        for match in re.finditer('[A-O]', self.text)]
+        self.assertFalse(self.cache)
+        result = [textlib.isDisabled(self.text, match.start())
+                  for match in re.finditer('[A-O]', self.text)]
+        self.assertEqual(result, expected)
+        self.assertEqual(expected[:11], [False, True, True, False, True,
+                                         True, False, True, True, True,
+                                         False])
+        self.assertLength(self.cache, 1)
+
+    def test_extract_sections(self) -> None:
+        """Test extract_sections with cached disabled parts."""
+        content = extract_sections(self.text, self.site)
+        self.assertLength(content.sections, 20)
+        self.assertEqual(content.sections[0].heading, 'L')
+
+    def test_extract_templates(self) -> None:
+        """Test that the parsed text is shared."""
+        parser = textlib._wikitext_parser()
+        if isinstance(parser, Exception):
+            self.skipTest(parser)
+
+        result = textlib.extract_templates_and_params(self.text)
+        self.assertIsNotNone(self.cache.lookup(self.text).tree)
+        with mock.patch.object(parser, 'parse') as parse:
+            self.assertEqual(
+                textlib.extract_templates_and_params(self.text), result)
+        parse.assert_not_called()
+        self.assertEqual(result[0], ('M', OrderedDict(N='O')))
+
+
 class TestReplaceLinks(TestCase):
 
     """Test the replace_links function in textlib."""
@@ -1170,6 +1244,67 @@ class TestReplaceExcept(DefaultSiteTestCase):
                 site=self.site),
             'verylongreplacement\n= 1 =\n')
 
+    def test_replace_changed_exceptions(self) -> None:
+        """Test exceptions changed by a previous replacement."""
+        self.assertEqual(textlib.replaceExcept('a\n x\n x', '\n', 'y',
+                                               ['startspace'],
+                                               site=self.site),
+                         'ay xy x')
+        self.assertEqual(textlib.replaceExcept('a\n{|\n|}\nb', '\n', '<',
+                                               ['table'], site=self.site),
+                         'a<{|<|}<b')
+        self.assertEqual(textlib.replaceExcept('x <!-- x --> x x', ' x',
+                                               '\n x',
+                                               ['startspace', 'comment'],
+                                               site=self.site),
+                         'x <!-- x -->\n x\n x')
+
+    @staticmethod
+    def _replace_except(text, old, new, exceptions, allowoverlap):
+        """Replace like replaceExcept but search all exceptions each time."""
+        index = 0
+        while index <= len(text):
+            match = old.search(text, index)
+            if not match:
+                break
+            spans = [m.span() for m in (exc.search(text, index)
+                                        for exc in exceptions) if m]
+            # the first regex wins if several matches start together
+            span = min(spans, key=lambda span: span[0], default=None)
+            if span and span[0] <= match.start():
+                index = span[1]
+                continue
+            text = text[:match.start()] + new + text[match.end():]
+            index = match.start() + (1 if allowoverlap else len(new))
+            if not match.group():
+                index += 1
+        return text
+
+    def test_replace_remembered_exceptions(self) -> None:
+        """Test that remembered exception matches give the same result."""
+        self.assertEqual(textlib.replaceExcept(
+            'aZxc Z', 'Z', 'b', [re.compile(r'(?<=b.)c.*')], site=self.site),
+            'abxc Z')
+
+        exceptions = [re.compile(pattern, re.MULTILINE) for pattern in (
+            r'(?<=b.)c.*', r'(?<!a)x', r'\bx', r'b+c', r'^c', r'(?<=bb)Z',
+            r'x(?=b)', r'Z\b', r'c\B')]
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = ''.join(rng.choice('abcxZ \n') for _ in range(20))
+            old = re.compile(rng.choice(('Z', 'Zx?', 'x|Z', 'c?')))
+            new = rng.choice(('', 'b', 'bb', 'cZ'))
+            excs = rng.sample(exceptions, rng.randint(1, 3))
+            overlap = rng.random() < 0.2 and len(new) < 2
+            with self.subTest(text=text, old=old.pattern, new=new,
+                              exceptions=[exc.pattern for exc in excs],
+                              allowoverlap=overlap):
+                self.assertEqual(
+                    textlib.replaceExcept(text, old, new, excs,
+                                          allowoverlap=overlap,
+                                          site=self.site),
+                    self._replace_except(text, old, new, excs, overlap))
+
     def test_replace_tags(self) -> None:
         """Test replacing not inside various tags."""
         self.assertEqual(textlib.replaceExcept('A <!-- x --> B', 'x', 'y',
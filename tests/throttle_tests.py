@@ -8,9 +8,17 @@
 from __future__ import annotations
 
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
-from pywikibot.throttle import ProcEntry, Throttle
+from pywikibot import throttle as throttle_module
+from pywikibot.throttle import (
+    ProcEntry,
+    SQLiteRegistry,
+    TextFileRegistry,
+    Throttle,
+)
 from tests.aspects import TestCase
 
 
@@ -35,3 +43,121 @@ class ThrottleTestCase(TestCase):
             throttle._write_file(iter(processes))
 
             self.assertEqual(list(throttle._read_file()), expected)
+
+
+class RegistryTestMixin:
+
+    """Common tests for process registries."""
+
+    net = False
+
+    filename: str
+
+    def setUp(self) -> None:
+        """Create a registry in a temporary directory."""
+        super().setUp()
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.path = Path(self._tempdir.name) / self.filename
+
+    def check_in(self, pid: int, module_id: str, site: str,
+                 now: float | None = None, expiry: int = 600):
+        """Check in with the given global pid."""
+        with patch.object(throttle_module, 'pid', pid):
+            return self.registry.check_in(module_id, site,
+                                          now or time.time(), expiry)
+
+    def test_pid_assignment(self) -> None:
+        """Test that free pids are assigned."""
+        with patch.object(throttle_module, 'pid', False):
+            self.registry.check_in('a', 'site', time.time(), 600)
+            self.assertEqual(throttle_module.pid, 1)
+        with patch.object(throttle_module, 'pid', False):
+            self.registry.check_in('a', 'site', time.time(), 600)
+            self.assertEqual(throttle_module.pid, 2)
+
+    def test_count(self) -> None:
+        """Test process counts per site."""
+        self.assertEqual(self.check_in(1, 'a', 'site')[0], 1)
+        self.assertEqual(self.check_in(2, 'b', 'site')[0], 2)
+        self.assertEqual(self.check_in(3, 'a', 'other')[0], 1)
+        count, modules = self.check_in(1, 'a', 'site')  # heartbeat
+        self.assertEqual(count, 2)
+        self.assertEqual(modules, {'a': 2, 'b': 1})
+
+    def test_expiry(self) -> None:
+        """Test that expired processes are not counted."""
+        now = time.time()
+        self.check_in(1, 'a', 'site', now=now - 1000)
+        self.assertEqual(self.check_in(2, 'a', 'site', now=now)[0], 1)
+
+    def test_drop(self) -> None:
+        """Test that dropped processes are not counted."""
+        self.check_in(1, 'a', 'site')
+        self.check_in(1, 'a', 'other')
+        with patch.object(throttle_module, 'pid', 1):
+            self.registry.drop(time.time(), 600)
+        self.assertEqual(self.check_in(2, 'a', 'site')[0], 1)
+        self.assertEqual(self.check_in(2, 'a', 'other')[0], 1)
+
+    def test_bucket_burst(self) -> None:
+        """Test that a burst is allowed before the rate applies."""
+        now = 1000.0
+        waits = [self.registry.reserve('site:read', 1.0, 2.0, now)
+                 for _ in range(5)]
+        self.assertEqual(waits, [0.0, 0.0, 0.0, 1.0, 2.0])
+        # the bucket refills at the sustained rate
+        self.assertEqual(self.registry.reserve('site:read', 1.0, 2.0,
+                                               now + 10), 0.0)
+        self.assertEqual(self.registry.reserve('other:read', 1.0, 2.0,
+                                               now), 0.0)
+
+    def test_bucket_defer(self) -> None:
+        """Test that a deferred bucket blocks until the given time."""
+        now = 1000.0
+        self.registry.defer('site:write', now + 30)
+        self.assertEqual(self.registry.reserve('site:write', 6.0, 0.0, now),
+                         30.0)
+        # an earlier deferral does not shorten the block
+        self.registry.defer('site:write', now)
+        self.assertEqual(self.registry.reserve('site:write', 6.0, 0.0, now),
+                         36.0)
+
+
+class TestSQLiteRegistry(RegistryTestMixin, TestCase):
+
+    """Test SQLiteRegistry."""
+
+    filename = 'throttle.db'
+
+    def setUp(self) -> None:
+        """Create the registry."""
+        super().setUp()
+        self.registry = SQLiteRegistry(self.path)
+
+    def tearDown(self) -> None:
+        """Close the database connection."""
+        self.registry._conn.close()
+        super().tearDown()
+
+    def test_shared_bucket(self) -> None:
+        """Test that buckets are shared between registries."""
+        other = SQLiteRegistry(self.path)
+        self.addCleanup(other._conn.close)
+        now = 1000.0
+        self.assertEqual(self.registry.reserve('site:write', 6.0, 0.0, now),
+                         0.0)
+        self.assertEqual(other.reserve('site:write', 6.0, 0.0, now), 6.0)
+
+
+class TestTextFileRegistry(RegistryTestMixin, TestCase):
+
+    """Test TextFileRegistry."""
+
+    filename = 'throttle.ctrl'
+
+    def setUp(self) -> None:
+        """Create the registry."""
+        super().setUp()
+        self.path.touch()  # a missing file is an error if pid is set
+        self.registry = TextFileRegistry(self.path)
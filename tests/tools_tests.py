@@ -832,6 +832,33 @@ class BasicGeneratorIntersectTestCase(GeneratorIntersectTestCase):
         self.assertEqualItertoolsWithDuplicates(['abbcd', 'abcba'])
         self.assertEqualItertoolsWithDuplicates(['abcba', 'abbcd'])
 
+    def test_intersect_ordered(self) -> None:
+        """Test intersect of sorted iterables."""
+        for datasets in (['abc', 'bd', 'abd'], ['aabc', 'abbd', 'bb'],
+                         ['ace', 'bdf']):
+            with self.subTest(datasets=datasets):
+                set_result = set(datasets[0]).intersection(*datasets[1:])
+                result = list(intersect_generators(*datasets, ordered=True))
+                self.assertEqual(result, sorted(set_result))
+
+        result = intersect_generators('abbc', 'bbbc', ordered=True,
+                                      allow_duplicates=True)
+        self.assertEqual(list(result), ['b', 'b', 'c'])
+
+        result = intersect_generators(['Ab', 'aC'], ['ab', 'ac'],
+                                      key=str.lower, ordered=True)
+        self.assertEqual(list(result), ['Ab', 'aC'])
+
+        with self.assertRaisesRegex(ValueError, 'iterable 1 is not sorted'):
+            list(intersect_generators('abc', 'ba', ordered=True))
+
+    def test_intersect_spill(self) -> None:
+        """Test intersect with keys moved to disk."""
+        datasets = [range(0, 1000, 2), range(999, -1, -3), range(100)]
+        result = list(intersect_generators(*datasets, spill_size=10))
+        self.assertEqual(result, list(intersect_generators(*datasets)))
+        self.assertCountEqual(result, range(0, 100, 6))
+
 
 class TestMergeGenerator(TestCase):
 
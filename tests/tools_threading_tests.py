@@ -7,6 +7,8 @@
 """Tests for threading tools."""
 from __future__ import annotations
 
+import asyncio
+import threading
 import unittest
 from concurrent.futures import (
     Executor,
@@ -18,7 +20,12 @@ from contextlib import suppress
 from threading import Condition, Event, Thread
 
 from pywikibot.tools import PYTHON_VERSION
-from pywikibot.tools.threading import BoundedPoolExecutor, ThreadedGenerator
+from pywikibot.tools.threading import (
+    BoundedPoolExecutor,
+    ThreadedGenerator,
+    async_iterate,
+    prefetch_map,
+)
 from tests.aspects import TestCase
 
 
@@ -49,6 +56,83 @@ class BasicThreadedGeneratorTestCase(TestCase):
         self.assertEqual(list(thd_gen), list(iterable))
 
 
+class AsyncIterateTestCase(TestCase):
+
+    """async_iterate test cases."""
+
+    net = False
+
+    def test_order(self) -> None:
+        """Test that items are iterated in order."""
+        async def collect():
+            return [item async for item in async_iterate('abcd')]
+
+        self.assertEqual(asyncio.run(collect()), list('abcd'))
+
+    def test_concurrency(self) -> None:
+        """Test that blocking iterables proceed concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def gen():
+            barrier.wait()  # blocks unless both generators run in parallel
+            yield 1
+
+        async def collect(iterable):
+            return [item async for item in async_iterate(iterable)]
+
+        async def main():
+            return await asyncio.gather(collect(gen()), collect(gen()))
+
+        self.assertEqual(asyncio.run(main()), [[1], [1]])
+
+
+class PrefetchMapTestCase(TestCase):
+
+    """prefetch_map test cases."""
+
+    net = False
+
+    def test_order(self) -> None:
+        """Test that results are yielded in order."""
+        self.assertEqual(list(prefetch_map(lambda x: x * 2, range(10),
+                                           depth=3)),
+                         list(range(0, 20, 2)))
+
+    def test_prefetch(self) -> None:
+        """Test that the next items are computed in advance."""
+        started = []
+        ready = threading.Event()
+
+        def func(item):
+            started.append(item)
+            if len(started) == 3:
+                ready.set()
+            return item
+
+        gen = prefetch_map(func, range(10), depth=2)
+        self.assertEqual(next(gen), 0)
+        self.assertTrue(ready.wait(5))
+        self.assertEqual(started, [0, 1, 2])
+        gen.close()
+
+    def test_exception(self) -> None:
+        """Test that exceptions are raised in order."""
+        def func(item):
+            if item == 2:
+                raise ValueError(item)
+            return item
+
+        gen = prefetch_map(func, range(5))
+        self.assertEqual([next(gen), next(gen)], [0, 1])
+        with self.assertRaises(ValueError):
+            next(gen)
+
+    def test_depth(self) -> None:
+        """Test invalid depth."""
+        with self.assertRaisesRegex(ValueError, "Minimum 'depth' is 1"):
+            list(prefetch_map(str, 'a', depth=0))
+
+
 class BoundedThreadPoolTests(TestCase):
 
     """BoundedThreadPool test cases."""
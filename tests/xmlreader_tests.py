@@ -7,13 +7,18 @@
 """Tests for xmlreader module."""
 from __future__ import annotations
 
+import bz2
+import re
+import tempfile
 import unittest
 from contextlib import suppress
+from pathlib import Path
+from unittest import mock
 
 from pywikibot import xmlreader
 from pywikibot.tools import suppress_warnings
 from tests import join_xml_data_path
-from tests.aspects import TestCase
+from tests.aspects import TestCase, require_modules
 
 
 def get_entries(filename, **kwargs):
@@ -22,6 +27,24 @@ def get_entries(filename, **kwargs):
                                   **kwargs).parse())
 
 
+def create_multistream(filename, path):
+    """Create a bz2 multistream dump with a stream for each page.
+
+    :return: offsets of the page streams
+    """
+    text = Path(join_xml_data_path(filename)).read_bytes()
+    start = text.find(b'<page>')
+    end = text.rfind(b'</page>') + len(b'</page>')
+    streams = [bz2.compress(text[:start])]
+    offsets = []
+    for page in text[start:end].split(b'<page>')[1:]:
+        offsets.append(sum(map(len, streams)))
+        streams.append(bz2.compress(b'<page>' + page))
+    streams.append(bz2.compress(text[end:]))
+    Path(path).write_bytes(b''.join(streams))
+    return offsets
+
+
 class ExportDotThreeTestCase(TestCase):
 
     """XML export version 0.3 tests."""
@@ -138,6 +161,256 @@ class ExportDotTenTestCase(TestCase):
             'moved [[Çullu, Agdam]] to [[Çullu, Quzanlı]]:&#32;dab')
 
 
+class FieldProjectionTestCase(TestCase):
+
+    """Test reading selected fields only."""
+
+    net = False
+
+    def test_fields(self) -> None:
+        """Test that only requested fields are read."""
+        entries = get_entries('pair-0.10.xml', revisions='all',
+                              fields=('title', 'text'))
+        expected = get_entries('pair-0.10.xml', revisions='all')
+        self.assertLength(entries, 4)
+        for entry, full in zip(entries, expected):
+            self.assertEqual(entry.title, full.title)
+            self.assertEqual(entry.text, full.text)
+            self.assertIsNone(entry.username)
+            self.assertIsNone(entry.isredirect)
+            self.assertIsNone(entry.revisionid)
+
+    def test_latest(self) -> None:
+        """Test that revision ids are compared if not requested."""
+        with suppress_warnings(
+                r".+'allrevisions' is deprecated since release 9\.0\.0"):
+            entries = get_entries('article-pear.xml', revisions='latest',
+                                  fields=['comment'])
+        self.assertLength(entries, 1)
+        self.assertEqual(entries[0].comment, 'sp')
+        self.assertIsNone(entries[0].revisionid)
+
+    def test_invalid(self) -> None:
+        """Test invalid fields and parser."""
+        filename = join_xml_data_path('pair-0.10.xml')
+        with self.assertRaisesRegex(ValueError,
+                                    'Unknown XmlEntry fields: foo'):
+            xmlreader.XmlDump(filename, revisions='all', fields=['foo'])
+        with self.assertRaisesRegex(ValueError, "'parser' must be"):
+            xmlreader.XmlDump(filename, revisions='all', parser='foo')
+
+
+@require_modules('lxml')
+class LxmlParserTestCase(TestCase):
+
+    """Test the lxml parser against the default parser."""
+
+    net = False
+
+    files = (
+        'article-pear.xml',
+        'article-pear-0.10.xml',
+        'article-pyrus.xml',
+        'article-pyrus-utf16.xml',
+        'article-pyrus.xml.bz2',
+        'pair-0.10.xml',
+        'dummy-reflinks.xml',
+        'dummy-template.xml',
+    )
+
+    def test_compare(self) -> None:
+        """Compare entries of both parsers."""
+        for filename in self.files:
+            for revisions in ('all', 'latest'):
+                with self.subTest(filename=filename, revisions=revisions):
+                    self.assertEqual(
+                        get_entries(filename, revisions=revisions,
+                                    parser='lxml'),
+                        get_entries(filename, revisions=revisions))
+
+    def test_on_error(self) -> None:
+        """Test that on_error is called and parsing stops."""
+        errors = []
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'broken.xml'
+            path.write_text(Path(join_xml_data_path('pair-0.10.xml'))
+                            .read_text(encoding='utf-8')[:-30],
+                            encoding='utf-8')
+            dump = xmlreader.XmlDump(str(path), revisions='all',
+                                     parser='lxml', on_error=errors.append)
+            entries = list(dump.parse())
+        self.assertLength(entries, 2)
+        self.assertLength(errors, 1)
+
+
+class ScanTestCase(TestCase):
+
+    """Test scanning dumps with several processes."""
+
+    net = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create a bz2 multistream dump with a stream for each page."""
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.directory.cleanup)
+        cls.multistream = str(
+            Path(cls.directory.name) / 'test-multistream.xml.bz2')
+        create_multistream('dummy-template.xml', cls.multistream)
+
+    def scan(self, filename, **kwargs):
+        """Scan a dump with the latest revisions."""
+        dump = xmlreader.XmlDump(filename, revisions='latest')
+        return list(dump.scan(**kwargs))
+
+    def test_multistream(self) -> None:
+        """Test that streams are split into tasks."""
+        dump = xmlreader.XmlDump(self.multistream, revisions='latest')
+        tasks = list(dump._scan_tasks(200))
+        self.assertGreater(len(tasks), 3)
+        self.assertTrue(tasks[0][3].startswith(b'<mediawiki'))
+        expected = get_entries('dummy-template.xml', revisions='latest')
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertEqual(self.scan(self.multistream,
+                                           processes=processes,
+                                           chunk_size=200),
+                                 expected)
+
+    def test_bz2_streams(self) -> None:
+        """Test that all streams are found."""
+        streams = list(xmlreader.bz2_streams(self.multistream))
+        self.assertLength(streams, 5)
+        self.assertEqual(streams[0][0], 0)
+        offset, text = streams[2]
+        self.assertEqual(list(xmlreader.bz2_streams(self.multistream,
+                                                    offset, offset + 1)),
+                         [(offset, text)])
+        self.assertIsNone(xmlreader.multistream_header(
+            join_xml_data_path('article-pyrus.xml.bz2')))
+
+    def test_unaligned_streams(self) -> None:
+        """Test that streams not aligned to pages are read sequentially."""
+        text = Path(join_xml_data_path('dummy-template.xml')).read_bytes()
+        filename = str(Path(self.directory.name) / 'test-pbzip2.xml.bz2')
+        Path(filename).write_bytes(b''.join(
+            bz2.compress(text[i:i + 500]) for i in range(0, len(text), 500)))
+        self.assertIsNone(xmlreader.multistream_header(filename))
+        dump = xmlreader.XmlDump(filename, revisions='latest')
+        self.assertEqual(list(dump._scan_tasks(200)),
+                         [(filename, 0, 0, None)])
+        self.assertEqual(self.scan(filename, processes=1, chunk_size=200),
+                         get_entries('dummy-template.xml',
+                                     revisions='latest'))
+        with self.assertRaisesRegex(ValueError, 'whole page elements'):
+            xmlreader._page_elements(text[text.find(b'<page>') + 1:])
+
+    def test_window(self) -> None:
+        """Test scanning with fewer tasks in flight than tasks."""
+        dump = xmlreader.XmlDump(self.multistream, revisions='latest')
+        dump.scan_window = 1
+        expected = get_entries('dummy-template.xml', revisions='latest')
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                entries = list(dump.scan(processes=2, ordered=ordered,
+                                         chunk_size=100))
+                if ordered:
+                    self.assertEqual(entries, expected)
+                else:
+                    self.assertCountEqual(entries, expected)
+
+    def test_parts(self) -> None:
+        """Test dump parts and unordered results."""
+        parts = [join_xml_data_path('pair-0.10.xml'),
+                 join_xml_data_path('article-pyrus.xml.bz2'),
+                 self.multistream]
+        titles = self.scan(parts, processes=2, ordered=False, titles=True)
+        self.assertCountEqual(
+            titles, [entry.title for entry in self.scan(parts, processes=1)])
+        self.assertLength(titles, 6)
+
+    def test_entry_filter(self) -> None:
+        """Test EntryFilter predicate."""
+        predicate = xmlreader.EntryFilter(
+            text=[re.compile(r'\{\{')],
+            exclude_title=[re.compile('nested')])
+        self.assertEqual(
+            self.scan(self.multistream, processes=2, titles=True,
+                      predicate=predicate),
+            ['Fake page with msg',
+             'Fake page with unnecessary template prefix'])
+
+
+class MultistreamIndexTestCase(TestCase):
+
+    """Test reading pages with a multistream index."""
+
+    net = False
+
+    def setUp(self) -> None:
+        """Create a bz2 multistream dump and its index."""
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.dumpfile = str(self.directory / 'test-multistream.xml.bz2')
+        self.offsets = create_multistream('dummy-template.xml',
+                                          self.dumpfile)
+        self.entries = get_entries('dummy-template.xml', revisions='latest')
+        lines = ''.join(f'{offset}:{entry.id}:{entry.title}\n'
+                        for offset, entry in zip(self.offsets,
+                                                 self.entries))
+        self.indexfile = str(self.directory
+                             / 'test-multistream-index.txt.bz2')
+        Path(self.indexfile).write_bytes(bz2.compress(lines.encode()))
+
+    def get_index(self):
+        """Return the MultistreamIndex with a temporary database."""
+        index = xmlreader.MultistreamIndex(
+            self.indexfile, cache=self.directory / 'index.sqlite3')
+        self.addCleanup(index.close)
+        return index
+
+    def test_index(self) -> None:
+        """Test index lookups."""
+        index = self.get_index()
+        self.assertLength(index, 3)
+        self.assertEqual(index.lookup([self.entries[1].title, 'Missing']),
+                         {self.entries[1].title: self.offsets[1]})
+        self.assertEqual(index.lookup_ids([self.entries[2].id]),
+                         {int(self.entries[2].id): self.offsets[2]})
+
+    def test_pages(self) -> None:
+        """Test reading pages by title and page id."""
+        dump = xmlreader.XmlDump(self.dumpfile, revisions='latest')
+        dump._index = self.get_index()
+        entries = list(dump.pages(
+            titles=[self.entries[2].title.replace(' ', '_'), 'Missing'],
+            pageids=[self.entries[0].id]))
+        self.assertEqual(entries, [self.entries[0], self.entries[2]])
+
+    def test_invalid(self) -> None:
+        """Test dumps without multistream index."""
+        dump = xmlreader.XmlDump(join_xml_data_path('pair-0.10.xml'),
+                                 revisions='latest')
+        with self.assertRaisesRegex(ValueError, 'No multistream index'):
+            dump.index  # noqa: B018
+        dump = xmlreader.XmlDump(self.dumpfile, revisions='latest',
+                                 fields=['title', 'text'])
+        with self.assertRaisesRegex(ValueError, 'requires the'):
+            next(dump.pages(['Fake page with msg']))
+
+        # the header of a single stream dump is read up to a limit
+        filename = join_xml_data_path('article-pyrus.xml.bz2')
+        dump = xmlreader.XmlDump(filename, revisions='latest')
+        with mock.patch.object(xmlreader, 'multistream_header',
+                               wraps=xmlreader.multistream_header) as header:
+            with self.assertRaisesRegex(ValueError, 'not a bz2 multistream'):
+                next(dump.pages(['Pyrus']))
+        header.assert_called_once_with(filename, dump.header_limit)
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()